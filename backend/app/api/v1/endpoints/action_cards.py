@@ -4,10 +4,10 @@ from pydantic import BaseModel
 import logging
 from datetime import datetime
 from uuid import UUID, uuid4
-import math
 
 from ....services.llm_service import LLMService
 from ...v1.schemas.shelter import ShelterInfo
+from ....geo import haversine_km
 
 logger = logging.getLogger(__name__)
 
@@ -146,25 +146,7 @@ def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
     Returns:
         거리 (km)
     """
-    # 지구 반지름 (km)
-    R = 6371.0
-    
-    # 라디안 변환
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
-    
-    # 위도/경도 차이
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    
-    # Haversine 공식
-    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    
-    distance = R * c
-    return distance
+    return haversine_km(lat1, lon1, lat2, lon2)
 
 def _get_disaster_type(disaster_id: int) -> str:
     """재난 ID로부터 재난 유형 조회 (Mock)"""
@@ -1,11 +1,17 @@
 """
 재난 관련 API 엔드포인트
 """
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
+import asyncio
+import json
 import logging
 
+from ....core.config import settings
+from ....services.disaster_events import disaster_events
 from ....services.disaster_service import disaster_service
+from ....services.region_targeting import parse_receiving_area
 from ....api.v1.schemas.disaster import MockDisasterMessage
 
 # Phase 2: DB 연동 시 활성화 예정
@@ -56,6 +62,57 @@ async def get_active_disasters(
         )
 
 
+@router.get("/stream")
+async def stream_disasters(
+    request: Request,
+    region: Optional[str] = Query(None, description="구독 지역 (예: '경기도 안산시', 쉼표로 여러 지역)")
+):
+    """
+    새 재난 실시간 스트림 (Server-Sent Events)
+    
+    폴러가 새 재난문자를 저장하는 즉시 `event: disaster`로 전달한다.
+    `/active`를 주기적으로 호출하는 대신 연결을 열어 두고 기다리면 된다.
+    
+    - region을 주면 그 지역(상위/하위 행정구역 포함)과 전국 대상 재난만 전달
+    - 유휴 연결 유지를 위해 주기적으로 주석 라인(`: keepalive`)을 보냄
+    
+    **예시:**
+    - `/api/v1/disasters/stream` - 전체 재난
+    - `/api/v1/disasters/stream?region=경기도 안산시` - 안산시 관련 재난만
+    """
+    regions = None
+    if region:
+        regions = parse_receiving_area(region)
+        if regions is not None and not regions:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"알 수 없는 지역입니다: {region}"
+            )
+    
+    async def event_source():
+        async with disaster_events.subscribe(regions) as queue:
+            yield ": connected\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), timeout=settings.DISASTER_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                
+                data = json.dumps(event, ensure_ascii=False)
+                yield f"id: {event['msg_id']}\nevent: disaster\ndata: {data}\n\n"
+    
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/mock", response_model=List[MockDisasterMessage])
 async def get_mock_disasters(
     limit: int = Query(5, ge=1, le=50, description="반환할 재난문자 개수"),
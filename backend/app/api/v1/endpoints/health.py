@@ -4,9 +4,12 @@
 from fastapi import APIRouter, status
 from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional
+from typing import Optional, Dict, Any
 
 from ....services.disaster_service import disaster_service
+from ....services.shelter_cache import shelter_cache
+from ....db.session import shelter_pool_metrics
+from ....background.tasks import disaster_polling_task
 
 router = APIRouter()
 
@@ -19,6 +22,9 @@ class HealthResponse(BaseModel):
     mock_mode: bool
     data_source: str
     mock_data_count: Optional[int] = None
+    shelter_cache: Optional[Dict[str, Any]] = None
+    shelter_db_pools: Optional[Dict[str, Any]] = None
+    disaster_polling: Optional[Dict[str, Any]] = None
 
 
 @router.get("/", response_model=HealthResponse)
@@ -31,6 +37,10 @@ async def health_check():
     - 서버 정상 동작 여부
     - 현재 데이터 소스 (Mock CSV / Real API)
     - Mock 데이터 개수
+    - 주변 대피소 검색 캐시 hit/miss 카운터
+    - 대피소 DB primary/읽기 복제본 커넥션 풀 사용률
+    - 재난문자 폴링 현재 간격 및 서킷 브레이커 상태 (리더 인스턴스가 올린 값)와
+      이 인스턴스의 리더 여부
     """
     return HealthResponse(
         status="ok",
@@ -38,6 +48,9 @@ async def health_check():
         version="1.0.0",
         mock_mode=disaster_service.is_mock_mode,
         data_source=disaster_service.data_source,
-        mock_data_count=disaster_service.mock_data_count if disaster_service.is_mock_mode else None
+        mock_data_count=disaster_service.mock_data_count if disaster_service.is_mock_mode else None,
+        shelter_cache=shelter_cache.stats(),
+        shelter_db_pools=shelter_pool_metrics(),
+        disaster_polling=await disaster_polling_task.polling_status()
     )
 
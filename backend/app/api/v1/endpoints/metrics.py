@@ -0,0 +1,84 @@
+"""
+지표 API 엔드포인트
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from datetime import datetime
+
+from ....core.metrics import alert_latency, prometheus_gauges
+from ....external.ollama_client import ollama_client
+from ....background.tasks import disaster_polling_task
+
+router = APIRouter()
+
+
+@router.get("/alert-latency")
+async def get_alert_latency():
+    """
+    재난 알림 단계별 지연 (발령 시각 CRT_DT 기준, 초)
+
+    - poll_received → saved → targeted → shelter_lookup → action_card → push_sent
+    - 단계별 count / avg / p50 / p95 / p99 / max
+    - push_sent가 발령부터 푸시 발송까지의 종단 지연 (핵심 SLO)
+    - 이 프로세스가 처리한 재난/사용자 기준으로 집계
+    """
+    return {
+        "timestamp": datetime.utcnow(),
+        "unit": "seconds",
+        "stages": alert_latency.snapshot()
+    }
+
+
+@router.get("/ollama")
+async def get_ollama_metrics():
+    """
+    Ollama 요청 대기열 상태
+
+    - in_flight: Ollama로 보낸 뒤 응답을 기다리는 요청 수
+    - queue_depth: 동시 요청 슬롯을 기다리는 요청 수
+    - rejected / deadline_exceeded: 대기열 포화 / 마감 초과로 바로 실패한 요청 수
+    """
+    return {
+        "timestamp": datetime.utcnow(),
+        **ollama_client.stats()
+    }
+
+
+@router.get("/disaster-poller")
+async def get_disaster_poller_metrics():
+    """
+    재난문자 API 폴링 지연 (이 프로세스 기준)
+
+    - polls / requests: 폴링 횟수 / API 요청 수 (폭주 시 폴링 한 번에 여러 페이지)
+    - last / avg / max_latency_ms: 폴링 한 번 전체에 걸린 시간 (연결 재사용 효과)
+    - not_modified: 조건부 요청으로 304를 받은 횟수
+    - 폴링은 리더 인스턴스만 하므로 leader.is_leader가 false면 값이 비어 있음
+    """
+    leader = disaster_polling_task.leader
+    return {
+        "timestamp": datetime.utcnow(),
+        "leader": leader.status() if leader else None,
+        **disaster_polling_task.disaster_poller.stats()
+    }
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics():
+    """
+    Prometheus 수집용 지표 (텍스트 형식)
+
+    - `pes_alert_latency_seconds` 히스토그램 (stage 라벨)
+    - `pes_ollama_*` Ollama 대기열 깊이 / 처리 중 요청 수 등
+    - `pes_disaster_poller_*` 재난문자 API 폴링 횟수 / 지연 (ms)
+    """
+    poller_stats = {
+        key: value
+        for key, value in disaster_polling_task.disaster_poller.stats().items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+    return PlainTextResponse(
+        alert_latency.prometheus()
+        + prometheus_gauges("pes_ollama", ollama_client.stats())
+        + prometheus_gauges("pes_disaster_poller", poller_stats),
+        media_type="text/plain; version=0.0.4"
+    )
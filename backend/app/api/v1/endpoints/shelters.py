@@ -1,13 +1,17 @@
 """
 대피소 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from sqlalchemy import select, func
+import json
 import logging
 
-from ....db.session import get_shelter_db  # get_db -> get_shelter_db로 변경
+from ....db.session import get_shelter_read_db  # 검색은 읽기 복제본 사용
 from ....services.shelter_finder import ShelterFinder
+from ....services.shelter_cursor import ShelterCursor
+from ....services.shelter_snapshot import shelter_snapshots
 from ....api.v1.schemas.shelter import ShelterSearchResponse, ShelterInfo
 from ....models.shelter import Shelter
 
@@ -15,7 +19,10 @@ from ....api.v1.schemas.shelter import (
     ShelterInfo,
     ShelterSearchResponse,
     DisasterType,
-    DisasterShelterSearchResponse
+    DisasterShelterSearchResponse,
+    ShelterBatchSearchRequest,
+    ShelterBatchSearchResponse,
+    ShelterPageResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -29,7 +36,7 @@ async def get_nearby_shelters(
     lng: float = Query(..., ge=-180, le=180, description="경도"),
     radius: float = Query(10.0, ge=0.1, le=10.0, description="검색 반경 (km)"),
     limit: int = Query(5, ge=1, le=10, description="최대 결과 수"),
-    db: AsyncSession = Depends(get_shelter_db)  # 변경됨
+    db: AsyncSession = Depends(get_shelter_read_db)
 ):
     """
     현재 위치 기반 주변 대피소 검색
@@ -67,6 +74,60 @@ async def get_nearby_shelters(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="대피소 검색 실패"
         )
+
+
+@router.post("/nearby/batch", response_model=ShelterBatchSearchResponse)
+async def get_nearby_shelters_batch(
+    request: ShelterBatchSearchRequest,
+    db: AsyncSession = Depends(get_shelter_read_db)
+):
+    """
+    다수 좌표 주변 대피소 일괄 검색
+    
+    좌표마다 요청을 보내는 대신 한 번에 최대 10,000개 좌표를 처리합니다.
+    결과는 요청한 좌표 순서와 동일합니다.
+    
+    **예시:**
+    ```json
+    {
+        "points": [
+            {"latitude": 37.295692, "longitude": 126.841425},
+            {"latitude": 37.318, "longitude": 126.838}
+        ],
+        "radius_km": 2.0,
+        "limit": 3
+    }
+    ```
+    """
+    try:
+        shelter_finder = ShelterFinder(db)
+        
+        batch_results = await shelter_finder.get_nearest_shelters_batch(
+            points=[(p.latitude, p.longitude) for p in request.points],
+            radius_km=request.radius_km,
+            limit=request.limit
+        )
+        
+        logger.info(f"Batch shelter search for {len(request.points)} points")
+        
+        return ShelterBatchSearchResponse(
+            results=[
+                ShelterSearchResponse(
+                    shelters=shelters,
+                    total_count=len(shelters),
+                    search_radius_km=request.radius_km
+                )
+                for shelters in batch_results
+            ]
+        )
+        
+    except Exception as e:
+        logger.error(f"Error in batch shelter search: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="대피소 일괄 검색 실패"
+        )
+
         
 @router.get("/by-disaster/{disaster_type}", response_model=DisasterShelterSearchResponse)
 async def get_shelters_by_disaster_type(
@@ -75,7 +136,7 @@ async def get_shelters_by_disaster_type(
     lng: float = Query(..., ge=-180, le=180, description="경도"),
     radius: float = Query(10.0, ge=0.1, le=50.0, description="검색 반경 (km)"),
     limit: int = Query(5, ge=1, le=20, description="최대 결과 수"),
-    db: AsyncSession = Depends(get_shelter_db)
+    db: AsyncSession = Depends(get_shelter_read_db)
 ):
     """
     재난 유형별 대피소 검색
@@ -121,4 +182,136 @@ async def get_shelters_by_disaster_type(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"재난 유형별 대피소 검색 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/by-type/{shelter_type}", response_model=ShelterPageResponse)
+async def get_shelters_by_type(
+    shelter_type: str,
+    lat: Optional[float] = Query(None, ge=-90, le=90, description="위도 (첫 페이지 필수)"),
+    lng: Optional[float] = Query(None, ge=-180, le=180, description="경도 (첫 페이지 필수)"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_shelter_read_db)
+):
+    """
+    대피소 유형별 거리순 목록 (커서 기반 페이지네이션)
+    
+    첫 페이지는 lat/lng로 요청하고, 이후 페이지는 응답의 next_cursor를
+    cursor로 전달합니다. 커서에는 첫 요청의 기준 좌표가 포함되어 있어
+    스크롤 중 위치가 바뀌어도 목록이 중복/누락 없이 이어집니다.
+    
+    Examples:
+        - GET /api/v1/shelters/by-type/민방위대피소?lat=37.295692&lng=126.841425
+        - GET /api/v1/shelters/by-type/민방위대피소?cursor=WzM3LjI5...
+    """
+    page_cursor = None
+    if cursor:
+        try:
+            page_cursor = ShelterCursor.decode(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 커서입니다"
+            )
+        if page_cursor.shelter_type != shelter_type:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="커서의 대피소 유형이 요청과 일치하지 않습니다"
+            )
+        lat, lng = page_cursor.latitude, page_cursor.longitude
+    elif lat is None or lng is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="첫 페이지 요청에는 lat, lng가 필요합니다"
+        )
+    
+    try:
+        shelter_finder = ShelterFinder(db)
+        
+        shelters, next_cursor = await shelter_finder.get_shelters_by_type_and_location(
+            shelter_type=shelter_type,
+            latitude=lat,
+            longitude=lng,
+            limit=limit,
+            cursor=page_cursor
+        )
+        
+        logger.info(f"Found {len(shelters)} '{shelter_type}' shelters near ({lat}, {lng})")
+        
+        return ShelterPageResponse(
+            shelter_type=shelter_type,
+            shelters=shelters,
+            next_cursor=next_cursor.encode() if next_cursor else None,
+            has_more=next_cursor is not None
+        )
+        
+    except Exception as e:
+        logger.error(f"Error listing shelters by type: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="대피소 목록 조회 실패"
+        )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교, 여러 값 및 * 지원)"""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/").strip('"') == etag for value in candidates)
+
+
+@router.get("/snapshots")
+async def get_shelter_snapshot_manifest(
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
+):
+    """
+    오프라인 대피소 스냅샷 manifest
+    
+    샤드 목록과 샤드별 ETag/대피소 수/범위(bounds: min_lat, max_lat, min_lng, max_lng)를
+    반환합니다. 기기는 ETag가 바뀐 샤드만 /snapshots/{shard_id}로 다시 받으면 됩니다.
+    If-None-Match가 현재 버전과 같으면 304를 반환합니다.
+    """
+    manifest = shelter_snapshots.manifest()
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="대피소 스냅샷이 아직 생성되지 않았습니다"
+        )
+    
+    headers = {"ETag": f'"{manifest["version"]}"', "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, manifest["version"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(
+        content=json.dumps(manifest, ensure_ascii=False),
+        media_type="application/json",
+        headers=headers
+    )
+
+
+@router.get("/snapshots/{shard_id}")
+async def get_shelter_snapshot_shard(
+    shard_id: str,
+    if_none_match: Optional[str] = Header(None, alias="If-None-Match")
+):
+    """
+    오프라인 대피소 스냅샷 샤드 (zlib 압축 컬럼형 바이너리)
+    
+    형식은 app/services/shelter_snapshot.py 참고.
+    If-None-Match가 샤드 ETag와 같으면 본문 없이 304를 반환합니다.
+    """
+    shard = shelter_snapshots.read_shard(shard_id)
+    if shard is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="스냅샷 샤드를 찾을 수 없습니다"
+        )
+    
+    payload, etag = shard
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=payload, media_type="application/octet-stream", headers=headers)
@@ -8,14 +8,15 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel
 import logging
-from math import radians, sin, cos, sqrt, atan2
 
-from ....db.session import get_db, get_shelter_db
+from ....db.session import execute_shelter_read, get_db, get_shelter_read_db
 from ....models.user import User
 from ....models.shelter import Shelter
 from ....models.training import TrainingSession, UserPoints
 from ....core.constants import TRAINING_COMPLETION_POINTS, COMPLETION_DISTANCE_METERS
+from ....geo import haversine_km
 from ....services.shelter_finder import ShelterFinder
+from ....services.shelter_query import build_nearby_shelters_query, bounding_box_params
 
 logger = logging.getLogger(__name__)
 
@@ -88,17 +89,7 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         거리 (미터)
     """
-    R = 6371000  # 지구 반지름 (미터)
-    
-    phi1 = radians(lat1)
-    phi2 = radians(lat2)
-    delta_phi = radians(lat2 - lat1)
-    delta_lambda = radians(lon2 - lon1)
-    
-    a = sin(delta_phi/2)**2 + cos(phi1) * cos(phi2) * sin(delta_lambda/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
-    
-    return R * c
+    return haversine_km(lat1, lon1, lat2, lon2) * 1000
 
 
 @router.get("/nearby-shelters", response_model=NearbySheltersResponse)
@@ -106,7 +97,7 @@ async def get_nearby_shelters(
     latitude: float = Query(..., description="현재 위도"),
     longitude: float = Query(..., description="현재 경도"),
     limit: int = Query(5, ge=1, le=10, description="반환할 대피소 수"),
-    shelter_db: AsyncSession = Depends(get_shelter_db)
+    shelter_db: AsyncSession = Depends(get_shelter_read_db)
 ):
     """
     현재 위치 기반 가까운 대피소 조회
@@ -114,48 +105,16 @@ async def get_nearby_shelters(
     ID를 포함한 대피소 정보를 반환합니다.
     """
     try:
-        # ID를 포함한 쿼리
-        query = text("""
-            SELECT 
-                id,
-                name,
-                address,
-                shelter_type,
-                latitude,
-                longitude,
-                distance_km
-            FROM (
-                SELECT 
-                    id,
-                    name,
-                    address,
-                    shelter_type,
-                    latitude,
-                    longitude,
-                    (
-                        6371 * acos(
-                            LEAST(1.0, 
-                                cos(radians(:user_lat)) * cos(radians(latitude)) *
-                                cos(radians(longitude) - radians(:user_lng)) +
-                                sin(radians(:user_lat)) * sin(radians(latitude))
-                            )
-                        )
-                    ) AS distance_km
-                FROM shelters
-                WHERE latitude IS NOT NULL
-                  AND longitude IS NOT NULL
-            ) AS shelter_distances
-            WHERE distance_km <= :radius_km
-            ORDER BY distance_km ASC
-            LIMIT :limit
-        """)
-        
-        result = await shelter_db.execute(
+        # ID를 포함한 쿼리 (bounding box 선필터 후 거리 계산)
+        query = build_nearby_shelters_query(
+            ("id", "name", "address", "shelter_type", "latitude", "longitude")
+        )
+        
+        result = await execute_shelter_read(
+            shelter_db,
             query,
             {
-                "user_lat": latitude,
-                "user_lng": longitude,
-                "radius_km": 10.0,
+                **bounding_box_params(latitude, longitude, 10.0),
                 "limit": limit
             }
         )
@@ -189,7 +148,7 @@ async def get_nearby_shelters(
 async def start_training(
     request: StartTrainingRequest,
     db: AsyncSession = Depends(get_db),
-    shelter_db: AsyncSession = Depends(get_shelter_db)
+    shelter_db: AsyncSession = Depends(get_shelter_read_db)
 ):
     """
     훈련 시작
@@ -211,7 +170,7 @@ async def start_training(
         
         # 2. 대피소 확인 (shelter DB 사용)
         shelter_query = select(Shelter).where(Shelter.id == request.shelter_id)
-        shelter_result = await shelter_db.execute(shelter_query)
+        shelter_result = await execute_shelter_read(shelter_db, shelter_query)
         shelter = shelter_result.scalar_one_or_none()
         
         if not shelter:
@@ -275,7 +234,7 @@ async def start_training(
 async def check_completion(
     request: CheckCompletionRequest,
     db: AsyncSession = Depends(get_db),
-    shelter_db: AsyncSession = Depends(get_shelter_db)
+    shelter_db: AsyncSession = Depends(get_shelter_read_db)
 ):
     """
     훈련 완료 확인
@@ -299,7 +258,7 @@ async def check_completion(
         
         # 2. 대피소 위치 조회 (shelter DB 사용)
         shelter_query = select(Shelter).where(Shelter.id == session.shelter_id)
-        shelter_result = await shelter_db.execute(shelter_query)
+        shelter_result = await execute_shelter_read(shelter_db, shelter_query)
         shelter = shelter_result.scalar_one_or_none()
         
         if not shelter:
@@ -463,7 +422,7 @@ async def abandon_training(
 async def dev_auto_complete_training(
     session_id: int,
     db: AsyncSession = Depends(get_db),
-    shelter_db: AsyncSession = Depends(get_shelter_db)
+    shelter_db: AsyncSession = Depends(get_shelter_read_db)
 ):
     """
     [개발자용] 훈련 자동 완료 트리거
@@ -487,7 +446,7 @@ async def dev_auto_complete_training(
         
         # 2. 대피소 위치 조회
         shelter_query = select(Shelter).where(Shelter.id == session.shelter_id)
-        shelter_result = await shelter_db.execute(shelter_query)
+        shelter_result = await execute_shelter_read(shelter_db, shelter_query)
         shelter = shelter_result.scalar_one_or_none()
         
         if not shelter:
@@ -17,6 +17,7 @@ from ....api.v1.schemas.user import (
     UserProfile
 )
 from ....core.security import create_access_token
+from ....services.region_targeting import lookup_admin_region
 
 logger = logging.getLogger(__name__)
 
@@ -97,25 +98,42 @@ async def update_location(
     """
     try:
         # TODO: 토큰에서 user_id 추출
-        # 현재는 간단히 구현
+        # 현재는 요청의 device_id로 사용자 식별
+        updated_at = datetime.utcnow()
         
-        # 위치 업데이트 로직
-        # PostGIS POINT 생성
-        location_wkt = f'SRID=4326;POINT({request.longitude} {request.latitude})'
-        
-        # 실제로는 토큰에서 가져온 user_id 사용
-        # 여기서는 예시로 첫 번째 활성 사용자 업데이트
+        if request.device_id:
+            # 행정구역 조회 (실패하면 None → region_path 없이 위치 기준으로 알림 대상)
+            admin_region = await lookup_admin_region(request.latitude, request.longitude)
+            
+            query = select(User).where(User.device_id == request.device_id)
+            result = await db.execute(query)
+            user = result.scalar_one_or_none()
+            
+            if not user:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="사용자를 찾을 수 없습니다"
+                )
+            
+            # PostGIS POINT 생성
+            user.location = f'SRID=4326;POINT({request.longitude} {request.latitude})'
+            user.last_location_update = updated_at
+            user.admin_region = admin_region  # region_path도 함께 정규화
+            await db.commit()
         
         logger.info(f"Location updated: {request.latitude}, {request.longitude}")
         
         return LocationUpdateResponse(
             status="success",
             message="위치 업데이트 완료",
-            updated_at=datetime.utcnow()
+            updated_at=updated_at
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error updating location: {str(e)}")
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="위치 업데이트 실패"
@@ -3,6 +3,7 @@
 """
 from pydantic import BaseModel, Field
 from typing import Optional
+from uuid import UUID
 from enum import Enum
 
 class DisasterType(str, Enum):
@@ -14,6 +15,7 @@ class DisasterType(str, Enum):
 
 class ShelterInfo(BaseModel):
     """대피소 정보 (간소화)"""
+    id: Optional[UUID] = Field(None, description="대피소 ID")
     name: str
     address: str
     shelter_type: str
@@ -21,6 +23,7 @@ class ShelterInfo(BaseModel):
     walking_minutes: Optional[int] = Field(None, description="도보 소요 시간 (분)")
     latitude: float
     longitude: float
+    capacity: Optional[int] = Field(None, description="수용 인원")
     
     class Config:
         from_attributes = True
@@ -39,10 +42,36 @@ class ShelterSearchResponse(BaseModel):
     shelters: list[ShelterInfo]
     total_count: int
     search_radius_km: float
+
+
+class Coordinate(BaseModel):
+    """좌표"""
+    latitude: float = Field(..., ge=-90, le=90)
+    longitude: float = Field(..., ge=-180, le=180)
+
+
+class ShelterBatchSearchRequest(BaseModel):
+    """다수 좌표 대피소 일괄 검색 요청"""
+    points: list[Coordinate] = Field(..., min_length=1, max_length=10000, description="검색할 좌표 목록")
+    radius_km: float = Field(2.0, ge=0.1, le=10.0, description="검색 반경 (km)")
+    limit: int = Field(3, ge=1, le=10, description="좌표당 최대 결과 수")
+
+
+class ShelterBatchSearchResponse(BaseModel):
+    """다수 좌표 대피소 일괄 검색 응답 (요청 순서와 동일)"""
+    results: list[ShelterSearchResponse]
     
 class DisasterShelterSearchResponse(BaseModel):
     """재난 유형별 대피소 검색 응답"""
     disaster_type: str
     shelters: list[ShelterInfo]
     total_count: int
-    search_radius_km: float
\ No newline at end of file
+    search_radius_km: float
+
+
+class ShelterPageResponse(BaseModel):
+    """유형별 대피소 거리순 목록 페이지 응답"""
+    shelter_type: str
+    shelters: list[ShelterInfo]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool
@@ -24,6 +24,7 @@ class UserRegisterResponse(BaseModel):
 
 class LocationUpdateRequest(BaseModel):
     """위치 업데이트 요청"""
+    device_id: Optional[str] = Field(None, description="기기 고유 식별자 (토큰 인증 전까지 사용자 식별용)")
     latitude: float = Field(..., ge=-90, le=90, description="위도")
     longitude: float = Field(..., ge=-180, le=180, description="경도")
 
@@ -0,0 +1,112 @@
+"""
+재난 알림 단계별 팬아웃 파이프라인
+
+대상 사용자 → [대피소 조회] → [행동카드 생성] → [푸시 발송]
+
+각 단계는 독립된 워커 풀로 동작하고 단계 사이는 크기가 제한된 큐로 연결된다.
+뒤 단계가 밀리면 큐가 차서 앞 단계가 기다리므로(backpressure) 메모리가 늘지 않고,
+마지막 알림까지 걸리는 시간은 사용자별 지연의 합이 아니라 가장 느린 단계의
+처리량으로 정해진다.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 워커 종료 신호
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """
+    파이프라인 단계
+
+    handler는 입력 1개를 받아 다음 단계로 넘길 항목 목록을 반환한다
+    (None 또는 빈 목록이면 넘기지 않음). 마지막 단계의 반환값은 결과로 모인다.
+    """
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[Iterable[Any]]]]
+    workers: int
+    queue_size: int = 1000
+
+
+async def run_pipeline(
+    items: Iterable[Any],
+    stages: Sequence[Stage]
+) -> Tuple[List[Any], Dict[str, Dict[str, Any]]]:
+    """
+    항목들을 단계별 워커 풀에 흘려 처리
+
+    한 항목의 처리 실패는 로그만 남기고 나머지 항목은 계속 처리한다.
+
+    Args:
+        items: 첫 단계 입력
+        stages: 순서대로 연결할 단계 목록
+
+    Returns:
+        (마지막 단계 출력 목록, 단계별 통계 {processed, failed, busy_seconds})
+    """
+    queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in stages]
+    stats = {
+        stage.name: {"processed": 0, "failed": 0, "busy_seconds": 0.0}
+        for stage in stages
+    }
+    results: List[Any] = []
+
+    async def worker(index: int):
+        stage = stages[index]
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(stages) else None
+        stage_stats = stats[stage.name]
+
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+
+            started = time.perf_counter()
+            try:
+                outputs = await stage.handler(item)
+                stage_stats["processed"] += 1
+            except Exception as e:
+                logger.error(f"Fanout stage '{stage.name}' error: {str(e)}")
+                stage_stats["failed"] += 1
+                outputs = None
+            stage_stats["busy_seconds"] += time.perf_counter() - started
+
+            if not outputs:
+                continue
+            if outbox is None:
+                results.extend(outputs)
+            else:
+                for output in outputs:
+                    await outbox.put(output)
+
+    workers = [
+        [asyncio.create_task(worker(index)) for _ in range(max(1, stage.workers))]
+        for index, stage in enumerate(stages)
+    ]
+
+    try:
+        for item in items:
+            await queues[0].put(item)
+
+        # 앞 단계가 모두 끝난 뒤 다음 단계에 종료 신호를 보내 처리 순서대로 마무리
+        for index, stage_workers in enumerate(workers):
+            for _ in stage_workers:
+                await queues[index].put(_DONE)
+            await asyncio.gather(*stage_workers)
+    except BaseException:
+        for stage_workers in workers:
+            for task in stage_workers:
+                task.cancel()
+        raise
+
+    for stage_stats in stats.values():
+        stage_stats["busy_seconds"] = round(stage_stats["busy_seconds"], 3)
+
+    return results, stats
@@ -0,0 +1,129 @@
+"""
+Redis 임대(lease) 기반 리더 선출
+
+uvicorn 워커나 서버 복제본이 여러 개여도 재난문자 폴링(및 푸시 발송)은 한 인스턴스만
+하도록, Redis 키 하나를 TTL이 있는 임대로 잡는다.
+
+- 리더: renew_interval마다 임대를 연장한다. 연장에 실패하면(다른 인스턴스가 가져감)
+  즉시 리더에서 내려온다.
+- 대기: 같은 주기로 SET NX를 시도한다. 리더가 죽으면 임대가 만료되는 즉시 넘겨받는다
+  (최대 lease_seconds + renew_interval).
+- 정상 종료 시 임대를 바로 반납해 대기 인스턴스가 다음 시도에서 넘겨받는다.
+- Redis 오류 중에도 대기 인스턴스는 넘겨받지 않는다. 리더는 마지막으로 연장에
+  성공한 뒤 임대 시간이 지나면 스스로 내려온다 (그 사이 임대가 만료되어 Redis에
+  닿는 다른 인스턴스가 리더가 될 수 있으므로).
+"""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+# 내가 가진 임대일 때만 연장/반납 (다른 인스턴스의 임대를 건드리지 않도록)
+_RENEW_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+_RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class LeaderLease:
+    """Redis 키 임대로 여러 인스턴스 중 리더 하나를 선출"""
+
+    def __init__(
+        self,
+        redis_client: Optional[aioredis.Redis],
+        key: str,
+        lease_seconds: float,
+        renew_interval: Optional[float] = None
+    ):
+        self.redis_client = redis_client
+        self.key = key
+        self.lease_seconds = lease_seconds
+        self.lease_ms = int(lease_seconds * 1000)
+        self.renew_interval = renew_interval or lease_seconds / 3
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        # 마지막으로 임대를 얻거나 연장한 요청을 보낸 시각 (monotonic)
+        self._last_renewed: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """선출 루프 시작 (Redis가 없으면 단일 인스턴스로 보고 바로 리더)"""
+        if self.redis_client is None:
+            logger.warning("Redis unavailable - running as the only leader")
+            self.is_leader = True
+            return
+
+        await self._step()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """선출 루프 중단 및 임대 반납"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.is_leader and self.redis_client is not None:
+            try:
+                await self.redis_client.eval(_RELEASE_LUA, 1, self.key, self.instance_id)
+            except Exception as e:
+                logger.error(f"Leader lease release error: {str(e)}")
+        self.is_leader = False
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.renew_interval)
+            await self._step()
+
+    async def _step(self):
+        """리더면 임대 연장, 아니면 획득 시도"""
+        # TTL은 요청이 Redis에 닿은 시점부터 세므로 요청 전에 시각을 잡아 둠
+        requested_at = time.monotonic()
+        try:
+            if self.is_leader:
+                renewed = await self.redis_client.eval(
+                    _RENEW_LUA, 1, self.key, self.instance_id, self.lease_ms
+                )
+                if renewed:
+                    self._last_renewed = requested_at
+                else:
+                    self.is_leader = False
+                    logger.warning(f"Lost leadership for {self.key} ({self.instance_id})")
+            else:
+                acquired = await self.redis_client.set(
+                    self.key, self.instance_id, nx=True, px=self.lease_ms
+                )
+                if acquired:
+                    self.is_leader = True
+                    self._last_renewed = requested_at
+                    logger.info(f"👑 Acquired leadership for {self.key} ({self.instance_id})")
+        except Exception as e:
+            logger.error(f"Leader lease error: {str(e)}")
+            if self.is_leader and time.monotonic() - self._last_renewed >= self.lease_seconds:
+                # 임대가 이미 만료되었을 수 있음 → 다른 인스턴스가 넘겨받았을 수 있으니 내려옴
+                self.is_leader = False
+                logger.warning(f"Stepping down: lease for {self.key} not renewed within {self.lease_seconds}s")
+
+    def status(self) -> dict:
+        """현재 역할"""
+        return {"instance_id": self.instance_id, "is_leader": self.is_leader}
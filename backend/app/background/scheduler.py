@@ -0,0 +1,130 @@
+"""
+재난문자 폴링 주기 조절 (적응형 간격 + 서킷 브레이커)
+
+- 새 재난문자가 계속 들어오면 간격을 절반씩 줄인다 (최소 DISASTER_POLL_MIN_INTERVAL_SECONDS)
+- 조용해지면 기본 간격(DISASTER_POLL_INTERVAL_SECONDS)으로 되돌린다
+- 타임아웃 / 5xx가 나면 지수 백오프 + 지터로 간격을 늘린다 (최대 DISASTER_POLL_MAX_INTERVAL_SECONDS)
+- 연속 실패가 DISASTER_BREAKER_FAILURE_THRESHOLD번이면 브레이커를 열어
+  DISASTER_BREAKER_RESET_SECONDS 동안 호출을 멈추고, 이후 한 번 시험 호출(half-open)한다
+"""
+import random
+import time
+from typing import Any, Dict, Optional
+
+from ..core.config import settings
+
+
+class CircuitBreaker:
+    """연속 실패 횟수 기반 서킷 브레이커"""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self._state = self.CLOSED
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_seconds:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def allow_request(self) -> bool:
+        return self.state != self.OPEN
+
+    def seconds_until_retry(self) -> float:
+        """열린 상태에서 시험 호출까지 남은 시간"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - time.monotonic())
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self._state = self.CLOSED
+        self._opened_at = None
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        # 시험 호출이 실패했거나 연속 실패가 임계치에 닿으면 다시 염
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_in_seconds": round(self.seconds_until_retry(), 1)
+        }
+
+
+class AdaptivePollSchedule:
+    """폴링 결과에 따라 다음 폴링까지의 간격 결정"""
+
+    def __init__(
+        self,
+        base_seconds: float,
+        min_seconds: float,
+        max_seconds: float,
+        breaker: CircuitBreaker
+    ):
+        self.base_seconds = base_seconds
+        self.min_seconds = min(min_seconds, base_seconds)
+        self.max_seconds = max(max_seconds, base_seconds)
+        self.breaker = breaker
+        self.interval_seconds = base_seconds
+        self.last_new_messages = 0
+
+    def record_success(self, new_messages: int):
+        """정상 응답 (새 재난문자 수)"""
+        self.breaker.record_success()
+        self.last_new_messages = new_messages
+        if new_messages > 0:
+            self.interval_seconds = max(self.min_seconds, self.interval_seconds / 2)
+        elif self.interval_seconds < self.base_seconds:
+            self.interval_seconds = min(self.base_seconds, self.interval_seconds * 2)
+        else:
+            self.interval_seconds = self.base_seconds
+
+    def record_failure(self):
+        """타임아웃 / 5xx 등 상류 장애"""
+        self.breaker.record_failure()
+        self.last_new_messages = 0
+        self.interval_seconds = min(
+            self.max_seconds,
+            self.base_seconds * (2 ** self.breaker.consecutive_failures)
+        )
+
+    def next_delay(self) -> float:
+        """다음 폴링까지 대기 시간 (초)"""
+        if not self.breaker.allow_request():
+            return self.breaker.seconds_until_retry() + random.uniform(0, self.base_seconds)
+        if self.breaker.consecutive_failures:
+            # 여러 인스턴스/재시작이 같은 순간에 몰리지 않도록 equal jitter
+            half = self.interval_seconds / 2
+            return half + random.uniform(0, half)
+        return self.interval_seconds
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "interval_seconds": round(self.interval_seconds, 1),
+            "last_new_messages": self.last_new_messages,
+            "circuit_breaker": self.breaker.status()
+        }
+
+
+# 싱글톤 인스턴스
+disaster_poll_schedule = AdaptivePollSchedule(
+    base_seconds=settings.DISASTER_POLL_INTERVAL_SECONDS,
+    min_seconds=settings.DISASTER_POLL_MIN_INTERVAL_SECONDS,
+    max_seconds=settings.DISASTER_POLL_MAX_INTERVAL_SECONDS,
+    breaker=CircuitBreaker(
+        failure_threshold=settings.DISASTER_BREAKER_FAILURE_THRESHOLD,
+        reset_seconds=settings.DISASTER_BREAKER_RESET_SECONDS
+    )
+)
@@ -0,0 +1,252 @@
+"""
+Redis Streams 작업 큐 (컨슈머 그룹)
+
+재난 처리 단계(폴링 → 대상자 조회 → 알림 발송) 사이를 Redis Stream으로 잇는다.
+
+- 생산자는 XADD로 작업을 넣고, 컨슈머는 그룹으로 XREADGROUP 해서 나눠 가진다.
+  같은 그룹의 컨슈머는 여러 프로세스/서버에 있어도 작업을 한 번씩만 받는다.
+- 처리를 마친 작업만 XACK 한다. 처리 중 죽은 컨슈머의 작업은 PEL(pending 목록)에 남고,
+  claim_idle_seconds 동안 ack되지 않으면 다른 컨슈머가 XAUTOCLAIM으로 넘겨받는다.
+- 컨슈머 이름은 재시작해도 같게 유지하고, 시작할 때 자기 이름으로 남은 작업부터
+  (XREADGROUP ... 0) 다시 처리한다.
+- max_deliveries번 넘게 실패한 작업은 "{stream}:dead" 스트림으로 옮기고 ack 한다.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import ResponseError, WatchError
+
+logger = logging.getLogger(__name__)
+
+Entry = Tuple[str, Dict[str, str]]
+
+
+class StreamQueue:
+    """컨슈머 그룹 하나로 읽는 Redis Stream"""
+
+    def __init__(self, redis_client: aioredis.Redis, stream: str, group: str, max_len: int):
+        self.redis_client = redis_client
+        self.stream = stream
+        self.group = group
+        self.max_len = max_len
+
+    async def ensure_group(self):
+        """컨슈머 그룹 생성 (이미 있으면 그대로 사용해 마지막으로 전달한 위치부터 이어 읽음)"""
+        try:
+            await self.redis_client.xgroup_create(self.stream, self.group, id="$", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def add(self, entries: List[Dict[str, str]]) -> List[str]:
+        """작업 추가 (한 번의 왕복)"""
+        if not entries:
+            return []
+        async with self.redis_client.pipeline(transaction=False) as pipe:
+            for fields in entries:
+                pipe.xadd(self.stream, fields, maxlen=self.max_len, approximate=True)
+            return await pipe.execute()
+
+    async def add_once(self, key: str, entries: List[Dict[str, str]], ttl_seconds: int) -> Optional[List[str]]:
+        """
+        key로 한 번만 작업 추가 (표시 키 설정과 XADD를 한 트랜잭션으로)
+
+        Returns:
+            추가한 작업 id 목록. 이미 같은 key로 추가했으면 None
+        """
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(key)
+                if await pipe.exists(key):
+                    return None
+                pipe.multi()
+                pipe.set(key, 1, ex=ttl_seconds)
+                for fields in entries:
+                    pipe.xadd(self.stream, fields, maxlen=self.max_len, approximate=True)
+                return (await pipe.execute())[1:]
+            except WatchError:
+                # 다른 컨슈머가 그 사이 같은 작업을 추가함
+                return None
+
+    async def read_new(self, consumer: str, count: int, block_ms: int) -> List[Entry]:
+        """아직 아무에게도 전달되지 않은 작업 읽기"""
+        response = await self.redis_client.xreadgroup(
+            self.group, consumer, {self.stream: ">"}, count=count, block=block_ms
+        )
+        return [entry for _, entries in response or [] for entry in entries]
+
+    async def read_pending(self, consumer: str, after_id: str, count: int) -> List[Entry]:
+        """
+        이 컨슈머에게 전달됐지만 ack되지 않은 작업 읽기 (after_id 이후, 재시작 후 이어서 처리)
+
+        이미 삭제된(MAXLEN으로 잘린) 작업은 fields가 비어 있다.
+        """
+        response = await self.redis_client.xreadgroup(
+            self.group, consumer, {self.stream: after_id}, count=count
+        )
+        return [(entry_id, fields or {}) for _, entries in response or [] for entry_id, fields in entries]
+
+    async def claim_stale(self, consumer: str, min_idle_ms: int, count: int) -> List[Entry]:
+        """ack되지 않은 채 오래 방치된 작업 넘겨받기"""
+        response = await self.redis_client.xautoclaim(
+            self.stream, self.group, consumer, min_idle_time=min_idle_ms, start_id="0-0", count=count
+        )
+        # 이미 삭제된(MAXLEN으로 잘린) 작업은 fields가 None
+        return [(entry_id, fields) for entry_id, fields in response[1] if fields]
+
+    async def delivery_count(self, entry_id: str) -> int:
+        """작업이 전달된 횟수"""
+        pending = await self.redis_client.xpending_range(
+            self.stream, self.group, min=entry_id, max=entry_id, count=1
+        )
+        return pending[0]["times_delivered"] if pending else 0
+
+    async def ack(self, entry_ids: List[str]):
+        if entry_ids:
+            await self.redis_client.xack(self.stream, self.group, *entry_ids)
+
+    async def dead_letter(self, entry: Entry):
+        """처리할 수 없는 작업을 별도 스트림으로 옮기고 ack"""
+        entry_id, fields = entry
+        await self.redis_client.xadd(
+            f"{self.stream}:dead", {**fields, "source_id": entry_id}, maxlen=self.max_len, approximate=True
+        )
+        await self.ack([entry_id])
+
+    async def status(self) -> Dict:
+        """스트림 길이 및 ack 대기 작업 수"""
+        length = await self.redis_client.xlen(self.stream)
+        pending = await self.redis_client.xpending(self.stream, self.group)
+        return {"length": length, "pending": pending["pending"]}
+
+
+@dataclass
+class StreamConsumerOptions:
+    """컨슈머 동작 설정"""
+    batch_size: int = 10
+    block_ms: int = 5000
+    claim_idle_seconds: float = 300.0
+    max_deliveries: int = 5
+
+
+class StreamConsumer:
+    """스트림 작업을 읽어 handler로 처리하고, 성공한 작업만 ack 하는 루프"""
+
+    def __init__(
+        self,
+        queue: StreamQueue,
+        name: str,
+        handler: Callable[[Dict[str, str]], Awaitable[None]],
+        options: Optional[StreamConsumerOptions] = None
+    ):
+        self.queue = queue
+        self.name = name
+        self.handler = handler
+        self.options = options or StreamConsumerOptions()
+        self.processed = 0
+        self.failed = 0
+        self.reclaimed = 0
+        self.recovered = 0
+        # 시작할 때 자기 pending 작업을 어디까지 다시 읽었는지 (None이면 복구 끝)
+        self._pending_cursor: Optional[str] = "0"
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """루프 중단 (처리 중이던 작업은 ack되지 않아 나중에 다시 처리됨)"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.step()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Stream consumer {self.name} ({self.queue.stream}) error: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def step(self):
+        """
+        작업 한 묶음 처리
+
+        시작 직후에는 이전 실행이 남긴 자기 pending 작업을 먼저 처리하고,
+        그 뒤로는 다른 컨슈머가 놓친 작업을 넘겨받거나 없으면 새 작업을 기다린다.
+        """
+        if self._pending_cursor is not None:
+            recovered = await self._recover_pending()
+            # 남은 pending 작업이 있었으면 이번 차례는 그것만 처리
+            if self._pending_cursor is not None:
+                await self._handle(recovered)
+                return
+
+        entries = await self.queue.claim_stale(
+            self.name,
+            min_idle_ms=int(self.options.claim_idle_seconds * 1000),
+            count=self.options.batch_size
+        )
+        if entries:
+            self.reclaimed += len(entries)
+            entries = [entry for entry in entries if not await self._exhausted(entry)]
+        else:
+            entries = await self.queue.read_new(
+                self.name, count=self.options.batch_size, block_ms=self.options.block_ms
+            )
+        await self._handle(entries)
+
+    async def _recover_pending(self) -> List[Entry]:
+        """자기 pending 작업 다음 묶음 (더 없으면 복구 종료)"""
+        entries = await self.queue.read_pending(self.name, self._pending_cursor, self.options.batch_size)
+        if not entries:
+            self._pending_cursor = None
+            return []
+
+        self._pending_cursor = entries[-1][0]
+        self.recovered += len(entries)
+        # 이미 스트림에서 잘린 작업은 처리할 수 없으므로 ack만
+        await self.queue.ack([entry_id for entry_id, fields in entries if not fields])
+        return [entry for entry in entries if entry[1] and not await self._exhausted(entry)]
+
+    async def _handle(self, entries: List[Entry]):
+        for entry_id, fields in entries:
+            try:
+                await self.handler(fields)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # ack하지 않고 남겨 두면 claim_idle_seconds 뒤 다시 처리됨
+                self.failed += 1
+                logger.error(f"Stream entry {entry_id} ({self.queue.stream}) failed: {str(e)}", exc_info=True)
+                continue
+            await self.queue.ack([entry_id])
+            self.processed += 1
+
+    async def _exhausted(self, entry: Entry) -> bool:
+        """재시도 한도를 넘긴 작업이면 dead letter로 보냄"""
+        deliveries = await self.queue.delivery_count(entry[0])
+        if deliveries <= self.options.max_deliveries:
+            return False
+        logger.error(f"Stream entry {entry[0]} ({self.queue.stream}) failed {deliveries - 1} times, dead-lettered")
+        await self.queue.dead_letter(entry)
+        return True
+
+    def status(self) -> Dict:
+        return {
+            "consumer": self.name,
+            "processed": self.processed,
+            "failed": self.failed,
+            "reclaimed": self.reclaimed,
+            "recovered": self.recovered
+        }
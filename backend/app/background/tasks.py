@@ -1,23 +1,74 @@
 """
 백그라운드 작업 (재난문자 폴링)
 """
+import json
 import logging
+import socket
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from sqlalchemy import select
+from apscheduler.triggers.date import DateTrigger
 from datetime import datetime, timedelta
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
 
-from ..services.disaster_poller import DisasterPoller
+from .fanout import Stage, run_pipeline
+from .leader import LeaderLease
+from .scheduler import disaster_poll_schedule
+from .streams import StreamConsumer, StreamConsumerOptions, StreamQueue
+from ..services.disaster_poller import DisasterPoller, POLL_ERROR_SERVER, POLL_ERROR_TIMEOUT
 from ..services.shelter_finder import ShelterFinder
 from ..services.llm_service import LLMService
+from ..services.action_card_cohorts import ActionCardCohorts
+from ..services.disaster_events import disaster_event, disaster_events
+from ..services.region_parser import NATIONWIDE_NAME
+from ..services.region_targeting import find_target_users, parse_receiving_area
 from ..external.fcm_client import fcm_client
-from ..models.user import User
 from ..models.disaster import Disaster
-from ..db.session import AsyncSessionLocal
+from ..models.user import User
+from ..db.session import AsyncSessionLocal, shelter_read_session
 from ..core.config import settings
+from ..core.metrics import alert_latency, kst_now
 
 logger = logging.getLogger(__name__)
 
+# 폴링 → 대상자 조회 → 알림 발송 단계 사이 Redis Stream
+DISASTER_STREAM = "disaster:stream:disasters"
+NOTIFICATION_STREAM = "disaster:stream:notifications"
+# 재난별로 알림을 받은 사용자 (작업이 다시 처리돼도 중복 발송하지 않도록)
+NOTIFIED_KEY = "disaster:notified:{disaster_id}"
+NOTIFIED_TTL_SECONDS = 86400
+# 재난별 알림 작업을 이미 스트림에 넣었다는 표시 (대상자 조회 작업이 다시 처리돼도 한 번만)
+QUEUED_KEY = "disaster:queued:{disaster_id}"
+# 호스트별 스트림 컨슈머 이름 슬롯 (재시작한 프로세스가 같은 이름으로 자기 pending 작업을 이어 처리)
+CONSUMER_SLOT_KEY = "disaster:stream:consumer-slot:{host}:{slot}"
+# 리더가 폴링 주기마다 올리는 폴링 간격/브레이커 상태 (어느 인스턴스의 헬스체크에서든 조회)
+POLL_STATUS_KEY = "disaster_poller:status"
+
+# 여러 알림 묶음이 행동카드 코호트를 공유할 최근 재난 수
+_COHORT_CACHE_SIZE = 32
+
+
+def _is_connection_error(error: Exception) -> bool:
+    """DB에 닿지 못한 오류인지 (행 데이터 문제가 아니라 다시 시도해야 하는 경우)"""
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+    return isinstance(error, (OperationalError, InterfaceError, OSError))
+
+
+def _column_length(column, item: bool = False) -> int:
+    """String 컬럼 길이 (ARRAY(String)이면 item=True로 원소 길이)"""
+    column_type = column.property.columns[0].type
+    return (column_type.item_type if item else column_type).length
+
+
+def _fit(column, value) -> str:
+    """컬럼 길이를 넘는 문자열은 잘라서 저장"""
+    return str(value)[:_column_length(column)]
+
 
 class DisasterPollingTask:
     """재난문자 폴링 백그라운드 작업"""
@@ -26,6 +77,12 @@ class DisasterPollingTask:
         self.scheduler = AsyncIOScheduler()
         self.disaster_poller = DisasterPoller()
         self.llm_service = LLMService()
+        self.leader: Optional[LeaderLease] = None
+        self.consumer_slot: Optional[LeaderLease] = None
+        self.disaster_queue: Optional[StreamQueue] = None
+        self.notification_queue: Optional[StreamQueue] = None
+        self.consumers: List[StreamConsumer] = []
+        self._cohorts: "OrderedDict[str, ActionCardCohorts]" = OrderedDict()
         self.is_running = False
     
     async def start(self):
@@ -37,19 +94,105 @@ class DisasterPollingTask:
         # Redis 초기화
         await self.disaster_poller.initialize_redis()
         
-        # 스케줄러 설정 (10초 간격)
+        # 리더 선출 (여러 인스턴스 중 리더만 폴링)
+        self.leader = LeaderLease(
+            self.disaster_poller.redis_client if settings.DISASTER_LEADER_ELECTION_ENABLED else None,
+            key="disaster_poller:leader",
+            lease_seconds=settings.DISASTER_LEADER_LEASE_SECONDS
+        )
+        await self.leader.start()
+        
+        # 대상자 조회/알림 발송 컨슈머 (리더가 아니어도 모든 인스턴스가 나눠 처리)
+        await self._start_stream_consumers()
+        
+        # 스케줄러 설정 (폴링 결과에 따라 간격을 조절하며 매번 다음 실행을 예약)
+        self._schedule_next_poll(disaster_poll_schedule.next_delay())
+        
+        self.scheduler.start()
+        self.is_running = True
+        logger.info(f"Disaster polling started (interval: {settings.DISASTER_POLL_INTERVAL_SECONDS}s, adaptive)")
+    
+    def _schedule_next_poll(self, delay_seconds: float):
+        """delay_seconds 후 한 번 폴링하도록 예약"""
+        # 1회성 작업이라 실행 시각을 놓쳐 건너뛰면 다음 예약도 사라짐 → 늦더라도 항상 실행
         self.scheduler.add_job(
             self._poll_and_process,
-            trigger=IntervalTrigger(seconds=settings.DISASTER_POLL_INTERVAL_SECONDS),
+            trigger=DateTrigger(run_date=datetime.now() + timedelta(seconds=delay_seconds)),
             id="disaster_polling",
             name="재난문자 폴링",
             replace_existing=True,
-            max_instances=1
+            max_instances=1,
+            misfire_grace_time=None,
+            coalesce=True
         )
+    
+    async def _start_stream_consumers(self):
+        """Redis Streams 컨슈머 시작 (Redis가 없으면 폴링 작업 안에서 바로 처리)"""
+        redis_client = self.disaster_poller.redis_client
+        if not settings.NOTIFICATION_STREAMS_ENABLED or redis_client is None:
+            logger.warning("Notification streams disabled - processing disasters inline")
+            return
         
-        self.scheduler.start()
-        self.is_running = True
-        logger.info(f"Disaster polling started (interval: {settings.DISASTER_POLL_INTERVAL_SECONDS}s)")
+        try:
+            disaster_queue = StreamQueue(
+                redis_client, DISASTER_STREAM, "targeting", settings.NOTIFICATION_STREAM_MAX_LEN
+            )
+            notification_queue = StreamQueue(
+                redis_client, NOTIFICATION_STREAM, "notifier", settings.NOTIFICATION_STREAM_MAX_LEN
+            )
+            await disaster_queue.ensure_group()
+            await notification_queue.ensure_group()
+        except Exception as e:
+            logger.error(f"Failed to initialize notification streams: {str(e)}")
+            return
+        
+        self.disaster_queue = disaster_queue
+        self.notification_queue = notification_queue
+        
+        targeting_options = StreamConsumerOptions(
+            claim_idle_seconds=settings.NOTIFICATION_STREAM_CLAIM_IDLE_SECONDS,
+            max_deliveries=settings.NOTIFICATION_STREAM_MAX_DELIVERIES
+        )
+        # 실패한 알림 묶음은 오래 기다리지 않고 다시 발송 (이미 받은 사용자는 건너뜀)
+        notifier_options = StreamConsumerOptions(
+            claim_idle_seconds=settings.NOTIFICATION_STREAM_NOTIFIER_CLAIM_IDLE_SECONDS,
+            max_deliveries=settings.NOTIFICATION_STREAM_MAX_DELIVERIES
+        )
+        consumer_id = await self._acquire_consumer_name(redis_client)
+        self.consumers = [
+            StreamConsumer(disaster_queue, f"{consumer_id}:targeting", self._handle_disaster_entry, targeting_options)
+        ] + [
+            StreamConsumer(
+                notification_queue, f"{consumer_id}:notifier-{n}", self._handle_notification_entry, notifier_options
+            )
+            for n in range(settings.NOTIFICATION_STREAM_CONSUMERS)
+        ]
+        for consumer in self.consumers:
+            await consumer.start()
+        logger.info(f"Notification stream consumers started ({len(self.consumers)}, {consumer_id})")
+    
+    async def _acquire_consumer_name(self, redis_client) -> str:
+        """
+        재시작해도 같은 스트림 컨슈머 이름 (호스트 이름 + 슬롯 번호)
+        
+        같은 호스트의 워커끼리 이름이 겹치지 않도록 빈 슬롯을 Redis 임대로 잡는다.
+        정상 종료 시 반납하므로 다시 뜬 워커가 그 슬롯과 pending 작업을 이어받는다.
+        """
+        host = socket.gethostname()
+        for slot in range(settings.NOTIFICATION_STREAM_WORKER_SLOTS):
+            lease = LeaderLease(
+                redis_client,
+                key=CONSUMER_SLOT_KEY.format(host=host, slot=slot),
+                lease_seconds=settings.NOTIFICATION_STREAM_SLOT_LEASE_SECONDS
+            )
+            await lease.start()
+            if lease.is_leader:
+                self.consumer_slot = lease
+                return f"{host}:{slot}"
+            await lease.stop()
+        
+        logger.warning("No free stream consumer slot, using a per-process consumer name")
+        return self.leader.instance_id
     
     async def stop(self):
         """폴링 작업 중지"""
@@ -57,156 +200,501 @@ class DisasterPollingTask:
             return
         
         self.scheduler.shutdown()
+        # 처리 중이던 스트림 작업은 ack되지 않아 다른 인스턴스나 재시작 후 이어서 처리됨
+        for consumer in self.consumers:
+            await consumer.stop()
+        self.consumers = []
+        if self.consumer_slot is not None:
+            await self.consumer_slot.stop()
+            self.consumer_slot = None
+        await self.leader.stop()
         await self.disaster_poller.close()
         self.is_running = False
         logger.info("Disaster polling stopped")
     
     async def _poll_and_process(self):
-        """재난문자 폴링 및 처리"""
+        """재난문자 폴링 및 처리 (끝나면 다음 폴링 예약)"""
+        try:
+            await self._poll_once()
+        finally:
+            if self.is_running:
+                self._schedule_next_poll(disaster_poll_schedule.next_delay())
+            await self._publish_poll_status()
+    
+    async def _publish_poll_status(self):
+        """리더의 폴링 상태를 Redis에 기록 (간격/브레이커는 리더 프로세스만 갱신하므로)"""
+        redis_client = self.disaster_poller.redis_client
+        if redis_client is None or self.leader is None or not self.leader.is_leader:
+            return
+        
+        status = {
+            "leader": self.leader.instance_id,
+            "published_at": datetime.utcnow().isoformat(),
+            **disaster_poll_schedule.status()
+        }
+        try:
+            # 리더가 사라지면 상태도 만료 (최대 폴링 간격의 두 배)
+            await redis_client.set(
+                POLL_STATUS_KEY,
+                json.dumps(status),
+                ex=int(settings.DISASTER_POLL_MAX_INTERVAL_SECONDS * 2)
+            )
+        except Exception as e:
+            logger.error(f"Failed to publish polling status: {str(e)}")
+    
+    async def polling_status(self) -> Dict[str, Any]:
+        """
+        헬스체크용 폴링 상태
+
+        - instance: 이 프로세스의 리더 여부
+        - leader: 리더가 마지막으로 올린 폴링 간격/브레이커 상태 (없으면 None)
+        """
+        if self.leader is None:
+            return {"instance": None, "leader": None}
+        
+        instance = self.leader.status()
+        if self.leader.is_leader:
+            return {"instance": instance, "leader": {"leader": self.leader.instance_id, **disaster_poll_schedule.status()}}
+        
+        redis_client = self.disaster_poller.redis_client
+        if redis_client is None:
+            return {"instance": instance, "leader": None}
+        try:
+            published = await redis_client.get(POLL_STATUS_KEY)
+        except Exception as e:
+            logger.error(f"Failed to read polling status: {str(e)}")
+            return {"instance": instance, "leader": None}
+        return {"instance": instance, "leader": json.loads(published) if published else None}
+    
+    async def _poll_once(self):
+        if not self.leader.is_leader:
+            logger.debug("Standing by (not the polling leader)")
+            return
+        
+        if not disaster_poll_schedule.breaker.allow_request():
+            logger.warning(
+                f"Disaster API circuit open, skipping poll "
+                f"(retry in {disaster_poll_schedule.breaker.seconds_until_retry():.0f}s)"
+            )
+            return
+        
         try:
             logger.info("Polling disasters...")
             
             # 재난문자 폴링
             new_disasters = await self.disaster_poller.poll_disasters()
+            received_at = kst_now()
+            logger.debug(f"Disaster poller stats: {self.disaster_poller.stats()}")
+            
+            # 폴링 결과로 다음 간격 조절 (타임아웃/5xx만 백오프 대상)
+            if self.disaster_poller.last_poll_error in (POLL_ERROR_TIMEOUT, POLL_ERROR_SERVER):
+                disaster_poll_schedule.record_failure()
+                logger.warning(f"Disaster polling backoff: {disaster_poll_schedule.status()}")
+                return
+            disaster_poll_schedule.record_success(len(new_disasters))
             
             if not new_disasters:
                 logger.debug("No new disasters found")
                 return
             
-            logger.info(f"Processing {len(new_disasters)} new disasters")
+            # 폴링 묶음 전체를 한 번에 저장 (이미 저장된 msg_id는 건너뜀)
+            async with AsyncSessionLocal() as db:
+                disasters = await self._save_disasters(db, new_disasters)
+            # 저장이 끝난 뒤에야 워터마크를 올림 (저장 실패 시 예외 → 다음 폴링이 같은 구간을 다시 읽음)
+            await self.disaster_poller.commit()
+            
+            for disaster in disasters:
+                alert_latency.observe("poll_received", disaster.issued_at, at=received_at)
+                alert_latency.observe("saved", disaster.issued_at)
+            
+            # 연결된 앱(SSE)에는 팬아웃을 기다리지 않고 바로 전달
+            for disaster in disasters:
+                await disaster_events.publish(disaster_event(disaster))
+            
+            logger.info(f"Processing {len(disasters)} new disasters")
             
-            # 각 재난에 대해 처리
-            for disaster_data in new_disasters:
-                await self._process_disaster(disaster_data)
+            # 실제로 새로 저장된 재난만 알림 처리 (스트림에 넣으면 컨슈머가 이어서 처리)
+            if await self._enqueue_disasters(disasters):
+                return
+            for disaster in disasters:
+                # 폴링/저장 중 임대를 잃었으면 새 리더와 겹치지 않도록 인라인 발송 중단
+                if not self.leader.is_leader:
+                    logger.warning(
+                        f"Lost leadership before fan-out, skipping inline processing of disaster {disaster.id}"
+                    )
+                    break
+                await self._process_disaster(disaster)
                 
         except Exception as e:
             logger.error(f"Error in polling task: {str(e)}", exc_info=True)
     
-    async def _process_disaster(self, disaster_data: dict):
-        """개별 재난 처리"""
+    async def _enqueue_disasters(self, disasters: list) -> bool:
+        """새 재난을 대상자 조회 스트림에 추가 (스트림을 쓸 수 없으면 False)"""
+        if self.disaster_queue is None or not disasters:
+            return False
+        try:
+            await self.disaster_queue.add([{"disaster_id": str(disaster.id)} for disaster in disasters])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to enqueue disasters, processing inline: {str(e)}")
+            return False
+    
+    async def _process_disaster(self, disaster: Disaster):
+        """개별 재난 알림 처리 (스트림 없이 폴링 작업 안에서 끝까지)"""
         try:
             async with AsyncSessionLocal() as db:
-                # 재난 정보 저장
-                disaster = await self._save_disaster(db, disaster_data)
-                
-                if not disaster:
-                    return
-                
-                # 활성 사용자 조회 (최근 1시간 내 위치 업데이트한 사용자)
-                active_users = await self._get_active_users(db)
+                # 알림 대상 사용자 조회 (재난 수신 지역 안의 최근 1시간 내 활성 사용자)
+                target_users = await self._get_target_users(db, disaster)
+                alert_latency.observe("targeted", disaster.issued_at)
                 
-                logger.info(f"Found {len(active_users)} active users")
+                logger.info(f"Found {len(target_users)} target users")
                 
-                # 각 사용자에 대해 처리
-                notifications = []
-                
-                for user in active_users:
-                    # 사용자 위치와 재난 지역 교차 판정 (간단한 거리 기반)
-                    # 실제로는 PostGIS로 폴리곤 교차 판정해야 함
-                    if await self._should_notify_user(db, user, disaster):
-                        # 대피소 검색
-                        shelter_finder = ShelterFinder(db)
-                        shelters = await shelter_finder.get_shelters_within_radius(
-                            latitude=user.location.latitude if user.location else 37.5665,
-                            longitude=user.location.longitude if user.location else 126.9780,
-                            radius_km=settings.DEFAULT_SHELTER_SEARCH_RADIUS_KM,
-                            limit=settings.MAX_SHELTERS_RETURN
-                        )
-                        
-                        # 행동카드 생성
-                        user_profile = {
-                            "age_group": user.age_group,
-                            "mobility": user.mobility
-                        }
-                        
-                        action_card, generation_method = await self.llm_service.generate_action_card(
-                            disaster_type=disaster.disaster_type,
-                            location=disaster.location,
-                            user_profile=user_profile,
-                            shelters=shelters
-                        )
-                        
-                        # FCM 알림 준비
-                        if user.fcm_token:
-                            notifications.append({
-                                "fcm_token": user.fcm_token,
-                                "action_card": action_card,
-                                "disaster_type": disaster.disaster_type,
-                                "disaster_id": str(disaster.id),
-                                "shelters": [
-                                    {
-                                        "name": s.name,
-                                        "distance_km": s.distance_km,
-                                        "walking_minutes": s.walking_minutes
-                                    }
-                                    for s in shelters
-                                ]
-                            })
-                        
-                        logger.info(f"Action card prepared for user {user.device_id}")
-                
-                # 배치 알림 발송
-                if notifications:
-                    result = await fcm_client.send_batch_notifications(notifications)
-                    logger.info(f"Notifications sent: {result}")
+                await self._notify_users(disaster, target_users)
                 
         except Exception as e:
             logger.error(f"Error processing disaster: {str(e)}", exc_info=True)
     
-    async def _save_disaster(self, db, disaster_data: dict):
-        """재난 정보를 DB에 저장"""
+    async def _handle_disaster_entry(self, fields: dict):
+        """스트림 2단계: 재난 대상자 조회 → 사용자 묶음별 알림 작업 추가"""
+        async with AsyncSessionLocal() as db:
+            disaster = await db.get(Disaster, uuid.UUID(fields["disaster_id"]))
+            if disaster is None:
+                logger.warning(f"Queued disaster not found: {fields['disaster_id']}")
+                return
+            target_users = await self._get_target_users(db, disaster)
+        alert_latency.observe("targeted", disaster.issued_at)
+        
+        chunks = self._stream_chunks(target_users)
+        queued = await self.notification_queue.add_once(
+            QUEUED_KEY.format(disaster_id=disaster.id),
+            [
+                {
+                    "disaster_id": str(disaster.id),
+                    "user_ids": json.dumps([str(user.id) for user in chunk])
+                }
+                for chunk in chunks
+            ],
+            NOTIFIED_TTL_SECONDS
+        )
+        if queued is None:
+            logger.info(f"Notification chunks already queued for disaster {disaster.id}")
+            return
+        logger.info(f"Queued {len(chunks)} notification chunks for {len(target_users)} target users")
+    
+    async def _handle_notification_entry(self, fields: dict):
+        """
+        스트림 3단계: 사용자 묶음에 알림 발송 (이미 받은 사용자는 제외)
+        
+        푸시 토큰이 있는데 발송하지 못한 사용자가 남으면 예외를 올려 ack하지 않는다
+        (다시 처리될 때는 발송에 성공한 사용자를 건너뜀).
+        """
+        disaster_id = fields["disaster_id"]
+        user_ids = json.loads(fields["user_ids"])
+        
+        notified_key = NOTIFIED_KEY.format(disaster_id=disaster_id)
+        notified = await self.notification_queue.redis_client.smismember(notified_key, user_ids)
+        pending_ids = [user_id for user_id, done in zip(user_ids, notified) if not done]
+        if not pending_ids:
+            return
+        
+        async with AsyncSessionLocal() as db:
+            disaster = await db.get(Disaster, uuid.UUID(disaster_id))
+            if disaster is None:
+                logger.warning(f"Queued disaster not found: {disaster_id}")
+                return
+            result = await db.execute(
+                select(User).where(User.id.in_([uuid.UUID(user_id) for user_id in pending_ids]))
+            )
+            users = list(result.scalars().all())
+        
+        sent_ids = set(await self._notify_users(disaster, users, notified_key=notified_key))
+        unsent = [user.id for user in users if user.fcm_token and user.id not in sent_ids]
+        if unsent:
+            raise RuntimeError(
+                f"{len(unsent)}/{len(users)} notifications not sent for disaster {disaster_id}"
+            )
+    
+    async def _mark_notified(self, notified_key: str, user_id):
+        """푸시 발송에 성공한 사용자를 바로 기록 (묶음 처리 중 중단돼도 다시 보내지 않도록)"""
         try:
-            disaster = Disaster(
-                msg_id=disaster_data.get('MD101_SN', ''),
-                disaster_type=disaster_data.get('DSSTR_SE_NM', '기타'),
-                location=disaster_data.get('RCV_AREA_NM', ''),
-                message=disaster_data.get('MSG', ''),
-                severity=disaster_data.get('EMRG_STEP_NM', ''),
-                issued_at=datetime.fromisoformat(disaster_data.get('CRT_DT', datetime.now().isoformat()))
+            async with self.notification_queue.redis_client.pipeline(transaction=False) as pipe:
+                pipe.sadd(notified_key, str(user_id))
+                pipe.expire(notified_key, NOTIFIED_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to record notified user {user_id}: {str(e)}")
+    
+    def _stream_chunks(self, users: list) -> list:
+        """
+        알림 발송 작업 단위로 분할
+        
+        수용 인원 배정은 작업 단위로 이루어지므로, 배정을 쓰면 가까운 사용자끼리 같은
+        작업에 들어가도록 좌표 순으로 정렬해서 나눈다.
+        """
+        if settings.SHELTER_ASSIGNMENT_ENABLED:
+            users = sorted(users, key=self._user_point)
+        chunk_size = settings.NOTIFICATION_STREAM_CHUNK_SIZE
+        return [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
+    
+    def _chunk_users(self, users: list) -> list:
+        """대피소 조회 묶음으로 분할 (수용 인원 배정은 대상 전체를 함께 봐야 하므로 한 묶음)"""
+        chunk_size = (
+            max(1, len(users))
+            if settings.SHELTER_ASSIGNMENT_ENABLED
+            else settings.FANOUT_SHELTER_CHUNK_SIZE
+        )
+        return [users[i:i + chunk_size] for i in range(0, len(users), chunk_size)]
+    
+    def _cohorts_for(self, disaster) -> ActionCardCohorts:
+        """재난별 행동카드 코호트 (같은 재난의 여러 알림 묶음이 공유)"""
+        key = str(disaster.id)
+        cohorts = self._cohorts.get(key)
+        if cohorts is None:
+            cohorts = ActionCardCohorts(self.llm_service, disaster.disaster_type, disaster.location)
+            self._cohorts[key] = cohorts
+            if len(self._cohorts) > _COHORT_CACHE_SIZE:
+                self._cohorts.popitem(last=False)
+        else:
+            self._cohorts.move_to_end(key)
+        return cohorts
+    
+    async def _notify_users(self, disaster, users: list, notified_key: Optional[str] = None) -> list:
+        """
+        대피소 조회 → 행동카드 생성 → 푸시 발송을 단계별 워커 풀로 동시 처리
+        
+        Args:
+            notified_key: 발송에 성공한 사용자를 바로 기록할 Redis 집합 (스트림 처리 시)
+        
+        Returns:
+            푸시 발송에 성공한 사용자 id 목록
+        """
+        chunks = self._chunk_users(users)
+        
+        # 프롬프트 입력이 같은 사용자끼리 행동카드 공유
+        cohorts = self._cohorts_for(disaster)
+        
+        started = time.perf_counter()
+        results, stats = await run_pipeline(chunks, [
+            Stage(
+                "shelter_lookup",
+                self._observed("shelter_lookup", disaster, self._lookup_shelters),
+                workers=settings.FANOUT_SHELTER_WORKERS,
+                queue_size=settings.FANOUT_QUEUE_SIZE
+            ),
+            Stage(
+                "action_card",
+                self._observed("action_card", disaster, lambda job: self._prepare_action_card(cohorts, job)),
+                workers=settings.FANOUT_CARD_WORKERS,
+                queue_size=settings.FANOUT_QUEUE_SIZE
+            ),
+            Stage(
+                "push",
+                lambda job: self._send_notification(disaster, job, notified_key),
+                workers=settings.FANOUT_PUSH_WORKERS,
+                queue_size=settings.FANOUT_QUEUE_SIZE
             )
-            
-            db.add(disaster)
+        ])
+        
+        sent_ids = [user_id for user_id, sent in results if sent]
+        logger.info(
+            f"Notifications sent: {len(sent_ids)}/{len(results)} "
+            f"in {time.perf_counter() - started:.1f}s (stages: {stats}, action cards: {cohorts.stats()})"
+        )
+        return sent_ids
+    
+    def _observed(self, stage: str, disaster, handler):
+        """팬아웃 단계 handler를 감싸 단계를 마친 사용자 수만큼 발령 후 지연 기록"""
+        async def run(job):
+            outputs = await handler(job)
+            alert_latency.observe(stage, disaster.issued_at, count=len(outputs or []))
+            return outputs
+        return run
+    
+    async def _lookup_shelters(self, users: list) -> list:
+        """팬아웃 1단계: 사용자 묶음의 대피소를 한 번에 검색 (푸시 토큰이 있는 사용자만 다음 단계로)"""
+        # 대피소 조회는 읽기 복제본 사용
+        async with shelter_read_session() as shelter_db:
+            shelter_finder = ShelterFinder(shelter_db)
+            find_shelters = (
+                shelter_finder.get_assigned_shelters_batch
+                if settings.SHELTER_ASSIGNMENT_ENABLED
+                else shelter_finder.get_nearest_shelters_batch
+            )
+            shelters_per_user = await find_shelters(
+                points=[self._user_point(user) for user in users],
+                radius_km=settings.DEFAULT_SHELTER_SEARCH_RADIUS_KM,
+                limit=settings.MAX_SHELTERS_RETURN
+            )
+        
+        return [
+            (user, shelters)
+            for user, shelters in zip(users, shelters_per_user)
+            if user.fcm_token
+        ]
+    
+    async def _prepare_action_card(self, cohorts: ActionCardCohorts, job: tuple) -> list:
+        """팬아웃 2단계: 사용자 코호트의 행동카드 준비 (코호트당 LLM 호출 1회)"""
+        user, shelters = job
+        user_profile = {
+            "age_group": user.age_group,
+            "mobility": user.mobility
+        }
+        
+        action_card, generation_method = await cohorts.card_for(user_profile, shelters)
+        
+        logger.debug(f"Action card prepared for user {user.device_id} ({generation_method})")
+        return [(user, shelters, action_card)]
+    
+    async def _send_notification(self, disaster, job: tuple, notified_key: Optional[str] = None) -> list:
+        """팬아웃 3단계: FCM 푸시 발송"""
+        user, shelters, action_card = job
+        sent = await fcm_client.send_action_card_to_user(
+            fcm_token=user.fcm_token,
+            action_card=action_card,
+            disaster_type=disaster.disaster_type,
+            disaster_id=str(disaster.id),
+            shelters=[
+                {
+                    "name": s.name,
+                    "distance_km": s.distance_km,
+                    "walking_minutes": s.walking_minutes
+                }
+                for s in shelters
+            ]
+        )
+        if sent:
+            alert_latency.observe("push_sent", disaster.issued_at)
+            if notified_key:
+                await self._mark_notified(notified_key, user.id)
+        return [(user.id, sent)]
+    
+    async def _save_disasters(self, db, disaster_datas: list) -> list:
+        """
+        폴링한 재난문자를 한 번에 저장
+        
+        INSERT ... ON CONFLICT (msg_id) DO NOTHING RETURNING 한 문장으로 처리하므로
+        왕복은 1회이고, 새로 저장된 행만 반환된다 (다른 워커가 먼저 저장한 재난 제외).
+        묶음 INSERT가 실패하면 한 행씩 SAVEPOINT 안에서 다시 저장해 문제 행만 건너뛴다.
+        
+        Raises:
+            DB에 닿지 못했거나 커밋에 실패하면 예외를 그대로 올린다
+            (폴러 워터마크를 올리지 않아 다음 폴링에서 다시 저장하도록)
+        """
+        rows = {}
+        for disaster_data in disaster_datas:
+            row = self._disaster_row(disaster_data)
+            if row and row["msg_id"] not in rows:
+                rows[row["msg_id"]] = row
+        
+        if not rows:
+            return []
+        
+        try:
+            result = await db.execute(self._insert_disasters(list(rows.values())))
+            disasters = list(result.scalars().all())
             await db.commit()
-            await db.refresh(disaster)
-            
-            logger.info(f"Disaster saved: {disaster.disaster_type} at {disaster.location}")
-            return disaster
-            
         except Exception as e:
-            logger.error(f"Error saving disaster: {str(e)}")
+            if _is_connection_error(e):
+                raise
+            logger.error(f"Error saving disasters, retrying one by one: {str(e)}")
             await db.rollback()
-            return None
+            disasters = await self._save_disasters_one_by_one(db, list(rows.values()))
+        
+        for disaster in disasters:
+            logger.info(f"Disaster saved: {disaster.disaster_type} at {disaster.location}")
+        if len(disasters) < len(rows):
+            logger.info(f"Skipped {len(rows) - len(disasters)} already saved or invalid disasters")
+        return disasters
     
-    async def _get_active_users(self, db):
-        """활성 사용자 조회 (최근 1시간 내)"""
+    async def _save_disasters_one_by_one(self, db, rows: list) -> list:
+        """한 행씩 SAVEPOINT 안에서 저장 (실패한 행만 되돌리고 나머지는 한 번에 커밋)"""
+        disasters = []
+        for row in rows:
+            try:
+                async with db.begin_nested():
+                    result = await db.execute(self._insert_disasters([row]))
+                    disasters.extend(result.scalars().all())
+            except Exception as e:
+                if _is_connection_error(e):
+                    raise
+                logger.error(f"Error saving disaster {row['msg_id']}: {str(e)}")
+        
+        await db.commit()
+        return disasters
+    
+    def _insert_disasters(self, rows: list):
+        """INSERT ... ON CONFLICT (msg_id) DO NOTHING RETURNING 문장"""
+        return (
+            pg_insert(Disaster)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Disaster.msg_id])
+            .returning(Disaster)
+        )
+    
+    def _disaster_row(self, disaster_data: dict):
+        """
+        재난문자 → disasters 행 (형식 오류면 None)
+        
+        문자열은 컬럼 길이에 맞게 자른다 (긴 수신 지역 하나로 묶음 INSERT가 실패하지 않도록).
+        msg_id는 자르면 다른 문자와 겹칠 수 있으므로 길이를 넘으면 저장하지 않는다.
+        """
         try:
-            one_hour_ago = datetime.utcnow() - timedelta(hours=1)
-            
-            query = select(User).where(
-                User.is_active == True,
-                User.last_location_update >= one_hour_ago
-            )
-            
-            result = await db.execute(query)
-            users = result.scalars().all()
-            
-            return users
-            
+            msg_id = str(disaster_data.get('MD101_SN') or '')
+            if not msg_id or len(msg_id) > _column_length(Disaster.msg_id):
+                raise ValueError(f"invalid MD101_SN {msg_id[:50]!r}")
+            area = disaster_data.get('RCV_AREA_NM') or ''
+            region_codes = self._region_codes_of(area)
+            if region_codes:
+                code_length = _column_length(Disaster.region_codes, item=True)
+                region_codes = [code[:code_length] for code in region_codes]
+            return {
+                "msg_id": msg_id,
+                "disaster_type": _fit(Disaster.disaster_type, disaster_data.get('DSSTR_SE_NM') or '기타'),
+                "location": _fit(Disaster.location, area),
+                "region_codes": region_codes,
+                "message": disaster_data.get('MSG') or '',
+                "severity": _fit(Disaster.severity, disaster_data.get('EMRG_STEP_NM') or ''),
+                "issued_at": datetime.fromisoformat(disaster_data.get('CRT_DT', kst_now().isoformat()))
+            }
         except Exception as e:
-            logger.error(f"Error fetching active users: {str(e)}")
-            return []
+            logger.error(f"Invalid disaster message {disaster_data.get('MD101_SN')}: {str(e)}")
+            return None
     
-    async def _should_notify_user(self, db, user, disaster) -> bool:
-        """사용자에게 알림을 보내야 하는지 판단"""
-        # 간단한 구현: 모든 활성 사용자에게 알림
-        # 실제로는 PostGIS로 위치 교차 판정
+    def _region_codes_of(self, area: str):
+        """수신 지역 문자열 → 행정구역 경로 목록 (전국이면 ['전국'], 해석 실패 시 None)"""
+        regions = parse_receiving_area(area)
+        if regions is None:
+            return [NATIONWIDE_NAME]
+        return sorted(regions) or None
+    
+    async def _get_target_users(self, db, disaster):
+        """
+        재난 수신 지역 안의 활성 사용자 조회 (최근 1시간 내)
         
-        if not user.location:
-            return False
+        조회 오류는 호출한 쪽으로 전달한다 (스트림 작업은 ack하지 않고 다시 처리).
+        """
+        codes = disaster.region_codes
+        if not codes or NATIONWIDE_NAME in codes:
+            # 지역을 해석하지 못하면 누락보다 과다 발송이 안전
+            if not codes:
+                logger.warning(f"Unknown disaster area, notifying all active users: {disaster.location}")
+            regions = None
+        else:
+            regions = codes
         
-        # TODO: PostGIS ST_Intersects로 실제 교차 판정
-        # 현재는 간단히 모든 활성 사용자에게 알림
-        return True
+        return await find_target_users(
+            db,
+            regions,
+            disaster_area=disaster.disaster_area,
+            active_within=timedelta(hours=1)
+        )
+    
+    def _user_point(self, user) -> tuple:
+        """사용자 좌표 (위치가 없으면 서울시청 기본 좌표)"""
+        return (
+            user.location.latitude if user.location else 37.5665,
+            user.location.longitude if user.location else 126.9780
+        )
 
 
 # 싱글톤 인스턴스
@@ -3,7 +3,7 @@ PES 백엔드 설정 파일
 """
 import os
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -24,6 +24,12 @@ class Settings(BaseSettings):
     LOCAL_SHELTER_DB_USER: Optional[str] = None
     LOCAL_SHELTER_DB_PASSWORD: Optional[str] = None
     
+    # 대피소 DB 읽기 전용 복제본 (쉼표로 구분된 asyncpg URL, 비어 있으면 사용 안 함)
+    SHELTER_DB_REPLICA_URLS: str = ""
+    SHELTER_DB_POOL_SIZE: int = 5
+    SHELTER_DB_MAX_OVERFLOW: int = 10
+    SHELTER_DB_REPLICA_HEALTH_CHECK_SECONDS: int = 5
+    
     # Redis
     REDIS_URL: str = "redis://localhost:6379"
     REDIS_CACHE_TTL: int = 1800  # 30분
@@ -39,11 +45,18 @@ class Settings(BaseSettings):
     OLLAMA_MODEL: str = "qwen3:8b" 
     OLLAMA_TIMEOUT: int = 30  # AI 응답 대기 시간 (초)
     OLLAMA_TEMPERATURE: float = 0.3
+    OLLAMA_MAX_CONCURRENCY: int = 2  # Ollama 서버로 동시에 보내는 생성 요청 수
+    OLLAMA_MAX_QUEUE: int = 32  # 슬롯을 기다릴 수 있는 요청 수 (넘치면 바로 거절)
+    OLLAMA_DEADLINE_SECONDS: float = 60.0  # 행동카드 한 건 생성 마감 (대기 + 재시도 포함)
+    ACTION_CARD_DISTANCE_BUCKET_KM: float = 0.1  # 대량 알림 시 같은 카드를 공유할 거리 구간
     
     # 행정안전부 재난문자 API
     DISASTER_API_URL: str = "https://www.safetydata.go.kr/api/disasterMsg"
     DISASTER_API_KEY: str = ""
     DISASTER_API_TIMEOUT: int = 5
+    DISASTER_API_PAGE_SIZE: int = 50  # 한 페이지 조회 건수
+    DISASTER_API_PROBE_ROWS: int = 10  # 평시 첫 조회 건수 (워터마크 이후 변경 확인용)
+    DISASTER_API_MAX_PAGES: int = 20  # 한 번의 폴링에서 따라갈 최대 페이지 수
     
     # Firebase
     FIREBASE_CREDENTIALS_PATH: Optional[str] = None
@@ -63,15 +76,69 @@ class Settings(BaseSettings):
     
     # Polling Configuration
     DISASTER_POLL_INTERVAL_SECONDS: int = 10
+    DISASTER_POLL_MIN_INTERVAL_SECONDS: float = 2.0  # 재난문자가 몰릴 때 최소 간격
+    DISASTER_POLL_MAX_INTERVAL_SECONDS: float = 300.0  # 상류 장애 시 백오프 최대 간격
+    DISASTER_BREAKER_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 서킷 브레이커 열기
+    DISASTER_BREAKER_RESET_SECONDS: float = 60.0  # 브레이커가 열린 뒤 시험 호출까지 대기
+    DISASTER_LEADER_ELECTION_ENABLED: bool = True  # 여러 워커/복제본 중 한 곳만 폴링
+    DISASTER_LEADER_LEASE_SECONDS: float = 6.0  # 리더 임대 TTL (폴링 간격보다 짧게 유지해 한 주기 안에 인계)
+    
+    # 재난 알림 팬아웃 (단계별 워커 수, 단계 사이 큐 크기)
+    FANOUT_SHELTER_WORKERS: int = 4
+    FANOUT_SHELTER_CHUNK_SIZE: int = 500  # 대피소 조회 한 번에 묶을 사용자 수
+    FANOUT_CARD_WORKERS: int = 16
+    FANOUT_PUSH_WORKERS: int = 32
+    FANOUT_QUEUE_SIZE: int = 1000
+    
+    # 대상자 조회 / 알림 발송 단계 사이 Redis Streams (끄거나 Redis가 없으면 폴링 작업 안에서 처리)
+    NOTIFICATION_STREAMS_ENABLED: bool = True
+    NOTIFICATION_STREAM_CONSUMERS: int = 2  # 인스턴스당 알림 발송 컨슈머 수
+    NOTIFICATION_STREAM_CHUNK_SIZE: int = 500  # 알림 발송 작업 하나에 담을 사용자 수
+    NOTIFICATION_STREAM_MAX_LEN: int = 100000  # 스트림 최대 길이 (근사치로 잘라냄)
+    NOTIFICATION_STREAM_CLAIM_IDLE_SECONDS: float = 300.0  # 이 시간 동안 ack되지 않은 작업은 다른 컨슈머가 넘겨받음
+    NOTIFICATION_STREAM_NOTIFIER_CLAIM_IDLE_SECONDS: float = 30.0  # 알림 발송 작업은 짧게 (실패한 묶음 재시도 간격)
+    NOTIFICATION_STREAM_WORKER_SLOTS: int = 32  # 호스트당 컨슈머 이름 슬롯 수 (재시작해도 같은 이름으로 pending 작업 이어받기)
+    NOTIFICATION_STREAM_SLOT_LEASE_SECONDS: float = 30.0  # 컨슈머 이름 슬롯 임대 TTL
+    NOTIFICATION_STREAM_MAX_DELIVERIES: int = 5  # 넘기면 dead letter 스트림으로 이동
+    
+    # 새 재난 실시간 스트림 (SSE, Redis pub/sub)
+    DISASTER_STREAM_CHANNEL: str = "disaster:events"
+    DISASTER_STREAM_QUEUE_SIZE: int = 100  # 클라이언트별 대기 이벤트 수 (넘치면 오래된 것부터 버림)
+    DISASTER_STREAM_HEARTBEAT_SECONDS: float = 15.0  # 프록시가 유휴 연결을 끊지 않도록 주석 라인 전송
     
     # Location Settings
     DEFAULT_SHELTER_SEARCH_RADIUS_KM: float = 2.0
     MAX_SHELTERS_RETURN: int = 3
     WALKING_SPEED_KM_PER_HOUR: float = 4.8
-    
+
+    # 대피소 공간 인덱스 (인메모리 격자)
+    SHELTER_INDEX_ENABLED: bool = True  # False: 항상 SQL 경로 사용
+    SHELTER_INDEX_CELL_DEG: float = 0.02  # 격자 셀 크기 (도, 약 2km)
+    SHELTER_INDEX_LIVE_RELOAD: bool = True  # shelters 변경 알림(LISTEN/NOTIFY)으로 증분 갱신
+    SHELTER_INDEX_RELOAD_DEBOUNCE_SECONDS: float = 0.5  # 알림을 모아서 반영하는 대기 시간
+    
+    # 주변 대피소 검색 결과 캐시 (Redis, geohash 셀 단위)
+    SHELTER_CACHE_ENABLED: bool = True
+    SHELTER_CACHE_TTL_SECONDS: int = 300
+    SHELTER_CACHE_GEOHASH_PRECISION: int = 6  # 약 1.2km x 0.6km 셀
+    SHELTER_CACHE_MAX_CANDIDATES: int = 200  # 셀당 최대 후보 수 (초과 시 캐시 생략)
+    SHELTER_CACHE_MAX_RADIUS_KM: float = 50.0  # 이보다 큰 반경 검색은 캐시하지 않음 (변경 시 무효화 범위)
+    SHELTER_CACHE_INVALIDATE_MAX_CELLS: int = 100000  # 변경 주변 셀이 이보다 많으면 전체 무효화
+    
+    # 대량 알림 시 수용 인원 고려 대피소 배정
+    SHELTER_ASSIGNMENT_ENABLED: bool = True  # False: 사용자마다 최근접 대피소 안내
+    SHELTER_ASSIGNMENT_CANDIDATES: int = 10  # 사용자별 배정 후보 대피소 수
+    SHELTER_ASSIGNMENT_CAPACITY_SHARE: float = 1.0  # 앱 사용자에게 배정할 수용 인원 비율
+    
+    # 오프라인 대피소 스냅샷 (모바일 배포용, 지역 타일 단위 샤드)
+    SHELTER_SNAPSHOT_DIR: str = "app/data/snapshots"
+    SHELTER_SNAPSHOT_TILE_DEG: float = 0.5  # 샤드 타일 크기 (도, 약 55km x 44km)
+
     # Google Maps (향후 사용)
     GOOGLE_MAPS_API_KEY: Optional[str] = None
     GOOGLE_GEOCODING_API_URL: str = "https://maps.googleapis.com/maps/api/geocode/json"
+    USER_REGION_GEOHASH_PRECISION: int = 7  # 사용자 행정구역 역지오코딩 결과를 공유하는 geohash 셀 정밀도 (약 150m)
+    USER_REGION_CACHE_SIZE: int = 10000  # 프로세스별 역지오코딩 결과 캐시 셀 수
     
     # Firebase Configuration
     FIREBASE_CREDENTIALS_PATH: str = os.path.join(
@@ -94,6 +161,11 @@ class Settings(BaseSettings):
             self.LOCAL_SHELTER_DB_PASSWORD
         ])
     
+    @property
+    def shelter_db_replica_urls(self) -> List[str]:
+        """대피소 DB 복제본 URL 목록"""
+        return [url.strip() for url in self.SHELTER_DB_REPLICA_URLS.split(",") if url.strip()]
+    
     @property
     def local_shelter_db_url(self) -> str:
         """
@@ -0,0 +1,152 @@
+"""
+재난 알림 지연 지표
+
+재난문자 발령 시각(CRT_DT, disasters.issued_at)부터 각 처리 단계를 마칠 때까지 걸린
+시간을 단계별 히스토그램으로 모은다. 단계마다 발령 시각 기준으로 재므로 단계 사이에
+타임스탬프를 넘길 필요가 없고, 스트림 컨슈머가 다른 프로세스에 있어도 같은 기준이다.
+
+    poll_received  폴링 응답 수신
+    saved          DB 저장
+    targeted       알림 대상자 조회
+    shelter_lookup 대피소 조회 (사용자 단위)
+    action_card    행동카드 준비 (사용자 단위)
+    push_sent      FCM 발송 성공 (사용자 단위) ← 핵심 SLO
+
+히스토그램은 프로세스별로 집계된다 (여러 워커면 각 워커의 지표를 수집).
+"""
+import bisect
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+# 발령 시각(CRT_DT)은 시간대 없는 한국 시각
+KST = ZoneInfo("Asia/Seoul")
+
+ALERT_STAGES = (
+    "poll_received",
+    "saved",
+    "targeted",
+    "shelter_lookup",
+    "action_card",
+    "push_sent",
+)
+
+# 버킷 상한 (초). 수 초 단위 SLO를 촘촘히 보고, 상류 지연(수십 분)까지 담는다
+DEFAULT_BUCKETS = (
+    0.5, 1, 2, 3, 5, 7.5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 300, 600, 1800, 3600
+)
+
+
+def kst_now() -> datetime:
+    """지금 한국 시각 (발령 시각과 비교할 수 있도록 시간대 없이, 서버 시간대와 무관)"""
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 히스토그램 (관측 O(log 버킷 수), 메모리 고정)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float, count: int = 1):
+        seconds = max(0.0, seconds)
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += count
+        self.count += count
+        self.sum += seconds * count
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """버킷 안에서 선형 보간한 분위수 (관측이 없으면 None)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.max
+                value = lower + (upper - lower) * (rank - cumulative) / bucket_count
+                return min(value, self.max)
+            cumulative += bucket_count
+        return self.max
+
+    def summary(self) -> Dict:
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 3) if value is not None else None
+
+        return {
+            "count": self.count,
+            "avg": rounded(self.sum / self.count) if self.count else None,
+            "p50": rounded(self.percentile(0.50)),
+            "p95": rounded(self.percentile(0.95)),
+            "p99": rounded(self.percentile(0.99)),
+            "max": rounded(self.max) if self.count else None
+        }
+
+    def cumulative_buckets(self) -> List[tuple]:
+        """(상한, 누적 개수) 목록 (Prometheus 형식)"""
+        result = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + [float("inf")], self.counts):
+            cumulative += bucket_count
+            result.append((bound, cumulative))
+        return result
+
+
+class AlertLatencyMetrics:
+    """단계별 발령→처리 지연 히스토그램"""
+
+    def __init__(self, stages: Sequence[str] = ALERT_STAGES):
+        self._lock = threading.Lock()
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in stages}
+
+    def observe(self, stage: str, issued_at: Optional[datetime], at: Optional[datetime] = None, count: int = 1):
+        """
+        issued_at(발령 시각)부터 at(기본: 지금)까지의 지연 기록
+
+        Args:
+            count: 같은 시점에 이 단계를 마친 사용자 수
+        """
+        if issued_at is None or count <= 0:
+            return
+        seconds = ((at or kst_now()) - issued_at).total_seconds()
+        with self._lock:
+            self.histograms[stage].observe(seconds, count)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """단계별 count / avg / p50 / p95 / p99 / max (초)"""
+        with self._lock:
+            return {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+
+    def prometheus(self, name: str = "pes_alert_latency_seconds") -> str:
+        """Prometheus 텍스트 형식"""
+        lines = [
+            f"# HELP {name} Seconds from disaster message issue (CRT_DT) to the end of each processing stage.",
+            f"# TYPE {name} histogram",
+        ]
+        with self._lock:
+            for stage, histogram in self.histograms.items():
+                for bound, cumulative in histogram.cumulative_buckets():
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum:.3f}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+def prometheus_gauges(prefix: str, values: Dict[str, float]) -> str:
+    """{이름: 값} → Prometheus gauge 텍스트 ("{prefix}_{이름}")"""
+    lines = []
+    for key, value in values.items():
+        lines.append(f"# TYPE {prefix}_{key} gauge")
+        lines.append(f"{prefix}_{key} {value}")
+    return "\n".join(lines) + "\n"
+
+
+# 싱글톤 인스턴스
+alert_latency = AlertLatencyMetrics()
@@ -0,0 +1,33 @@
+-- 대피소 정규화 분류 컬럼
+-- 유형 필터가 TRIM(shelter_type) LIKE '%...%' 대신 shelter_category 동등 조건을
+-- 사용하도록 분류 컬럼을 추가하고 기존 데이터를 채운다.
+-- 분류 규칙은 app/models/shelter.py의 shelter_category_of()와 동일하다.
+--
+-- 실행: psql "$SHELTER_DB" -f app/db/migrations/002_shelters_category.sql
+-- (CONCURRENTLY는 트랜잭션 블록 밖에서 실행해야 함)
+
+ALTER TABLE shelters ADD COLUMN IF NOT EXISTS shelter_category VARCHAR(20);
+
+-- 유형 문자열 앞뒤 공백 제거 (유형 동등 조건이 idx_shelters_type을 사용하도록)
+UPDATE shelters
+SET shelter_type = TRIM(shelter_type)
+WHERE shelter_type <> TRIM(shelter_type);
+
+UPDATE shelters
+SET shelter_category = CASE
+        WHEN shelter_type LIKE '%민방위대피소%' THEN '민방위'
+        WHEN shelter_type LIKE '%지진대피소%' THEN '지진'
+        WHEN shelter_type LIKE '%해일대피소%' THEN '해일'
+        WHEN shelter_type LIKE '%기타대피소%' THEN '기타'
+    END
+WHERE shelter_category IS DISTINCT FROM CASE
+        WHEN shelter_type LIKE '%민방위대피소%' THEN '민방위'
+        WHEN shelter_type LIKE '%지진대피소%' THEN '지진'
+        WHEN shelter_type LIKE '%해일대피소%' THEN '해일'
+        WHEN shelter_type LIKE '%기타대피소%' THEN '기타'
+    END;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shelters_category_lat_lng
+    ON shelters (shelter_category, latitude, longitude);
+
+ANALYZE shelters;
@@ -0,0 +1,66 @@
+-- 대피소 변경 알림 트리거
+-- shelters 행이 바뀔 때마다 'shelter_changes' 채널로 NOTIFY를 보내,
+-- 각 서버 워커가 인메모리 공간 인덱스를 재시작 없이 증분 갱신하도록 한다
+-- (app/services/shelter_listener.py).
+--
+-- payload: {"op": "INSERT" | "UPDATE" | "DELETE" | "TRUNCATE", "id": "<uuid>",
+--           "txid": <트랜잭션 id>, "points": [[변경 전 위도, 경도], [변경 후 위도, 경도]]}
+-- points는 검색 캐시에서 무효화할 셀을 정하는 데 쓰고(좌표가 없으면 생략),
+-- (txid, id)는 여러 워커 중 한 곳만 캐시를 무효화하도록 알림을 구분하는 데 쓴다.
+-- NOTIFY는 커밋 시점에 전달되며, 롤백된 트랜잭션의 알림은 전달되지 않는다.
+--
+-- 실행: psql "$SHELTER_DB" -f app/db/migrations/003_shelters_change_notify.sql
+
+CREATE OR REPLACE FUNCTION notify_shelter_change() RETURNS trigger AS $$
+DECLARE
+    row_id uuid;
+    points jsonb := '[]'::jsonb;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('shelter_changes', json_build_object('op', TG_OP, 'txid', txid_current())::text);
+        RETURN NULL;
+    END IF;
+
+    -- 인덱스에 담기는 컬럼이 그대로면 (updated_at 등만 변경) 알리지 않음
+    IF TG_OP = 'UPDATE' THEN
+        IF NEW.name IS NOT DISTINCT FROM OLD.name
+           AND NEW.address IS NOT DISTINCT FROM OLD.address
+           AND NEW.shelter_type IS NOT DISTINCT FROM OLD.shelter_type
+           AND NEW.latitude IS NOT DISTINCT FROM OLD.latitude
+           AND NEW.longitude IS NOT DISTINCT FROM OLD.longitude
+           AND NEW.capacity IS NOT DISTINCT FROM OLD.capacity THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+
+    IF TG_OP <> 'INSERT' THEN
+        row_id := OLD.id;
+        IF OLD.latitude IS NOT NULL AND OLD.longitude IS NOT NULL THEN
+            points := points || jsonb_build_array(jsonb_build_array(OLD.latitude, OLD.longitude));
+        END IF;
+    END IF;
+
+    IF TG_OP <> 'DELETE' THEN
+        row_id := NEW.id;
+        IF NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL THEN
+            points := points || jsonb_build_array(jsonb_build_array(NEW.latitude, NEW.longitude));
+        END IF;
+    END IF;
+
+    PERFORM pg_notify(
+        'shelter_changes',
+        json_build_object('op', TG_OP, 'id', row_id, 'txid', txid_current(), 'points', points)::text
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS shelters_notify_change ON shelters;
+CREATE TRIGGER shelters_notify_change
+    AFTER INSERT OR UPDATE OR DELETE ON shelters
+    FOR EACH ROW EXECUTE FUNCTION notify_shelter_change();
+
+DROP TRIGGER IF EXISTS shelters_notify_truncate ON shelters;
+CREATE TRIGGER shelters_notify_truncate
+    AFTER TRUNCATE ON shelters
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_shelter_change();
@@ -0,0 +1,50 @@
+-- 사용자 행정구역 경로 컬럼 (재난 수신 지역 기반 알림 대상 조회)
+-- admin_region('서울시 영등포구')의 광역시도 약칭을 정식 명칭으로 바꾼
+-- region_path('서울특별시 영등포구')를 추가하고, 지역 및 하위 지역 접두어 조회
+-- (region_path LIKE '서울특별시 영등포구 %')가 인덱스를 타도록 text_pattern_ops로 색인한다.
+-- 아래 SQL 백필은 광역시도 약칭만 바꾸는 근사치이므로, 실행 후
+-- scripts/backfill_region_path.py로 앱과 같은 파서(normalize_region())로 다시 정규화한다.
+--
+-- 실행: psql "$DATABASE_URL" -f app/db/migrations/004_users_region_path.sql
+--       python scripts/backfill_region_path.py
+-- (CONCURRENTLY는 트랜잭션 블록 밖에서 실행해야 함)
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS region_path VARCHAR(255);
+
+UPDATE users
+SET region_path = normalized.region_path
+FROM (
+    SELECT id,
+        CASE
+            WHEN split_part(region, ' ', 1) IN ('서울특별시', '서울', '서울시') THEN '서울특별시'
+            WHEN split_part(region, ' ', 1) IN ('부산광역시', '부산', '부산시') THEN '부산광역시'
+            WHEN split_part(region, ' ', 1) IN ('대구광역시', '대구', '대구시') THEN '대구광역시'
+            WHEN split_part(region, ' ', 1) IN ('인천광역시', '인천', '인천시') THEN '인천광역시'
+            WHEN split_part(region, ' ', 1) IN ('광주광역시', '광주') THEN '광주광역시'
+            WHEN split_part(region, ' ', 1) IN ('대전광역시', '대전', '대전시') THEN '대전광역시'
+            WHEN split_part(region, ' ', 1) IN ('울산광역시', '울산', '울산시') THEN '울산광역시'
+            WHEN split_part(region, ' ', 1) IN ('세종특별자치시', '세종', '세종시') THEN '세종특별자치시'
+            WHEN split_part(region, ' ', 1) IN ('경기도', '경기') THEN '경기도'
+            WHEN split_part(region, ' ', 1) IN ('강원특별자치도', '강원', '강원도') THEN '강원특별자치도'
+            WHEN split_part(region, ' ', 1) IN ('충청북도', '충북') THEN '충청북도'
+            WHEN split_part(region, ' ', 1) IN ('충청남도', '충남') THEN '충청남도'
+            WHEN split_part(region, ' ', 1) IN ('전북특별자치도', '전북', '전라북도') THEN '전북특별자치도'
+            WHEN split_part(region, ' ', 1) IN ('전라남도', '전남') THEN '전라남도'
+            WHEN split_part(region, ' ', 1) IN ('경상북도', '경북') THEN '경상북도'
+            WHEN split_part(region, ' ', 1) IN ('경상남도', '경남') THEN '경상남도'
+            WHEN split_part(region, ' ', 1) IN ('제주특별자치도', '제주', '제주도') THEN '제주특별자치도'
+        END || substr(region, length(split_part(region, ' ', 1)) + 1) AS region_path
+    FROM (
+        SELECT id, btrim(regexp_replace(regexp_replace(admin_region, '\([^)]*\)|(^|\s)전체(\s|$)', ' ', 'g'), '\s+', ' ', 'g')) AS region
+        FROM users
+        WHERE admin_region IS NOT NULL
+    ) cleaned
+) normalized
+WHERE users.id = normalized.id
+  AND users.region_path IS DISTINCT FROM normalized.region_path;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_region_path
+    ON users (region_path text_pattern_ops)
+    WHERE is_active = TRUE;
+
+ANALYZE users;
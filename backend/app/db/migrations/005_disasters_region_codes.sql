@@ -0,0 +1,13 @@
+-- 재난 수신 지역 행정구역 경로 컬럼
+-- 수신 지역 문자열(RCV_AREA_NM)을 app/services/region_parser.py로 해석한
+-- 행정구역 경로 목록을 재난과 함께 저장하고, 지역별 재난 조회
+-- (region_codes && ARRAY['경기도 안산시 단원구'])가 인덱스를 타도록 GIN으로 색인한다.
+-- 기존 행은 비워 두며(NULL) 알림 대상 조회는 이 경우 전체 활성 사용자로 처리한다.
+--
+-- 실행: psql "$DATABASE_URL" -f app/db/migrations/005_disasters_region_codes.sql
+-- (CONCURRENTLY는 트랜잭션 블록 밖에서 실행해야 함)
+
+ALTER TABLE disasters ADD COLUMN IF NOT EXISTS region_codes VARCHAR(255)[];
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_disasters_region_codes
+    ON disasters USING GIN (region_codes);
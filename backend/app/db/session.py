@@ -1,8 +1,14 @@
 """
 데이터베이스 세션 관리
 """
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy import text
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
 import logging
 from ..core.config import settings
 
@@ -37,8 +43,8 @@ if settings.use_local_shelter_db:
         echo=settings.DEBUG,
         future=True,
         pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10
+        pool_size=settings.SHELTER_DB_POOL_SIZE,
+        max_overflow=settings.SHELTER_DB_MAX_OVERFLOW
     )
     _using_local_shelter_db = True
 else:
@@ -54,6 +60,151 @@ ShelterAsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+
+
+class ShelterReplica:
+    """대피소 DB 읽기 전용 복제본 하나 (엔진 + 세션 팩토리 + 상태)"""
+    
+    def __init__(self, url: str):
+        parsed = make_url(url)
+        self.name = f"{parsed.host}:{parsed.port or 5432}/{parsed.database}"  # 비밀번호 제외
+        self.engine: AsyncEngine = create_async_engine(
+            url,
+            echo=settings.DEBUG,
+            future=True,
+            pool_pre_ping=True,
+            pool_size=settings.SHELTER_DB_POOL_SIZE,
+            max_overflow=settings.SHELTER_DB_MAX_OVERFLOW
+        )
+        self.session_factory = async_sessionmaker(
+            self.engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autocommit=False,
+            autoflush=False
+        )
+        self.healthy = True
+        self.last_error: Optional[str] = None
+
+
+class ShelterReplicaPool:
+    """
+    대피소 DB 읽기 복제본 풀
+    
+    - 건강한 복제본을 라운드로빈으로 선택
+    - 주기적으로 SELECT 1로 상태 확인, 연결 오류가 난 복제본은 즉시 제외
+    - 사용 가능한 복제본이 없으면 primary(shelter_engine)로 읽기
+    """
+    
+    def __init__(self, urls: List[str]):
+        self.replicas = [ShelterReplica(url) for url in urls]
+        self._cursor = 0
+        self._health_task: Optional[asyncio.Task] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+    
+    def acquire(self) -> Tuple[Optional[ShelterReplica], async_sessionmaker]:
+        """다음 건강한 복제본 선택 (없으면 (None, primary 세션 팩토리))"""
+        count = len(self.replicas)
+        for _ in range(count):
+            replica = self.replicas[self._cursor % count]
+            self._cursor += 1
+            if replica.healthy:
+                return replica, replica.session_factory
+        return None, ShelterAsyncSessionLocal
+    
+    def mark_unhealthy(self, replica: ShelterReplica, error: Exception):
+        """복제본을 다음 헬스 체크 전까지 라우팅에서 제외"""
+        if replica.healthy:
+            logger.warning(f"⚠️ 대피소 DB 복제본 제외: {replica.name} ({error})")
+        replica.healthy = False
+        replica.last_error = str(error)
+    
+    async def check_health(self):
+        """모든 복제본 상태 확인"""
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    await asyncio.wait_for(
+                        conn.execute(text("SELECT 1")),
+                        timeout=settings.SHELTER_DB_REPLICA_HEALTH_CHECK_SECONDS
+                    )
+                if not replica.healthy:
+                    logger.info(f"✅ 대피소 DB 복제본 복구: {replica.name}")
+                replica.healthy = True
+                replica.last_error = None
+            except Exception as e:
+                self.mark_unhealthy(replica, e)
+    
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(settings.SHELTER_DB_REPLICA_HEALTH_CHECK_SECONDS)
+            try:
+                await self.check_health()
+            except Exception as e:
+                logger.error(f"Shelter replica health check error: {str(e)}")
+    
+    async def start(self):
+        """초기 상태 확인 후 주기적 헬스 체크 시작"""
+        if not self.enabled:
+            return
+        await self.check_health()
+        self._health_task = asyncio.create_task(self._health_loop())
+        healthy = sum(1 for replica in self.replicas if replica.healthy)
+        logger.info(f"🏢 대피소 DB 읽기 복제본 {healthy}/{len(self.replicas)}개 사용 가능")
+    
+    async def stop(self):
+        """헬스 체크 중단 및 복제본 연결 해제"""
+        if self._health_task:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except asyncio.CancelledError:
+                pass
+            self._health_task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+# 대피소 DB 읽기 복제본 풀 (SHELTER_DB_REPLICA_URLS가 비어 있으면 항상 primary 사용)
+shelter_replicas = ShelterReplicaPool(settings.shelter_db_replica_urls)
+
+
+def _pool_stats(engine: AsyncEngine) -> Dict[str, Any]:
+    """커넥션 풀 사용률"""
+    pool = engine.sync_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"pool": type(pool).__name__}
+    
+    capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "checked_out": checked_out,
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "utilization": round(checked_out / capacity, 3) if capacity else None
+    }
+
+
+def shelter_pool_metrics() -> Dict[str, Any]:
+    """대피소 DB primary/복제본 커넥션 풀 지표 (헬스체크용)"""
+    return {
+        "primary": _pool_stats(shelter_engine),
+        "replicas": [
+            {
+                "name": replica.name,
+                "healthy": replica.healthy,
+                "last_error": replica.last_error,
+                **_pool_stats(replica.engine)
+            }
+            for replica in shelter_replicas.replicas
+        ]
+    }
+
+
 def log_shelter_db_info():
     """대피소 DB 연결 정보 로깅 (startup 시 호출)"""
     if _using_local_shelter_db:
@@ -64,6 +215,9 @@ def log_shelter_db_info():
         )
     else:
         logger.info("🏢 기본 DB를 대피소 DB로 사용")
+    
+    for replica in shelter_replicas.replicas:
+        logger.info(f"🏢 대피소 DB 읽기 복제본: {replica.name}")
         
 
 async def get_db() -> AsyncSession:
@@ -100,4 +254,71 @@ async def get_shelter_db() -> AsyncSession:
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+# 복제본을 라우팅에서 제외할 연결 오류
+SHELTER_CONNECTION_ERRORS = (OperationalError, InterfaceError, OSError)
+
+# 읽기 세션이 연결된 복제본 (session.info 키, primary면 없음)
+_REPLICA_INFO_KEY = "shelter_replica"
+
+
+@asynccontextmanager
+async def shelter_read_session() -> AsyncIterator[AsyncSession]:
+    """
+    대피소 읽기 전용 세션 (복제본 라운드로빈, 없으면 primary)
+    
+    연결 오류가 나면 해당 복제본을 다음 헬스 체크 전까지 제외한다.
+    쿼리는 execute_shelter_read()로 실행해야 다른 복제본/primary로 재시도된다.
+    쓰기(import, 분류)는 ShelterAsyncSessionLocal(primary)을 사용해야 한다.
+    """
+    replica, session_factory = shelter_replicas.acquire()
+    async with session_factory() as session:
+        if replica is not None:
+            session.info[_REPLICA_INFO_KEY] = replica
+        try:
+            yield session
+        except SHELTER_CONNECTION_ERRORS as e:
+            if replica is not None:
+                shelter_replicas.mark_unhealthy(replica, e)
+            raise
+
+
+async def execute_shelter_read(session: AsyncSession, statement, params=None):
+    """
+    대피소 읽기 쿼리 실행 (복제본 장애 시 1회 재시도)
+    
+    세션의 복제본에서 연결 오류가 나면 그 복제본을 즉시 제외하고, 다른 건강한
+    복제본(없으면 primary)의 새 세션에서 한 번 더 실행한다. 이미 제외된 복제본의
+    세션이면 바로 대체 경로로 실행한다. 결과는 미리 버퍼링되므로 세션이 닫힌 뒤에도 읽을 수 있다.
+    """
+    replica = session.info.get(_REPLICA_INFO_KEY)
+    if replica is None or replica.healthy:
+        try:
+            return await session.execute(statement, params)
+        except SHELTER_CONNECTION_ERRORS as e:
+            if replica is None:
+                raise
+            shelter_replicas.mark_unhealthy(replica, e)
+            logger.warning(f"대피소 읽기 재시도 (복제본 {replica.name} 연결 오류)")
+    
+    next_replica, session_factory = shelter_replicas.acquire()
+    async with session_factory() as retry_session:
+        try:
+            return await retry_session.execute(statement, params)
+        except SHELTER_CONNECTION_ERRORS as e:
+            if next_replica is not None:
+                shelter_replicas.mark_unhealthy(next_replica, e)
+            raise
+
+
+async def get_shelter_read_db() -> AsyncSession:
+    """
+    대피소 읽기 전용 데이터베이스 세션 의존성 (검색 API용)
+    
+    Yields:
+        AsyncSession: 복제본(또는 primary) 비동기 DB 세션
+    """
+    async with shelter_read_session() as session:
+        yield session
@@ -1,6 +1,7 @@
 """
 Firebase Cloud Messaging 푸시 알림 클라이언트
 """
+import asyncio
 import logging
 from typing import Optional, Dict, List
 from datetime import datetime
@@ -122,7 +123,8 @@ class FCMClient:
             )
             
             # 메시지 발송
-            response = messaging.send(message)
+            # 동기 HTTP 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            response = await asyncio.to_thread(messaging.send, message)
             logger.info(f"FCM message sent successfully: {response}")
             return True
             
@@ -95,4 +95,69 @@ async def get_batch_coordinates(
     success_count = sum(1 for v in results.values() if v is not None)
     logger.info(f"✅ 좌표 변환 완료: {success_count}/{len(addresses)}건 성공")
     
-    return results
\ No newline at end of file
+    return results
+
+# 역지오코딩 결과에서 행정구역 경로로 이어 붙일 주소 구성요소 (상위 → 하위)
+ADMIN_COMPONENT_TYPES = (
+    "administrative_area_level_1",
+    "administrative_area_level_2",
+    "locality",
+    "sublocality_level_1",
+)
+
+
+def admin_region_from_geocode(data: Dict) -> Optional[str]:
+    """
+    역지오코딩 응답에서 행정구역 문자열 추출
+
+    예: 경기도 / 안산시 / 단원구 구성요소 → "경기도 안산시 단원구"
+    """
+    if data.get("status") != "OK" or not data.get("results"):
+        return None
+    components = data["results"][0].get("address_components", [])
+    names = []
+    for component_type in ADMIN_COMPONENT_TYPES:
+        for component in components:
+            if component_type in component.get("types", []):
+                name = component.get("long_name")
+                if name and name not in names:
+                    names.append(name)
+                break
+    return " ".join(names) or None
+
+
+async def get_admin_region_from_coordinates(latitude: float, longitude: float) -> Optional[str]:
+    """
+    Google Maps Geocoding API로 좌표 → 행정구역 변환 (역지오코딩)
+
+    Returns:
+        "경기도 안산시 단원구" 형식의 행정구역 문자열 또는 None
+    """
+    if not settings.GOOGLE_MAPS_API_KEY:
+        logger.warning("⚠️  Google Maps API 키가 설정되지 않음")
+        return None
+
+    try:
+        params = {
+            "latlng": f"{latitude},{longitude}",
+            "key": settings.GOOGLE_MAPS_API_KEY,
+            "language": "ko",
+            "result_type": "sublocality_level_1|locality|administrative_area_level_1"
+        }
+
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(settings.GOOGLE_GEOCODING_API_URL, params=params)
+            response.raise_for_status()
+            data = response.json()
+
+        region = admin_region_from_geocode(data)
+        if region is None:
+            logger.warning(f"⚠️  행정구역 변환 실패: ({latitude}, {longitude}), status={data.get('status')}")
+        return region
+
+    except httpx.TimeoutException:
+        logger.error(f"❌ Google Maps API 타임아웃: ({latitude}, {longitude})")
+        return None
+    except Exception as e:
+        logger.error(f"❌ Google Maps API 오류: {e}")
+        return None
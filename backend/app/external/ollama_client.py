@@ -0,0 +1,143 @@
+"""
+Ollama API 클라이언트 (연결 풀 + 동시 요청 제한)
+
+Ollama 서버는 한 대뿐이라 동시에 너무 많은 생성 요청을 보내면 모든 요청이 함께
+느려지다 타임아웃된다. 프로세스 전체가 이 클라이언트 하나를 공유하며
+
+- keep-alive 연결 풀을 재사용하고
+- 동시에 보내는 요청을 OLLAMA_MAX_CONCURRENCY개로 제한한다.
+- 슬롯을 기다리는 요청은 OLLAMA_MAX_QUEUE개까지만 받고, 넘치면 바로 거절한다.
+- 기다리는 동안 요청의 마감 시각(deadline)이 지나면 보내지 않고 바로 실패한다.
+"""
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaOverloadedError(RuntimeError):
+    """대기열이 가득 찼거나 마감 시각 안에 요청 슬롯을 얻지 못함"""
+
+
+class OllamaClient:
+    """동시 요청 수를 제한하는 공유 Ollama 클라이언트"""
+
+    def __init__(
+        self,
+        endpoint: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        timeout: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.endpoint = endpoint or settings.OLLAMA_ENDPOINT
+        self.max_concurrency = max_concurrency or settings.OLLAMA_MAX_CONCURRENCY
+        self.max_queue = settings.OLLAMA_MAX_QUEUE if max_queue is None else max_queue
+        self.timeout = timeout or settings.OLLAMA_TIMEOUT
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.http_client: Optional[httpx.AsyncClient] = None
+
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.completed = 0
+        self.errors = 0
+        self.rejected = 0
+        self.deadline_exceeded = 0
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """동시 요청 수만큼 keep-alive 연결을 유지하는 클라이언트"""
+        return httpx.AsyncClient(
+            base_url=self.endpoint,
+            timeout=self.timeout,
+            transport=self._transport,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            )
+        )
+
+    async def generate(self, payload: Dict, deadline: Optional[float] = None) -> httpx.Response:
+        """
+        /api/generate 호출
+
+        Args:
+            payload: Ollama 요청 본문
+            deadline: 마감 시각 (이벤트 루프 시각, loop.time() 기준). 없으면 timeout 뒤
+
+        Raises:
+            OllamaOverloadedError: 대기열이 가득 찼거나 슬롯을 기다리다 마감 시각이 지남
+            httpx.HTTPError: 요청 실패 (응답 대기는 마감 시각까지로 제한)
+        """
+        loop = asyncio.get_running_loop()
+        if deadline is None:
+            deadline = loop.time() + self.timeout
+
+        # 처리 중 + 대기 중 요청이 슬롯 수 + 대기열 크기를 넘으면 거절
+        if self.in_flight + self.queue_depth >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise OllamaOverloadedError(
+                f"Ollama 요청 대기열이 가득 찼습니다 (대기 {self.queue_depth}, 처리 중 {self.in_flight})"
+            )
+
+        self.queue_depth += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            self.deadline_exceeded += 1
+            raise OllamaOverloadedError("Ollama 요청 슬롯을 기다리다 마감 시각이 지났습니다")
+        finally:
+            self.queue_depth -= 1
+
+        self.in_flight += 1
+        try:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                raise OllamaOverloadedError("Ollama 요청 슬롯을 기다리다 마감 시각이 지났습니다")
+
+            if self.http_client is None:
+                self.http_client = self._create_http_client()
+            response = await self.http_client.post(
+                "/api/generate",
+                json=payload,
+                timeout=min(self.timeout, remaining)
+            )
+            self.completed += 1
+            return response
+        except OllamaOverloadedError:
+            raise
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        """대기열 깊이 / 처리 중 요청 수 및 누적 카운터"""
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "completed": self.completed,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "deadline_exceeded": self.deadline_exceeded
+        }
+
+    async def close(self):
+        """연결 풀 정리"""
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
+
+
+# 싱글톤 인스턴스
+ollama_client = OllamaClient()
@@ -1,8 +1,8 @@
 """
 재난 모델
 """
-from sqlalchemy import Column, String, DateTime, Text, Integer
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, Text, Integer, Index
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from datetime import datetime
 import uuid
 from geoalchemy2 import Geography
@@ -19,6 +19,8 @@ class Disaster(Base):
     msg_id = Column(String(255), unique=True, nullable=False, index=True)  # 재난문자 고유 ID
     disaster_type = Column(String(100), nullable=False, index=True)  # '호우', '지진', '태풍' 등
     location = Column(String(255), nullable=False)  # 발생 지역
+    # 수신 지역을 해석한 행정구역 경로 목록 ('경기도 안산시 단원구', 전국이면 ['전국'], 해석 실패 시 NULL)
+    region_codes = Column(ARRAY(String(255)), nullable=True)
     message = Column(Text, nullable=False)  # 원본 재난문자
     
     # 공간 정보 (PostGIS)
@@ -33,6 +35,10 @@ class Disaster(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index("idx_disasters_region_codes", "region_codes", postgresql_using="gin"),
+    )
+    
     def __repr__(self):
         return f"<Disaster {self.disaster_type} at {self.location}>"
 
@@ -1,23 +1,58 @@
 """
 대피소 모델
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
+from typing import Optional
 import uuid
 
 from ..db.session import Base
 
 
+# 정규화된 대피소 분류 → 해당 분류로 판정하는 대피소 유형 문자열
+# (app/db/migrations/002_shelters_category.sql의 CASE 순서와 동일하게 유지)
+SHELTER_CATEGORIES = {
+    "민방위": "민방위대피소",
+    "지진": "지진대피소",
+    "해일": "해일대피소",
+    "기타": "기타대피소"
+}
+
+
+def shelter_category_of(shelter_type: Optional[str]) -> Optional[str]:
+    """
+    대피소 유형 문자열을 정규화된 분류로 변환
+
+    Args:
+        shelter_type: 대피소 유형 (앞뒤 공백 허용)
+
+    Returns:
+        민방위/지진/해일/기타 중 하나 (해당 없으면 None)
+    """
+    normalized = (shelter_type or "").strip()
+    for category, type_name in SHELTER_CATEGORIES.items():
+        if type_name in normalized:
+            return category
+    return None
+
+
 class Shelter(Base):
     """대피소 정보 모델"""
     __tablename__ = "shelters"
+    __table_args__ = (
+        # 반경 검색 bounding box 선필터용 복합 인덱스 (shelters.sql 덤프에 이미 있는 인덱스)
+        Index("idx_shelters_coords", "latitude", "longitude"),
+        # 분류별 반경 검색용 (분류 동등 조건 + 위도 범위)
+        Index("idx_shelters_category_lat_lng", "shelter_category", "latitude", "longitude"),
+    )
     
     # 기본 정보
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, index=True, comment="대피소 이름")
     address = Column(String(512), nullable=False, comment="주소")
     shelter_type = Column(String(100), nullable=False, index=True, comment="대피소 유형")
+    shelter_category = Column(String(20), nullable=True, comment="정규화된 대피소 분류 (민방위/지진/해일/기타)")
     
     # 좌표 정보 (PostGIS 제거, 일반 Float 사용)
     latitude = Column(Float, nullable=True, index=True, comment="위도")
@@ -50,6 +85,7 @@ class Shelter(Base):
             "name": self.name,
             "address": self.address,
             "shelter_type": self.shelter_type,
+            "shelter_category": self.shelter_category,
             "latitude": self.latitude,
             "longitude": self.longitude,
             "capacity": self.capacity,
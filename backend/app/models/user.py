@@ -1,7 +1,8 @@
 """
 사용자 모델
 """
-from sqlalchemy import Column, String, DateTime, Integer, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Boolean, Index
+from sqlalchemy.orm import validates
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 import uuid
@@ -31,11 +32,28 @@ class User(Base):
     # 위치 (세션 단위만 보관, 1시간 TTL)
     location = Column(Geography(geometry_type='POINT', srid=4326), nullable=True)
     admin_region = Column(String(255), nullable=True)  # '서울시 영등포구' 등
+    region_path = Column(String(255), nullable=True)  # 정규화된 행정구역 경로 ('서울특별시 영등포구'), 알림 대상 조회용
     
     # 타임스탬프
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __table_args__ = (
+        Index(
+            "idx_users_region_path",
+            "region_path",
+            postgresql_ops={"region_path": "text_pattern_ops"},
+            postgresql_where=(is_active == True)
+        ),
+    )
+    
+    @validates("admin_region")
+    def _sync_region_path(self, key, value):
+        """admin_region이 바뀌면 region_path도 정규화해서 함께 갱신"""
+        from ..services.region_targeting import normalize_region
+        self.region_path = normalize_region(value)
+        return value
+    
     def __repr__(self):
         return f"<User {self.device_id}>"
 
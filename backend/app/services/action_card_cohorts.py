@@ -0,0 +1,68 @@
+"""
+대량 알림용 코호트 단위 행동카드 생성
+
+재난 한 건의 알림 대상 중 프롬프트 입력(대피소, 거리 구간, 건강 권고)이 같은
+사용자들을 하나의 코호트로 보고 행동카드를 한 번만 생성해 공유한다.
+LLM 호출 수가 사용자 수가 아니라 서로 다른 코호트 수로 줄어든다.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from ..api.v1.schemas.shelter import ShelterInfo
+from .llm_service import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+class ActionCardCohorts:
+    """재난 한 건 동안 코호트별 행동카드를 한 번만 생성"""
+
+    def __init__(self, llm_service: LLMService, disaster_type: str, location: str):
+        self.llm_service = llm_service
+        self.disaster_type = disaster_type
+        self.location = location
+        self._cards: Dict[tuple, asyncio.Task] = {}
+        self._requests = 0
+
+    async def card_for(self, user_profile: Dict, shelters: List[ShelterInfo]) -> Tuple[str, str]:
+        """
+        사용자의 코호트 행동카드 (처음 요청한 사용자가 생성하고, 같은 코호트는 그 결과를 기다림)
+
+        Returns:
+            (행동카드 텍스트, 생성 방법: 'llm' 또는 'fallback')
+        """
+        self._requests += 1
+        key = self.llm_service.cohort_key(self.disaster_type, user_profile, shelters)
+
+        task = self._cards.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate(user_profile, shelters))
+            self._cards[key] = task
+
+        # 한 사용자의 취소가 코호트 전체 생성을 취소하지 않도록 보호
+        return await asyncio.shield(task)
+
+    async def _generate(self, user_profile: Dict, shelters: List[ShelterInfo]) -> Tuple[str, str]:
+        # 코호트 전체가 같은 카드를 쓰므로 거리는 구간 값으로 표시
+        if shelters:
+            nearest = shelters[0].model_copy(update={
+                "distance_km": self.llm_service.bucket_distance_km(shelters[0].distance_km)
+            })
+            shelters = [nearest] + list(shelters[1:])
+
+        try:
+            return await self.llm_service.generate_action_card(
+                disaster_type=self.disaster_type,
+                location=self.location,
+                user_profile=user_profile,
+                shelters=shelters
+            )
+        except Exception as e:
+            # 코호트 전체가 알림을 못 받는 일이 없도록 기본 템플릿 사용
+            logger.error(f"Cohort action card generation failed, using fallback: {str(e)}")
+            return self.llm_service._get_fallback_template(self.disaster_type, shelters), "fallback"
+
+    def stats(self) -> Dict[str, int]:
+        """요청 수 대비 실제 생성 수"""
+        return {"requests": self._requests, "cohorts": len(self._cards)}
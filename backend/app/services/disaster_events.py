@@ -0,0 +1,194 @@
+"""
+새 재난 이벤트 실시간 전달 (Redis pub/sub → SSE 구독자)
+
+폴러가 새 재난을 저장하면 Redis 채널로 발행하고, 각 워커는 채널을 한 번만 구독해
+자기 프로세스에 붙은 SSE 클라이언트 큐로 나눠 준다. 연결된 클라이언트가 많아도
+Redis 구독은 워커당 하나이고, 대기 중인 클라이언트는 큐에서 기다리기만 한다.
+
+- 클라이언트는 지역(경로 집합)으로 구독할 수 있다. 전국 대상이거나 지역을 해석하지
+  못한 재난은 누락보다 과다 전달이 안전하므로 모든 구독자에게 보낸다.
+- 느린 클라이언트의 큐가 차면 가장 오래된 이벤트를 버린다 (다른 구독자는 영향 없음).
+- Redis를 쓸 수 없으면 같은 프로세스의 구독자에게만 전달한다.
+"""
+import asyncio
+import json
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, FrozenSet, Iterable, Optional, Set
+
+import redis.asyncio as aioredis
+
+from ..core.config import settings
+from .region_parser import NATIONWIDE_NAME
+from .region_targeting import region_ancestors
+
+logger = logging.getLogger(__name__)
+
+
+def disaster_event(disaster) -> Dict:
+    """Disaster 행 → 구독자에게 보낼 이벤트"""
+    return {
+        "id": str(disaster.id),
+        "msg_id": disaster.msg_id,
+        "disaster_type": disaster.disaster_type,
+        "location": disaster.location,
+        "region_codes": list(disaster.region_codes) if disaster.region_codes else None,
+        "message": disaster.message,
+        "severity": disaster.severity,
+        "issued_at": disaster.issued_at.isoformat() if disaster.issued_at else None
+    }
+
+
+def region_matches(regions: Optional[FrozenSet[str]], event_codes: Optional[Iterable[str]]) -> bool:
+    """
+    구독 지역과 재난 지역이 겹치는지 확인
+
+    한쪽이 다른 쪽의 상위 행정구역이면 겹친다고 본다.
+    예: 구독 "경기도 안산시" ↔ 재난 "경기도 안산시 단원구", 구독 "경기도 안산시 단원구" ↔ 재난 "경기도"
+    """
+    if regions is None or not event_codes or NATIONWIDE_NAME in event_codes:
+        return True
+    for code in event_codes:
+        for region in regions:
+            if code in region_ancestors(region) or region in region_ancestors(code):
+                return True
+    return False
+
+
+class _Subscription:
+    """SSE 클라이언트 한 명의 구독 (지역 필터 + 이벤트 큐)"""
+
+    def __init__(self, regions: Optional[FrozenSet[str]], queue_size: int):
+        self.regions = regions
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, event: Dict) -> bool:
+        """구독 지역에 해당하면 큐에 넣음"""
+        if not region_matches(self.regions, event.get("region_codes")):
+            return False
+        if self.queue.full():
+            # 느린 클라이언트는 가장 오래된 이벤트부터 버림
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(event)
+        return True
+
+
+class DisasterEventBroker:
+    """새 재난 이벤트 발행 및 워커 내 구독자 분배"""
+
+    def __init__(self):
+        self.redis_client: Optional[aioredis.Redis] = None
+        self.channel = settings.DISASTER_STREAM_CHANNEL
+        self.queue_size = settings.DISASTER_STREAM_QUEUE_SIZE
+        self._subscriptions: Set[_Subscription] = set()
+        self._listen_task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.delivered = 0
+
+    async def initialize_redis(self):
+        """Redis 연결 및 채널 구독 시작 (연결 실패 시 프로세스 내 전달만)"""
+        try:
+            client = await aioredis.from_url(
+                settings.REDIS_URL,
+                encoding="utf-8",
+                decode_responses=True
+            )
+            await client.ping()
+            self.redis_client = client
+            logger.info(f"Disaster event broker initialized (채널: {self.channel})")
+        except Exception as e:
+            logger.error(f"Failed to initialize disaster event Redis: {str(e)}")
+            self.redis_client = None
+            return
+
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._listen_loop())
+
+    async def publish(self, event: Dict):
+        """모든 워커의 구독자에게 이벤트 발행"""
+        self.published += 1
+        if self.redis_client is not None:
+            try:
+                await self.redis_client.publish(self.channel, json.dumps(event, ensure_ascii=False))
+                return
+            except Exception as e:
+                logger.error(f"Disaster event publish error: {str(e)}")
+        # Redis 없이 동작 중이면 이 프로세스 구독자에게만 전달
+        self._dispatch(event)
+
+    @asynccontextmanager
+    async def subscribe(self, regions: Optional[FrozenSet[str]] = None) -> AsyncIterator[asyncio.Queue]:
+        """
+        이벤트 구독 (컨텍스트를 벗어나면 해제)
+
+        Args:
+            regions: 구독할 지역 경로 집합 (None이면 전체)
+        """
+        subscription = _Subscription(regions, self.queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription.queue
+        finally:
+            self._subscriptions.discard(subscription)
+            if subscription.dropped:
+                logger.warning(f"Slow disaster stream client dropped {subscription.dropped} events")
+
+    async def _listen_loop(self):
+        while True:
+            pubsub = self.redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    try:
+                        event = json.loads(message["data"])
+                    except ValueError:
+                        logger.warning(f"잘못된 재난 이벤트: {message['data']}")
+                        continue
+                    self._dispatch(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Disaster event listener error: {str(e)}")
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+            logger.warning("재난 이벤트 구독이 끊어졌습니다. 재연결합니다.")
+            await asyncio.sleep(5)
+
+    def _dispatch(self, event: Dict):
+        for subscription in list(self._subscriptions):
+            if subscription.offer(event):
+                self.delivered += 1
+
+    def stats(self) -> Dict:
+        """구독자 수 및 발행/전달 카운터"""
+        return {
+            "redis": self.redis_client is not None,
+            "subscribers": len(self._subscriptions),
+            "published": self.published,
+            "delivered": self.delivered
+        }
+
+    async def close(self):
+        """리소스 정리"""
+        if self._listen_task:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except asyncio.CancelledError:
+                pass
+            self._listen_task = None
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+
+# 싱글톤 인스턴스
+disaster_events = DisasterEventBroker()
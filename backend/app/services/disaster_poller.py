@@ -3,7 +3,10 @@
 """
 import httpx
 import asyncio
-from typing import List, Dict, Optional
+import importlib.util
+import time
+from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple
 import logging
 from datetime import datetime
 import redis.asyncio as aioredis
@@ -12,6 +15,51 @@ from ..core.config import settings
 
 logger = logging.getLogger(__name__)
 
+WATERMARK_KEY = "disaster:watermark"
+
+# 마지막 폴링 실패 원인 (DisasterPoller.last_poll_error)
+POLL_ERROR_TIMEOUT = "timeout"
+POLL_ERROR_SERVER = "server_error"  # 5xx 또는 연결 실패
+POLL_ERROR_OTHER = "error"  # 4xx, 응답 형식 오류 등
+
+# 워터마크(일련번호 sn, 생성 일시 crt_dt)를 더 큰 값으로만 갱신하고 현재 값을 반환
+_ADVANCE_WATERMARK_LUA = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'sn') or '-1')
+if tonumber(ARGV[1]) > current then
+    redis.call('HSET', KEYS[1], 'sn', ARGV[1], 'crt_dt', ARGV[2])
+    return ARGV[1]
+end
+return tostring(current)
+"""
+
+
+@dataclass
+class ResumeCursor:
+    """
+    페이지 상한에 걸려 다 읽지 못한 구간 (워터마크 ~ sn 사이가 아직 남음)
+
+    top: 지금까지 본 가장 최신 일련번호
+    sn: 지금까지 읽은 가장 오래된 일련번호 (다음에는 이보다 오래된 것부터)
+    depth: 최신(top)부터 sn까지의 행 수 (다음 폴링에서 이어 읽을 페이지 위치)
+    """
+    top: int
+    sn: int
+    depth: int
+
+
+@dataclass
+class PendingProgress:
+    """
+    아직 반영하지 않은 폴링 결과
+
+    반환한 재난문자가 저장되기 전에 워터마크를 올리면 저장 실패 시 다시 읽을 수 없으므로
+    commit()이 호출될 때까지 들고 있는다.
+    """
+    disasters: List[Dict]
+    resume: Optional[ResumeCursor]
+    previous: Optional[ResumeCursor]
+    validators: Optional[Tuple[Optional[str], Optional[str]]]  # 첫 페이지 응답의 (ETag, Last-Modified)
+
 
 class DisasterPoller:
     """재난문자 폴링 서비스"""
@@ -21,10 +69,56 @@ class DisasterPoller:
         self.api_key = settings.DISASTER_API_KEY
         self.timeout = settings.DISASTER_API_TIMEOUT
         self.redis_client: Optional[aioredis.Redis] = None
-        self.cache_ttl = settings.REDIS_CACHE_TTL
+        self.page_size = settings.DISASTER_API_PAGE_SIZE
+        self.probe_rows = settings.DISASTER_API_PROBE_ROWS
+        self.max_pages = settings.DISASTER_API_MAX_PAGES
+        
+        # 마지막으로 처리한 재난문자 일련번호 (이 번호까지는 빠짐없이 읽음, Redis에 영속화)
+        self._watermark: Optional[int] = None
+        # 폭주로 다 읽지 못한 구간의 이어 읽기 위치 (Redis에 영속화)
+        self._resume: Optional[ResumeCursor] = None
+        # 저장이 끝나면 반영할 마지막 폴링 결과 (commit()에서 워터마크/이어 읽기 위치 갱신)
+        self._pending: Optional[PendingProgress] = None
+        
+        # 폴링마다 연결을 새로 맺지 않도록 keep-alive 클라이언트를 유지
+        self.http_client: Optional[httpx.AsyncClient] = None
+        
+        # 조건부 요청 (서버가 ETag / Last-Modified를 주는 경우에만 사용)
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_validators: Optional[Tuple[Optional[str], Optional[str]]] = None
+        
+        # 폴링 지연 통계 (지연은 폴링 한 번 전체 - 페이지 요청 + 워터마크 조회 - 기준)
+        self._poll_count = 0
+        self._request_count = 0
+        self._not_modified_count = 0
+        self._error_count = 0
+        self._latency_total_ms = 0.0
+        self._latency_max_ms = 0.0
+        self._latency_last_ms: Optional[float] = None
+        self._http_version: Optional[str] = None
+        
+        # 마지막 폴링 실패 원인 (성공이면 None, 폴링 주기 조절에 사용)
+        self.last_poll_error: Optional[str] = None
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """keep-alive HTTP 클라이언트 생성 (h2 패키지가 있으면 HTTP/2 사용)"""
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=4,
+                max_keepalive_connections=2,
+                # 폴링 간격보다 길게 유지해야 다음 폴링에서 연결이 재사용됨
+                keepalive_expiry=max(30.0, settings.DISASTER_POLL_INTERVAL_SECONDS * 3)
+            )
+        )
     
     async def initialize_redis(self):
-        """Redis 클라이언트 초기화"""
+        """Redis 및 HTTP 클라이언트 초기화"""
+        if self.http_client is None:
+            self.http_client = self._create_http_client()
+        
         try:
             self.redis_client = await aioredis.from_url(
                 settings.REDIS_URL,
@@ -40,83 +134,376 @@ class DisasterPoller:
         """
         행정안전부 API에서 재난문자 폴링
         
+        마지막으로 처리한 재난문자 일련번호(워터마크) 이후의 메시지만 가져온다.
+        API는 최신순으로 응답하므로, 평시에는 작은 첫 페이지만 확인하고
+        첫 페이지가 모두 새 메시지면(폭주) 워터마크에 닿을 때까지 페이지를 넘긴다.
+        폴링 한 번에 DISASTER_API_MAX_PAGES를 넘으면 워터마크는 그대로 두고,
+        다음 폴링부터 읽다 만 위치에서 이어서 워터마크까지 내려간다.
+        
+        반환한 재난문자를 저장한 뒤 commit()을 호출해야 워터마크가 올라간다
+        (호출하지 않으면 다음 폴링이 같은 구간을 다시 읽음, 중복 저장은 DB가 걸러냄).
+        
         Returns:
             새로운 재난문자 리스트
         """
+        started = time.perf_counter()
         try:
-            params = {
-                "serviceKey": self.api_key,
-                "pageNo": 1,
-                "numOfRows": 50,
-                "type": "json"
-            }
+            return await self._poll()
+        finally:
+            self._record_latency((time.perf_counter() - started) * 1000)
+    
+    async def _poll(self) -> List[Dict]:
+        self.last_poll_error = None
+        self._pending = None
+        self._fetched_validators = None
+        try:
+            watermark = await self._load_watermark()
+            previous = self._resume
+            resume = None
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.api_url, params=params)
+            if watermark is None:
+                # 최초 실행: 과거 이력 전체가 아니라 최신 한 페이지만 기준으로 삼음
+                disasters = await self._fetch_page(1, self.page_size, conditional=True)
+            else:
+                disasters, resume = await self._fetch_since(watermark)
+                disasters = [
+                    disaster for disaster in disasters
+                    if self._sequence_of(disaster) is None or self._sequence_of(disaster) > watermark
+                ]
             
-            if response.status_code != 200:
-                logger.error(f"Disaster API error: {response.status_code}")
+            self._pending = PendingProgress(disasters, resume, previous, self._fetched_validators)
+            if not disasters:
+                # 저장할 것이 없으면 바로 반영
+                await self.commit()
                 return []
             
-            data = response.json()
-            
-            # API 응답 구조에 따라 수정 필요
-            disasters = data.get('DisasterMsg', [])
-            if isinstance(disasters, dict):
-                disasters = disasters.get('row', [])
+            logger.info(f"Found {len(disasters)} new disasters")
+            return disasters
             
-            # 새로운 재난만 필터링
-            new_disasters = []
-            for disaster in disasters:
-                msg_id = disaster.get('MD101_SN', str(disaster.get('create_date', '')))
-                
-                # Redis 캐시 확인
-                if await self._is_new_disaster(msg_id):
-                    new_disasters.append(disaster)
-                    await self._cache_disaster(msg_id)
-            
-            if new_disasters:
-                logger.info(f"Found {len(new_disasters)} new disasters")
-            
-            return new_disasters
-            
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, httpx.TimeoutException):
             logger.warning("Disaster API timeout")
+            self._error_count += 1
+            self.last_poll_error = POLL_ERROR_TIMEOUT
+            return []
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Disaster API error: {e.response.status_code}")
+            self._error_count += 1
+            self.last_poll_error = (
+                POLL_ERROR_SERVER if e.response.status_code >= 500 else POLL_ERROR_OTHER
+            )
+            return []
+        except httpx.TransportError as e:
+            logger.error(f"Disaster API connection error: {str(e)}")
+            self._error_count += 1
+            self.last_poll_error = POLL_ERROR_SERVER
             return []
         except Exception as e:
             logger.error(f"Error polling disasters: {str(e)}")
+            self._error_count += 1
+            self.last_poll_error = POLL_ERROR_OTHER
             return []
     
-    async def _is_new_disaster(self, msg_id: str) -> bool:
-        """재난문자가 새로운 것인지 확인 (Redis 캐시)"""
-        if not self.redis_client:
-            return True
+    async def commit(self):
+        """
+        마지막 폴링 결과를 처리 완료로 반영 (반환한 재난문자를 저장한 뒤 호출)
+        
+        워터마크, 이어 읽기 위치, 조건부 요청 검증값을 이때 갱신한다.
+        """
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        if pending.validators is not None:
+            self._etag, self._last_modified = pending.validators
+        await self._save_progress(pending.disasters, pending.resume, pending.previous)
+    
+    async def _fetch_since(self, watermark: int) -> Tuple[List[Dict], Optional[ResumeCursor]]:
+        """
+        워터마크 이후 메시지 조회 (평시 작은 첫 페이지, 폭주 시 워터마크까지 페이지 이동)
+        
+        Returns:
+            (새 메시지, 아직 다 읽지 못한 구간 - 워터마크까지 닿았으면 None)
+        """
+        resume = self._resume
+        # 이어 읽을 구간이 있으면 최신 쪽은 resume.top까지만 읽으면 됨
+        floor = resume.top if resume else watermark
+        
+        rows = await self._fetch_page(1, self.probe_rows, conditional=True)
+        pages_left = self.max_pages
+        reached = True
+        if not self._reaches(rows, floor) and len(rows) == self.probe_rows:
+            rows, pages_used, reached = await self._walk(1, floor, self.max_pages)
+            pages_left -= pages_used
+        
+        top_rows = [row for row in rows if self._is_after(row, floor)]
+        
+        if not reached:
+            oldest = min(self._sequences(top_rows), default=floor)
+            if resume:
+                logger.error(
+                    f"Disaster API burst exceeded {self.max_pages} pages again; "
+                    f"messages between {watermark} and {resume.sn} may be missing"
+                )
+            else:
+                logger.warning(
+                    f"Disaster API burst exceeded {self.max_pages} pages; "
+                    f"continuing below {oldest} on the next poll"
+                )
+            return top_rows, ResumeCursor(
+                top=max(self._sequences(top_rows), default=floor),
+                sn=oldest,
+                depth=len(rows)
+            )
+        
+        if resume is None:
+            return top_rows, None
+        
+        # 새로 들어온 메시지 수만큼 이어 읽을 위치가 뒤로 밀림
+        top = max(self._sequences(top_rows), default=resume.top)
+        depth = resume.depth + len(top_rows)
+        gap_rows, resume = await self._continue_gap(
+            ResumeCursor(top=top, sn=resume.sn, depth=depth), watermark, pages_left
+        )
+        return top_rows + gap_rows, resume
+    
+    async def _continue_gap(
+        self,
+        resume: ResumeCursor,
+        watermark: int,
+        pages_left: int
+    ) -> Tuple[List[Dict], Optional[ResumeCursor]]:
+        """다 읽지 못한 구간을 resume.depth 위치부터 워터마크까지 이어서 조회"""
+        page_no = (resume.depth - 1) // self.page_size + 1 if resume.depth > 0 else 1
+        collected: List[Dict] = []
+        overlapped = False
         
+        while pages_left > 0:
+            page = await self._fetch_page(page_no, self.page_size)
+            pages_left -= 1
+            
+            # 위치가 예상보다 앞당겨져(삭제 등) resume.sn을 건너뛰었으면 한 페이지 앞부터
+            if not overlapped and page_no > 1 and page and all(
+                sequence < resume.sn for sequence in self._sequences(page)
+            ):
+                page_no -= 1
+                continue
+            overlapped = True
+            
+            collected.extend(row for row in page if self._is_between(row, watermark, resume.sn))
+            if self._reaches(page, watermark) or len(page) < self.page_size:
+                logger.info(f"Disaster API backlog caught up to watermark {watermark}")
+                return collected, None
+            page_no += 1
+        
+        return collected, ResumeCursor(
+            top=resume.top,
+            sn=min(self._sequences(collected), default=resume.sn),
+            depth=(page_no - 1) * self.page_size
+        )
+    
+    async def _walk(self, start_page: int, floor: int, max_pages: int) -> Tuple[List[Dict], int, bool]:
+        """
+        floor 이하 메시지에 닿을 때까지 페이지 이동
+        
+        Returns:
+            (조회한 행, 사용한 페이지 수, floor 또는 마지막 페이지에 닿았는지)
+        """
+        collected: List[Dict] = []
+        for pages_used, page_no in enumerate(range(start_page, start_page + max_pages), 1):
+            page = await self._fetch_page(page_no, self.page_size)
+            collected.extend(page)
+            if self._reaches(page, floor) or len(page) < self.page_size:
+                return collected, pages_used, True
+        return collected, max_pages, False
+    
+    async def _fetch_page(self, page_no: int, num_rows: int, conditional: bool = False) -> List[Dict]:
+        """
+        재난문자 한 페이지 조회
+        
+        conditional이면 지난 응답의 ETag / Last-Modified로 조건부 요청을 보내고,
+        304(변경 없음)는 빈 목록으로 처리한다. 새 검증값은 commit() 때 반영한다.
+        
+        Raises:
+            httpx.HTTPStatusError: 200/304 이외의 응답 (중간 페이지 누락 시 워터마크를 올리지 않도록)
+        """
+        params = {
+            "serviceKey": self.api_key,
+            "pageNo": page_no,
+            "numOfRows": num_rows,
+            "type": "json"
+        }
+        
+        headers = {}
+        if conditional:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+        
+        if self.http_client is None:
+            self.http_client = self._create_http_client()
+        
+        self._request_count += 1
+        response = await self.http_client.get(self.api_url, params=params, headers=headers)
+        self._http_version = response.http_version
+        
+        if response.status_code == 304:
+            # 지난 폴링 이후 변경 없음
+            self._not_modified_count += 1
+            return []
+        
+        response.raise_for_status()
+        
+        if conditional:
+            self._fetched_validators = (response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        
+        data = response.json()
+        
+        # API 응답 구조에 따라 수정 필요
+        disasters = data.get('DisasterMsg', [])
+        if isinstance(disasters, dict):
+            disasters = disasters.get('row', [])
+        return disasters
+    
+    @staticmethod
+    def _sequence_of(disaster: Dict) -> Optional[int]:
+        """재난문자 일련번호 (숫자가 아니면 None → 워터마크 비교에서 제외하고 저장 시 msg_id 중복 제거만 적용)"""
+        value = str(disaster.get('MD101_SN', '')).strip()
+        return int(value) if value.isdigit() else None
+    
+    def _sequences(self, rows: List[Dict]) -> List[int]:
+        return [sequence for sequence in (self._sequence_of(row) for row in rows) if sequence is not None]
+    
+    def _is_after(self, row: Dict, floor: int) -> bool:
+        sequence = self._sequence_of(row)
+        return sequence is None or sequence > floor
+    
+    def _is_between(self, row: Dict, watermark: int, below: int) -> bool:
+        sequence = self._sequence_of(row)
+        return sequence is not None and watermark < sequence < below
+    
+    def _reaches(self, rows: List[Dict], watermark: int) -> bool:
+        """이미 처리한 메시지(워터마크 이하)가 포함되어 있는지"""
+        return any(
+            sequence is not None and sequence <= watermark
+            for sequence in (self._sequence_of(row) for row in rows)
+        )
+    
+    async def _load_watermark(self) -> Optional[int]:
+        """워터마크 / 이어 읽기 위치 조회 (처음 한 번만 Redis에서 읽고 이후에는 메모리 값 사용)"""
+        if self._watermark is None and self.redis_client:
+            try:
+                values = await self.redis_client.hgetall(WATERMARK_KEY)
+                if values.get("sn") is not None:
+                    self._watermark = int(values["sn"])
+                if values.get("resume_sn") is not None:
+                    self._resume = ResumeCursor(
+                        top=int(values["resume_top"]),
+                        sn=int(values["resume_sn"]),
+                        depth=int(values["resume_depth"])
+                    )
+            except Exception as e:
+                logger.error(f"Redis watermark load error: {str(e)}")
+        return self._watermark
+    
+    async def _save_progress(
+        self,
+        disasters: List[Dict],
+        resume: Optional[ResumeCursor],
+        previous: Optional[ResumeCursor]
+    ):
+        """
+        폴링 결과 반영
+        
+        다 읽지 못한 구간이 남으면 워터마크는 그대로 두고 이어 읽을 위치만 기록하고,
+        구간을 다 읽었으면 그동안 본 가장 최신 번호까지 워터마크를 올린다.
+        """
+        self._resume = resume
+        if resume is not None:
+            await self._store_resume(resume)
+            return
+        
+        if previous is not None:
+            await self._store_resume(None)
+        await self._advance_watermark(disasters, at_least=previous.top if previous else None)
+    
+    async def _store_resume(self, resume: Optional[ResumeCursor]):
+        if not self.redis_client:
+            return
         try:
-            cache_key = f"disaster:{msg_id}"
-            exists = await self.redis_client.exists(cache_key)
-            return not bool(exists)
+            if resume is None:
+                await self.redis_client.hdel(WATERMARK_KEY, "resume_top", "resume_sn", "resume_depth")
+            else:
+                await self.redis_client.hset(WATERMARK_KEY, mapping={
+                    "resume_top": resume.top,
+                    "resume_sn": resume.sn,
+                    "resume_depth": resume.depth
+                })
         except Exception as e:
-            logger.error(f"Redis check error: {str(e)}")
-            return True
+            logger.error(f"Redis resume cursor save error: {str(e)}")
     
-    async def _cache_disaster(self, msg_id: str):
-        """재난문자를 Redis에 캐시"""
+    async def _advance_watermark(self, disasters: List[Dict], at_least: Optional[int] = None):
+        """조회한 메시지 중 가장 큰 일련번호(또는 at_least)로 워터마크 갱신 (감소하지 않음)"""
+        latest = max(
+            (disaster for disaster in disasters if self._sequence_of(disaster) is not None),
+            key=self._sequence_of,
+            default=None
+        )
+        candidates = [at_least] if at_least is not None else []
+        if latest is not None:
+            candidates.append(self._sequence_of(latest))
+        if not candidates:
+            return
+        
+        sequence = max(candidates)
+        crt_dt = ""
+        if latest is not None and self._sequence_of(latest) == sequence:
+            crt_dt = latest.get('CRT_DT', latest.get('create_date', ''))
+        if self._watermark is not None and sequence <= self._watermark:
+            return
+        
+        self._watermark = sequence
         if not self.redis_client:
             return
         
         try:
-            cache_key = f"disaster:{msg_id}"
-            await self.redis_client.setex(
-                cache_key,
-                self.cache_ttl,
-                datetime.utcnow().isoformat()
+            # 다른 워커가 더 큰 값을 기록했으면 그 값을 따름
+            current = await self.redis_client.eval(
+                _ADVANCE_WATERMARK_LUA,
+                1,
+                WATERMARK_KEY,
+                sequence,
+                str(crt_dt)
             )
+            self._watermark = int(current)
         except Exception as e:
-            logger.error(f"Redis cache error: {str(e)}")
+            logger.error(f"Redis watermark save error: {str(e)}")
+    
+    def _record_latency(self, latency_ms: float):
+        self._poll_count += 1
+        self._latency_total_ms += latency_ms
+        self._latency_max_ms = max(self._latency_max_ms, latency_ms)
+        self._latency_last_ms = latency_ms
+        logger.debug(f"Disaster API poll latency: {latency_ms:.1f}ms")
+    
+    def stats(self) -> Dict[str, Any]:
+        """폴링 지연 통계 (연결 재사용 효과 확인용)"""
+        return {
+            "polls": self._poll_count,
+            "requests": self._request_count,
+            "not_modified": self._not_modified_count,
+            "errors": self._error_count,
+            "last_latency_ms": round(self._latency_last_ms, 1) if self._latency_last_ms is not None else None,
+            "avg_latency_ms": round(self._latency_total_ms / self._poll_count, 1) if self._poll_count else None,
+            "max_latency_ms": round(self._latency_max_ms, 1),
+            "http_version": self._http_version,
+            "conditional": bool(self._etag or self._last_modified)
+        }
     
     async def close(self):
         """리소스 정리"""
+        if self.http_client:
+            await self.http_client.aclose()
+            self.http_client = None
         if self.redis_client:
             await self.redis_client.close()
 
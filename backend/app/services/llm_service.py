@@ -1,7 +1,6 @@
 """
 Qwen3 8B 로컬 LLM 서비스 (행동카드 생성)
 """
-import httpx
 import asyncio
 import json
 from pathlib import Path
@@ -11,6 +10,7 @@ from datetime import datetime
 
 from ..core.config import settings
 from ..api.v1.schemas.shelter import ShelterInfo
+from ..external.ollama_client import OllamaOverloadedError, ollama_client
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +23,10 @@ class LLMService:
         self.model = settings.OLLAMA_MODEL
         self.timeout = settings.OLLAMA_TIMEOUT
         self.temperature = settings.OLLAMA_TEMPERATURE
+        # 프로세스 전체가 공유하는 연결 풀 + 동시 요청 제한
+        self.ollama_client = ollama_client
         self.landmarks_data = self._load_landmarks()
+        self._health_data_by_user: Optional[Dict[str, Dict]] = None
     
     def _load_landmarks(self) -> List[Dict]:
         """랜드마크 정보 JSON 파일 로드"""
@@ -37,19 +40,19 @@ class LLMService:
             return []
     
     def _load_user_health_data(self, user_id: str) -> Dict:
-        """사용자 건강 정보 JSON 파일 로드"""
-        try:
-            health_file = Path(__file__).parent.parent / "data" / "user_health_data.json"
-            with open(health_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                users = data.get('users', [])
-                for user in users:
-                    if user.get('user_id') == user_id:
-                        return user
-                return {}
-        except Exception as e:
-            logger.warning(f"건강 데이터 파일 로드 실패: {e}")
-            return {}
+        """사용자 건강 정보 조회 (JSON 파일은 처음 한 번만 읽음)"""
+        if self._health_data_by_user is None:
+            try:
+                health_file = Path(__file__).parent.parent / "data" / "user_health_data.json"
+                with open(health_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._health_data_by_user = {
+                    user.get('user_id'): user for user in data.get('users', [])
+                }
+            except Exception as e:
+                logger.warning(f"건강 데이터 파일 로드 실패: {e}")
+                self._health_data_by_user = {}
+        return self._health_data_by_user.get(user_id, {})
     
     def _get_health_specific_advice(self, condition: str, medications: List[str], disaster_type: str) -> str:
         """질환별 재난 상황 맞춤형 필수 물품 권고사항 생성"""
@@ -116,6 +119,9 @@ class LLMService:
             shelters_text=shelters_text
         )
         
+        # 대기열 대기와 재시도를 모두 포함한 마감 시각
+        deadline = asyncio.get_running_loop().time() + settings.OLLAMA_DEADLINE_SECONDS
+        
         # 재시도 로직
         for attempt in range(max_retries):
             try:
@@ -125,18 +131,17 @@ class LLMService:
                 logger.info(f"🔍 Ollama Request: model={self.model}, prompt_length={len(prompt)}, endpoint={self.ollama_endpoint}")
                 logger.debug(f"🔍 Full prompt:\n{prompt[:200]}...")
                 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        f"{self.ollama_endpoint}/api/generate",
-                        json={
-                            "model": self.model,
-                            "prompt": prompt,
-                            "stream": False,
-                            "options": {
-                                "temperature": 0.7 + (attempt * 0.1)  # 재시도마다 temperature 증가
-                            }
+                response = await self.ollama_client.generate(
+                    {
+                        "model": self.model,
+                        "prompt": prompt,
+                        "stream": False,
+                        "options": {
+                            "temperature": 0.7 + (attempt * 0.1)  # 재시도마다 temperature 증가
                         }
-                    )
+                    },
+                    deadline=deadline
+                )
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -198,6 +203,10 @@ class LLMService:
             except ValueError:
                 # 검증 실패 예외는 그대로 전파
                 raise
+            except OllamaOverloadedError as e:
+                # 대기열이 가득 찼거나 마감이 지나면 재시도하지 않고 바로 실패
+                logger.warning(f"LLM request rejected (attempt {attempt + 1}): {str(e)}")
+                raise
             except Exception as e:
                 logger.error(f"LLM service error (attempt {attempt + 1}): {str(e)}")
                 if attempt < max_retries - 1:
@@ -214,6 +223,54 @@ class LLMService:
     
    
     
+    def _health_precaution(self, user_profile: Dict, disaster_type: str) -> str:
+        """사용자 건강 정보에 따른 필수 물품 권고 (없으면 빈 문자열)"""
+        user_id = user_profile.get('user_id', None)
+        if not user_id:
+            return ""
+        
+        health_data = self._load_user_health_data(user_id)
+        # 가장 심각한 건강 상태의 약물/장비 정보 추출
+        conditions = health_data.get('health_conditions', []) if health_data else []
+        if not conditions:
+            return ""
+        
+        primary_condition = conditions[0]  # 첫 번째 질환
+        medications = primary_condition.get('medication', [])
+        if not medications:
+            return ""
+        
+        # 재난 상황별 필수 약물/장비 권고사항 생성
+        return self._get_health_specific_advice(
+            primary_condition.get('condition', ''), medications, disaster_type
+        )
+    
+    def cohort_key(
+        self,
+        disaster_type: str,
+        user_profile: Dict,
+        shelters: List[ShelterInfo]
+    ) -> tuple:
+        """
+        행동카드 프롬프트를 결정하는 입력 묶음 (같으면 같은 카드를 재사용해도 됨)
+        
+        프롬프트는 가장 가까운 대피소 이름, 거리, 건강 권고만 반영하므로
+        (재난 유형, 대피소, 거리 구간, 건강 권고)를 키로 쓴다.
+        """
+        nearest = shelters[0] if shelters else None
+        return (
+            disaster_type,
+            nearest.name if nearest else None,
+            self.bucket_distance_km(nearest.distance_km) if nearest else None,
+            self._health_precaution(user_profile, disaster_type)
+        )
+    
+    @staticmethod
+    def bucket_distance_km(distance_km: float) -> float:
+        """코호트 묶음용 거리 구간 (ACTION_CARD_DISTANCE_BUCKET_KM 단위 반올림)"""
+        bucket = settings.ACTION_CARD_DISTANCE_BUCKET_KM
+        return round(round(distance_km / bucket) * bucket, 2)
+    
     def _create_prompt(
         self,
         disaster_type: str,
@@ -253,30 +310,9 @@ class LLMService:
             if '거리:' in distance_part:
                 distance = distance_part.split('거리:')[1].split(',')[0].strip()
         
-        # 사용자 건강 정보 로드 (user_profile에 user_id가 있는 경우)
-        user_id = user_profile.get('user_id', None)
-        health_precaution = ""
-        has_health_info = False
-        
-        if user_id:
-            health_data = self._load_user_health_data(user_id)
-            if health_data and health_data.get('health_conditions'):
-                # 가장 심각한 건강 상태의 약물/장비 정보 추출
-                conditions = health_data.get('health_conditions', [])
-                if conditions:
-                    primary_condition = conditions[0]  # 첫 번째 질환
-                    condition_name = primary_condition.get('condition', '')
-                    medications = primary_condition.get('medication', [])
-                    
-                    # 재난 상황별 필수 약물/장비 권고사항 생성
-                    if medications:
-                        # 질환별 맞춤형 장비/약물 권고
-                        disaster_specific_advice = self._get_health_specific_advice(
-                            condition_name, medications, disaster_type
-                        )
-                        if disaster_specific_advice:
-                            health_precaution = disaster_specific_advice
-                            has_health_info = True
+        # 사용자 건강 정보 기반 필수 물품 권고 (user_profile에 user_id가 있는 경우)
+        health_precaution = self._health_precaution(user_profile, disaster_type)
+        has_health_info = bool(health_precaution)
         
         # 건강 정보 유무에 따라 프롬프트 다르게 생성
         if has_health_info:
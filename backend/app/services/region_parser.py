@@ -0,0 +1,178 @@
+"""
+재난 수신 지역 파서 (행정구역 이름 트라이)
+
+"경기도 안산시 단원구, 상록구", "서울 영등포구·구로구", "경기안산시" 같은 자유 형식
+수신 지역 문자열을 정규화된 행정구역 경로 집합으로 바꾼다. 경로는
+users.region_path와 같은 형식("경기도 안산시 단원구")이며 지역 코드로 쓰인다.
+
+트라이는 scripts/build_region_trie.py가 app/data/admin_regions.tsv로 미리 만든
+app/data/admin_region_trie.json을 그대로 불러 쓰고, 문자열별 결과는 메모이즈한다.
+"""
+import json
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRIE_PATH = Path(__file__).parent.parent / "data" / "admin_region_trie.json"
+TRIE_FORMAT_VERSION = 1
+TERMINAL_KEY = "$"
+
+# 전국 대상 재난문자 표기
+NATIONWIDE_NAME = "전국"
+
+# 이름 앞뒤에 올 수 있는 구분 문자 (공백, 쉼표, 괄호 등)
+_BOUNDARY_CHARS = set(" \t\n,/·ㆍ()[]{}<>")
+# 수신 지역 목록을 나누는 문자 ("단원구, 상록구", "영등포구·구로구")
+_SEGMENT_CHARS = set(",/·ㆍ")
+
+
+class RegionParser:
+    """행정구역 이름 트라이 기반 수신 지역 파서"""
+
+    def __init__(self, trie_path: Path = TRIE_PATH, cache_size: int = 4096):
+        self.trie_path = trie_path
+        self._regions: List[str] = []
+        self._trie: Dict = {}
+        self._loaded = False
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def _load(self):
+        """트라이 파일 로드 (처음 파싱할 때 한 번)"""
+        self._loaded = True
+        try:
+            data = json.loads(self.trie_path.read_text(encoding="utf-8"))
+            if data.get("format_version") != TRIE_FORMAT_VERSION:
+                raise ValueError(f"지원하지 않는 트라이 형식: {data.get('format_version')}")
+            self._regions = data["regions"]
+            self._trie = data["trie"]
+            logger.info(f"🗺️  행정구역 트라이 로드 완료: {len(self._regions)}개")
+        except Exception as e:
+            logger.error(f"행정구역 트라이 로드 실패: {e}")
+
+    def _parse(self, text: Optional[str]) -> Optional[FrozenSet[str]]:
+        """
+        수신 지역 문자열을 행정구역 경로 집합으로 변환 (parse()로 호출, 결과 메모이즈)
+
+        - 광역시도 없이 이어지는 이름은 앞 지역의 상위 행정구역을 이어받는다
+          ("경기도 안산시 단원구, 상록구" → 단원구, 상록구)
+        - 여러 지역에 같은 이름이 있으면(중구, 고성군 등) 앞 지역 기준으로 고르고,
+          고를 수 없으면 버린다
+        - 트라이에 없는 읍면동 이름 등은 무시해 시군구 단위로 남긴다
+        - 목록 중 한 항목이라도 행정구역을 찾지 못하면 전체를 해석할 수 없는 것으로 본다
+          (일부 지역만 골라 보내는 것보다 호출자가 전체 발송으로 넘어가는 편이 안전)
+
+        Returns:
+            경로 집합 (전국 대상이면 None, 해석할 수 없으면 빈 집합)
+        """
+        if not text:
+            return frozenset()
+        if not self._loaded:
+            self._load()
+
+        regions = set()
+        context: Optional[str] = None
+        length = len(text)
+        position = 0
+        # 현재 목록 항목에 글자가 있었는지, 행정구역을 찾았는지
+        segment_has_text = segment_resolved = False
+
+        while position < length:
+            # 이름은 구분 문자 뒤 또는 바로 앞 이름이 끝난 자리에서만 시작
+            if text[position] in _BOUNDARY_CHARS:
+                if text[position] in _SEGMENT_CHARS:
+                    if segment_has_text and not segment_resolved:
+                        logger.debug(f"해석할 수 없는 수신 지역 항목: {text}")
+                        return frozenset()
+                    segment_has_text = segment_resolved = False
+                position += 1
+                continue
+            segment_has_text = True
+            if text.startswith(NATIONWIDE_NAME, position) and self._ends_at_boundary(text, position + len(NATIONWIDE_NAME)):
+                return None
+
+            end, candidates = self._longest_match(text, position)
+            if end is None:
+                # 모르는 단어는 건너뜀
+                while position < length and text[position] not in _BOUNDARY_CHARS:
+                    position += 1
+                continue
+            position = end
+
+            region = self._resolve(candidates, context)
+            if region is None:
+                logger.debug(f"모호한 행정구역 이름 무시: {text}")
+                continue
+            segment_resolved = True
+
+            if context is not None and not region.startswith(context + " "):
+                regions.add(context)
+            context = region
+
+        if segment_has_text and not segment_resolved:
+            logger.debug(f"해석할 수 없는 수신 지역 항목: {text}")
+            return frozenset()
+        if context is not None:
+            regions.add(context)
+        return frozenset(regions)
+
+    @staticmethod
+    def _ends_at_boundary(text: str, end: int) -> bool:
+        return end >= len(text) or text[end] in _BOUNDARY_CHARS
+
+    def _longest_match(self, text: str, start: int, allow_glued: bool = True):
+        """
+        start에서 시작하는 가장 긴 이름
+
+        시/군/구/도로 끝나지 않는 약칭은 뒤에 구분 문자나 다른 이름이 와야 한다
+        ("경기 안산시", "경기안산시"는 되고 "경기장"은 안 됨). 뒤에 붙은 이름은
+        한 단계만 확인한다.
+        """
+        node = self._trie
+        best_end, best_candidates = None, None
+        for index in range(start, len(text)):
+            node = node.get(text[index])
+            if node is None:
+                break
+            if TERMINAL_KEY in node:
+                end = index + 1
+                if (
+                    text[index] in "시군구도"
+                    or self._ends_at_boundary(text, end)
+                    or (allow_glued and self._longest_match(text, end, allow_glued=False)[0] is not None)
+                ):
+                    best_end, best_candidates = end, node[TERMINAL_KEY]
+        return best_end, best_candidates
+
+    def _resolve(self, candidates: List[int], context: Optional[str]) -> Optional[str]:
+        """같은 이름의 후보 중 앞 지역 기준으로 하나 선택"""
+        paths = [self._regions[region_id] for region_id in candidates]
+
+        # 1. 앞 지역(또는 그 상위 지역)의 바로 아래 지역, 가장 가까운 상위 기준 우선
+        #    앞 지역 자신을 다시 가리키는 후보는 제외 ("경기도 광주시, 광주 북구"의 "광주")
+        if context is not None:
+            best, best_depth = None, 0
+            for path in paths:
+                if context == path or context.startswith(path + " "):
+                    continue
+                parent = path.rsplit(" ", 1)[0] if " " in path else None
+                if parent and (context == parent or context.startswith(parent + " ")):
+                    depth = parent.count(" ") + 1
+                    if depth > best_depth:
+                        best, best_depth = path, depth
+            if best is not None:
+                return best
+
+        # 2. 광역시도 ("광주" → 광주광역시)
+        for path in paths:
+            if " " not in path:
+                return path
+
+        # 3. 전국에 하나뿐인 이름
+        return paths[0] if len(paths) == 1 else None
+
+
+# 싱글톤 인스턴스
+region_parser = RegionParser()
@@ -0,0 +1,129 @@
+"""
+재난 수신 지역 기반 알림 대상 선별
+
+재난문자의 수신 지역(RCV_AREA_NM, 예: "경기도 안산시 단원구, 상록구")을
+정규화된 행정구역 경로("경기도 안산시 단원구")로 바꾸고, 같은 형식으로
+정규화해 둔 users.region_path 인덱스로 해당 지역 사용자만 조회한다.
+알림 대상 조회 비용이 전국 사용자 수가 아니라 영향 지역 크기에 비례한다.
+수신 지역 해석은 region_parser(행정구역 이름 트라이)가 담당한다.
+
+region_path는 위치 업데이트 때 좌표를 역지오코딩해 채운다 (lookup_admin_region).
+"""
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import FrozenSet, Iterable, List, Optional
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..external.google_maps import get_admin_region_from_coordinates
+from ..models.user import User
+from .region_parser import region_parser
+from .shelter_cache import geohash_encode
+
+logger = logging.getLogger(__name__)
+
+# geohash 셀 → 역지오코딩한 행정구역 (프로세스별 LRU)
+_admin_region_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def normalize_region(text: Optional[str]) -> Optional[str]:
+    """
+    행정구역 문자열 하나를 정규화된 경로로 변환
+
+    재난 수신 지역과 같은 파서를 써서 두 경로가 같은 형식이 되도록 한다.
+    예: "서울시 영등포구" → "서울특별시 영등포구", "경기 안산 단원구" → "경기도 안산시 단원구"
+
+    Returns:
+        정규화된 경로 (행정구역 하나로 해석할 수 없으면 None)
+    """
+    regions = region_parser.parse(text)
+    if not regions or len(regions) != 1:
+        return None
+    return next(iter(regions))
+
+
+def parse_receiving_area(text: Optional[str]) -> Optional[FrozenSet[str]]:
+    """
+    재난문자 수신 지역을 정규화된 경로 집합으로 변환
+
+    쉼표로 이어진 지역은 앞 지역의 상위 행정구역을 이어받는다.
+    예: "경기도 안산시 단원구, 상록구" → {"경기도 안산시 단원구", "경기도 안산시 상록구"}
+
+    Returns:
+        경로 집합 (전국 대상이면 None, 한 항목이라도 해석할 수 없으면 빈 집합)
+    """
+    return region_parser.parse(text)
+
+
+async def lookup_admin_region(latitude: float, longitude: float) -> Optional[str]:
+    """
+    좌표가 속한 행정구역 문자열 조회 (예: "경기도 안산시 단원구")
+
+    위치 업데이트가 잦으므로 같은 geohash 셀(약 150m)의 결과는 재사용한다.
+    조회에 실패하면 캐시하지 않고 None을 돌려준다.
+    """
+    cell = geohash_encode(latitude, longitude, settings.USER_REGION_GEOHASH_PRECISION)
+    region = _admin_region_cache.get(cell)
+    if region is not None:
+        _admin_region_cache.move_to_end(cell)
+        return region
+
+    region = await get_admin_region_from_coordinates(latitude, longitude)
+    if region is None:
+        return None
+    _admin_region_cache[cell] = region
+    while len(_admin_region_cache) > settings.USER_REGION_CACHE_SIZE:
+        _admin_region_cache.popitem(last=False)
+    return region
+
+
+def region_ancestors(path: str) -> List[str]:
+    """경로와 그 상위 경로 목록 ("경기도 안산시 단원구" → ["경기도", "경기도 안산시", "경기도 안산시 단원구"])"""
+    components = path.split()
+    return [" ".join(components[:depth]) for depth in range(1, len(components) + 1)]
+
+
+async def find_target_users(
+    db: AsyncSession,
+    regions: Optional[Iterable[str]],
+    disaster_area=None,
+    active_within: timedelta = timedelta(hours=1)
+) -> List[User]:
+    """
+    재난 지역 안의 활성 사용자 조회
+
+    - region_path가 대상 지역 또는 그 하위 지역인 사용자
+    - region_path가 대상 지역의 상위 지역인 사용자 (거주지를 시도 단위로만 아는 경우)
+    - region_path가 없는 사용자(행정구역 조회 실패 등)는 재난 폴리곤이 있으면 위치가
+      그 안에 있을 때, 없으면 위치만 있으면 포함 (누락보다 과다 발송이 안전)
+
+    Args:
+        db: 사용자 DB 세션
+        regions: parse_receiving_area() 결과 (None이면 전국)
+        disaster_area: 재난 지역 폴리곤 (선택)
+        active_within: 활성 사용자 기준 (최근 위치 업데이트 시각)
+    """
+    conditions = [
+        User.is_active == True,
+        User.last_location_update >= datetime.utcnow() - active_within,
+        User.location.isnot(None)
+    ]
+
+    if regions is not None:
+        exact = sorted({ancestor for region in regions for ancestor in region_ancestors(region)})
+        matches = [User.region_path.in_(exact)]
+        matches.extend(User.region_path.like(f"{region} %") for region in sorted(regions))
+        if disaster_area is not None:
+            matches.append(and_(
+                User.region_path.is_(None),
+                func.ST_Covers(disaster_area, User.location)
+            ))
+        else:
+            matches.append(User.region_path.is_(None))
+        conditions.append(or_(*matches))
+
+    result = await db.execute(select(User).where(*conditions))
+    return list(result.scalars().all())
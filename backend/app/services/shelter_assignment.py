@@ -0,0 +1,68 @@
+"""
+수용 인원을 고려한 대피소 배정 (대량 알림용)
+
+재난 알림 시 같은 지역 사용자가 모두 가장 가까운 한 대피소로 몰리지 않도록,
+사용자별 최근접 후보 K개 안에서 전체 도보 거리가 작아지도록 배정한다.
+
+알고리즘: (사용자, 대피소) 후보 간선을 거리 오름차순으로 훑으며, 아직 배정되지
+않은 사용자를 잔여 수용 인원이 있는 대피소에 배정하는 탐욕법.
+최소 비용 유량의 근사지만 O(NK log NK)로 5만 명 x 후보 10개도 1초 이내에 끝난다.
+"""
+from typing import Tuple
+
+import numpy as np
+
+
+def assign_with_capacity(
+    candidate_indices: np.ndarray,
+    candidate_distances: np.ndarray,
+    capacities: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    후보 목록과 대피소 수용 인원으로 사용자별 대피소 배정
+
+    Args:
+        candidate_indices: (N, K) 사용자별 후보 대피소 인덱스 (없으면 -1)
+        candidate_distances: (N, K) 후보 거리 (km, 없으면 inf)
+        capacities: (M,) 대피소별 수용 가능 인원 (제한 없음은 inf)
+
+    Returns:
+        (assigned, overflowed):
+            assigned: (N,) 배정된 대피소 인덱스 (후보가 없으면 -1)
+            overflowed: (N,) 후보 대피소가 모두 가득 차 가장 가까운 대피소에
+                        초과 배정된 사용자 여부
+    """
+    n_users = candidate_indices.shape[0]
+    assigned = np.full(n_users, -1, dtype=np.int64)
+    overflowed = np.zeros(n_users, dtype=bool)
+
+    if n_users == 0 or candidate_indices.size == 0:
+        return assigned, overflowed
+
+    flat_shelters = candidate_indices.ravel()
+    valid = flat_shelters >= 0
+    flat_users = np.repeat(np.arange(n_users), candidate_indices.shape[1])[valid]
+    flat_shelters = flat_shelters[valid]
+    order = np.argsort(candidate_distances.ravel()[valid], kind="stable")
+
+    remaining = np.asarray(capacities, dtype=np.float64).tolist()
+    result = [-1] * n_users
+    unassigned = int(np.count_nonzero(candidate_indices[:, 0] >= 0))
+
+    for user, shelter in zip(flat_users[order].tolist(), flat_shelters[order].tolist()):
+        if result[user] >= 0 or remaining[shelter] < 1:
+            continue
+        result[user] = shelter
+        remaining[shelter] -= 1
+        unassigned -= 1
+        if unassigned == 0:
+            break
+
+    assigned[:] = result
+
+    # 후보가 모두 가득 찬 사용자는 안내 누락 방지를 위해 가장 가까운 대피소로 초과 배정
+    overflow = (assigned < 0) & (candidate_indices[:, 0] >= 0)
+    assigned[overflow] = candidate_indices[overflow, 0]
+    overflowed[overflow] = True
+
+    return assigned, overflowed
@@ -0,0 +1,102 @@
+"""
+다수 좌표의 최근접 대피소 일괄 계산 (NumPy 벡터화)
+
+사용자 좌표를 공간적으로 가까운 것끼리 묶어 청크 단위로 처리하고,
+청크마다 반경을 덮는 대피소 후보만 골라 한 번의 Haversine 행렬 연산으로
+거리를 계산한다.
+"""
+from typing import Tuple
+
+import numpy as np
+
+from ..geo import KM_PER_DEGREE_LAT, haversine_matrix, longitude_span_deg
+
+# 청크당 거리 행렬 원소 수 상한 (메모리 사용량 제한)
+MAX_MATRIX_ELEMENTS = 4_000_000
+
+
+def batch_nearest(
+    user_lat: np.ndarray,
+    user_lng: np.ndarray,
+    shelter_lat: np.ndarray,
+    shelter_lng: np.ndarray,
+    k: int,
+    radius_km: float,
+    chunk_size: int = 256
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    사용자별 반경 내 최근접 k개 대피소 계산
+
+    Args:
+        user_lat, user_lng: (N,) 사용자 좌표
+        shelter_lat, shelter_lng: (M,) 대피소 좌표
+        k: 사용자당 결과 수
+        radius_km: 검색 반경 (km)
+        chunk_size: 한 번에 처리할 사용자 수
+
+    Returns:
+        (indices, distances): 각각 (N, k) 배열, 거리 순 정렬.
+        결과가 k개보다 적으면 인덱스 -1, 거리 inf로 채운다.
+    """
+    user_lat = np.asarray(user_lat, dtype=np.float64)
+    user_lng = np.asarray(user_lng, dtype=np.float64)
+    n_users = user_lat.shape[0]
+
+    indices = np.full((n_users, k), -1, dtype=np.int64)
+    distances = np.full((n_users, k), np.inf, dtype=np.float64)
+
+    if n_users == 0 or k <= 0 or len(shelter_lat) == 0:
+        return indices, distances
+
+    # 대피소를 위도 순으로 정렬해 청크별 후보를 searchsorted로 잘라낸다
+    shelter_order = np.argsort(shelter_lat, kind="stable")
+    sorted_lat = np.asarray(shelter_lat, dtype=np.float64)[shelter_order]
+    sorted_lng = np.asarray(shelter_lng, dtype=np.float64)[shelter_order]
+
+    # 사용자는 (0.1도 위도 띠, 경도) 순으로 정렬해 청크가 공간적으로 뭉치도록 한다
+    user_order = np.lexsort((user_lng, np.floor(user_lat * 10)))
+
+    d_lat = radius_km / KM_PER_DEGREE_LAT
+
+    for start in range(0, n_users, chunk_size):
+        chunk = user_order[start:start + chunk_size]
+        c_lat = user_lat[chunk]
+        c_lng = user_lng[chunk]
+
+        lat_lo = c_lat.min() - d_lat
+        lat_hi = c_lat.max() + d_lat
+        lo = np.searchsorted(sorted_lat, lat_lo, side="left")
+        hi = np.searchsorted(sorted_lat, lat_hi, side="right")
+        if lo >= hi:
+            continue
+
+        d_lng = longitude_span_deg(max(abs(lat_lo), abs(lat_hi)), radius_km)
+        lng_mask = (sorted_lng[lo:hi] >= c_lng.min() - d_lng) & (sorted_lng[lo:hi] <= c_lng.max() + d_lng)
+        candidates = np.nonzero(lng_mask)[0] + lo
+        if candidates.size == 0:
+            continue
+
+        # 후보가 많으면 청크를 더 잘게 나눠 행렬 크기를 제한
+        step = max(1, MAX_MATRIX_ELEMENTS // candidates.size)
+        for sub_start in range(0, chunk.size, step):
+            sub = slice(sub_start, sub_start + step)
+            matrix = haversine_matrix(c_lat[sub], c_lng[sub], sorted_lat[candidates], sorted_lng[candidates])
+            matrix[matrix > radius_km] = np.inf
+
+            kk = min(k, candidates.size)
+            if kk < candidates.size:
+                top = np.argpartition(matrix, kk - 1, axis=1)[:, :kk]
+            else:
+                top = np.broadcast_to(np.arange(candidates.size), (matrix.shape[0], candidates.size))
+
+            top_dist = np.take_along_axis(matrix, top, axis=1)
+            order = np.argsort(top_dist, axis=1, kind="stable")
+            top = np.take_along_axis(top, order, axis=1)
+            top_dist = np.take_along_axis(top_dist, order, axis=1)
+
+            rows = chunk[sub]
+            found = np.isfinite(top_dist)
+            distances[rows, :kk] = top_dist
+            indices[rows, :kk] = np.where(found, shelter_order[candidates[top]], -1)
+
+    return indices, distances
@@ -0,0 +1,364 @@
+"""
+주변 대피소 검색 결과 캐시 (geohash 셀 단위, Redis)
+
+같은 geohash 셀에서 들어오는 검색은 하나의 후보 집합을 공유한다.
+후보는 셀 내부 어느 지점에서 검색해도 정답을 포함하도록 계산되며,
+호출자마다 정확한 거리로 다시 정렬된다 (ShelterFinder._cached_search).
+
+셀마다 Redis 해시 하나("shelter_cache:{geohash}")에 (분류, 반경, 개수)별 후보를 담아,
+대피소가 바뀌면 그 주변 셀 키만 지울 수 있다.
+"""
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import redis.asyncio as aioredis
+
+from ..core.config import settings
+from ..geo import bounding_box, haversine_km
+from ..api.v1.schemas.shelter import ShelterInfo
+
+logger = logging.getLogger(__name__)
+
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+CACHE_KEY_PREFIX = "shelter_cache"
+# 대피소 변경 알림 하나를 한 워커만 무효화하도록 잡아 두는 키
+CLAIM_KEY_PREFIX = "shelter_cache_claim"
+CLAIM_TTL_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class GeohashCell:
+    """geohash 셀 정보"""
+    geohash: str
+    center_latitude: float
+    center_longitude: float
+    diagonal_km: float  # 셀 대각선 길이 (중심~모서리 거리의 2배)
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int) -> str:
+    """위경도를 geohash 문자열로 인코딩"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lng_range[0] + lng_range[1]) / 2
+            if longitude >= mid:
+                bits = (bits << 1) | 1
+                lng_range[0] = mid
+            else:
+                bits <<= 1
+                lng_range[1] = mid
+        else:
+            mid = (lat_range[0] + lat_range[1]) / 2
+            if latitude >= mid:
+                bits = (bits << 1) | 1
+                lat_range[0] = mid
+            else:
+                bits <<= 1
+                lat_range[1] = mid
+
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def geohash_bounds(geohash: str) -> tuple:
+    """geohash 셀의 경계 (min_lat, max_lat, min_lng, max_lng)"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for char in geohash:
+        value = GEOHASH_BASE32.index(char)
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            target = lng_range if even else lat_range
+            mid = (target[0] + target[1]) / 2
+            if bit:
+                target[0] = mid
+            else:
+                target[1] = mid
+            even = not even
+
+    return lat_range[0], lat_range[1], lng_range[0], lng_range[1]
+
+
+class ShelterResultCache:
+    """geohash 셀 단위 대피소 후보 캐시"""
+
+    def __init__(self):
+        self.redis_client: Optional[aioredis.Redis] = None
+        self.ttl = settings.SHELTER_CACHE_TTL_SECONDS
+        self.precision = settings.SHELTER_CACHE_GEOHASH_PRECISION
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def initialize_redis(self):
+        """Redis 클라이언트 초기화 (연결 실패 시 캐시 비활성)"""
+        if not settings.SHELTER_CACHE_ENABLED:
+            return
+
+        try:
+            client = await aioredis.from_url(
+                settings.REDIS_URL,
+                encoding="utf-8",
+                decode_responses=True
+            )
+            await client.ping()
+            self.redis_client = client
+            logger.info("Shelter result cache initialized")
+        except Exception as e:
+            logger.error(f"Failed to initialize shelter cache Redis: {str(e)}")
+            self.redis_client = None
+
+    @property
+    def is_available(self) -> bool:
+        """캐시 사용 가능 여부"""
+        return self.redis_client is not None
+
+    def cell_of(self, latitude: float, longitude: float) -> GeohashCell:
+        """좌표가 속한 geohash 셀 계산"""
+        geohash = geohash_encode(latitude, longitude, self.precision)
+        min_lat, max_lat, min_lng, max_lng = geohash_bounds(geohash)
+        center_lat = (min_lat + max_lat) / 2
+        center_lng = (min_lng + max_lng) / 2
+
+        # 적도 쪽 모서리가 중심에서 가장 멀다
+        corner_lat = min_lat if abs(min_lat) < abs(max_lat) else max_lat
+        half_diagonal_km = haversine_km(center_lat, center_lng, corner_lat, max_lng)
+
+        return GeohashCell(
+            geohash=geohash,
+            center_latitude=center_lat,
+            center_longitude=center_lng,
+            diagonal_km=2 * half_diagonal_km
+        )
+
+    def cells_affected_by(self, points: Iterable[Tuple[float, float]]) -> Optional[Set[str]]:
+        """
+        대피소 좌표가 바뀌었을 때 후보가 달라질 수 있는 셀 목록
+
+        셀 후보는 셀 중심에서 (검색 반경 + 셀 대각선) 안의 대피소이므로, 좌표마다
+        SHELTER_CACHE_MAX_RADIUS_KM + 대각선 사각형과 겹치는 셀을 모은다.
+        같은 정밀도의 geohash 셀은 규칙 격자이므로 격자 행별 구간을 합친 뒤
+        남은 셀만 인코딩한다.
+
+        Returns:
+            geohash 목록 (SHELTER_CACHE_INVALIDATE_MAX_CELLS를 넘으면 None → 전체 무효화)
+        """
+        lat_bits = 5 * self.precision // 2
+        lng_bits = 5 * self.precision - lat_bits
+        lat_step = 180.0 / (1 << lat_bits)
+        lng_step = 360.0 / (1 << lng_bits)
+
+        def row_of(latitude: float) -> int:
+            return min((1 << lat_bits) - 1, max(0, int((latitude + 90.0) // lat_step)))
+
+        def column_of(longitude: float) -> int:
+            return min((1 << lng_bits) - 1, max(0, int((longitude + 180.0) // lng_step)))
+
+        spans_by_row: Dict[int, List[Tuple[int, int]]] = {}
+        for latitude, longitude in set(points):
+            reach_km = settings.SHELTER_CACHE_MAX_RADIUS_KM + self.cell_of(latitude, longitude).diagonal_km
+            min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, reach_km)
+            span = (column_of(min_lng), column_of(max_lng))
+            for row in range(row_of(min_lat), row_of(max_lat) + 1):
+                spans_by_row.setdefault(row, []).append(span)
+
+        merged_rows = {}
+        total = 0
+        for row, spans in spans_by_row.items():
+            merged = []
+            for first, last in sorted(spans):
+                if merged and first <= merged[-1][1] + 1:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], last))
+                else:
+                    merged.append((first, last))
+            total += sum(last - first + 1 for first, last in merged)
+            if total > settings.SHELTER_CACHE_INVALIDATE_MAX_CELLS:
+                return None
+            merged_rows[row] = merged
+
+        return {
+            geohash_encode(-90.0 + (row + 0.5) * lat_step, -180.0 + (column + 0.5) * lng_step, self.precision)
+            for row, merged in merged_rows.items()
+            for first, last in merged
+            for column in range(first, last + 1)
+        }
+
+    def _cache_key(self, geohash: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:{geohash}"
+
+    def _cache_field(self, shelter_category: Optional[str], radius_km: float, limit: int) -> str:
+        return f"{shelter_category or 'all'}:{radius_km:g}:{limit}"
+
+    async def get_candidates(
+        self,
+        cell: GeohashCell,
+        shelter_category: Optional[str],
+        radius_km: float,
+        limit: int
+    ) -> Optional[List[ShelterInfo]]:
+        """
+        캐시된 후보 조회
+
+        Returns:
+            후보 목록 (캐시 미스 또는 오류 시 None)
+        """
+        if not self.redis_client:
+            return None
+
+        try:
+            cached = await self.redis_client.hget(
+                self._cache_key(cell.geohash),
+                self._cache_field(shelter_category, radius_km, limit)
+            )
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shelter cache get error: {str(e)}")
+            return None
+
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return [ShelterInfo(**item) for item in json.loads(cached)]
+
+    async def set_candidates(
+        self,
+        cell: GeohashCell,
+        shelter_category: Optional[str],
+        radius_km: float,
+        limit: int,
+        candidates: List[ShelterInfo]
+    ):
+        """후보 목록을 TTL과 함께 저장"""
+        if not self.redis_client:
+            return
+
+        try:
+            payload = json.dumps(
+                [shelter.model_dump(mode="json") for shelter in candidates],
+                ensure_ascii=False
+            )
+            key = self._cache_key(cell.geohash)
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, self._cache_field(shelter_category, radius_km, limit), payload)
+                pipe.expire(key, self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shelter cache set error: {str(e)}")
+
+    async def invalidate(self) -> int:
+        """
+        캐시 전체 무효화 (shelters 테이블 변경 후 호출)
+
+        Returns:
+            삭제된 키 수
+        """
+        if not self.redis_client:
+            await self.initialize_redis()
+        if not self.redis_client:
+            return 0
+
+        deleted = 0
+        try:
+            batch = []
+            async for key in self.redis_client.scan_iter(match=f"{CACHE_KEY_PREFIX}:*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.unlink(*batch)
+
+            logger.info(f"🧹 대피소 검색 캐시 무효화: {deleted}건")
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shelter cache invalidate error: {str(e)}")
+
+        return deleted
+
+    async def invalidate_cells(self, geohashes: Iterable[str]) -> int:
+        """
+        지정한 geohash 셀의 캐시만 무효화
+
+        Returns:
+            삭제된 키 수
+        """
+        if not self.redis_client:
+            await self.initialize_redis()
+        if not self.redis_client:
+            return 0
+
+        keys = [self._cache_key(geohash) for geohash in geohashes]
+        deleted = 0
+        try:
+            for start in range(0, len(keys), 500):
+                deleted += await self.redis_client.unlink(*keys[start:start + 500])
+            logger.info(f"🧹 대피소 검색 캐시 셀 무효화: {len(keys)}개 셀 중 {deleted}건")
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shelter cache invalidate error: {str(e)}")
+
+        return deleted
+
+    async def claim_changes(self, change_keys: List[str]) -> List[str]:
+        """
+        대피소 변경 알림을 이 워커가 무효화하도록 잡기 (모든 워커가 같은 알림을 받음)
+
+        Returns:
+            이 워커가 잡은 변경 키 (Redis 오류 시 전부 - 중복 무효화가 누락보다 안전)
+        """
+        if not self.redis_client:
+            await self.initialize_redis()
+        if not self.redis_client or not change_keys:
+            return list(change_keys)
+
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for change_key in change_keys:
+                    pipe.set(f"{CLAIM_KEY_PREFIX}:{change_key}", 1, nx=True, ex=CLAIM_TTL_SECONDS)
+                claimed = await pipe.execute()
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Shelter cache claim error: {str(e)}")
+            return list(change_keys)
+
+        return [change_key for change_key, won in zip(change_keys, claimed) if won]
+
+    def stats(self) -> Dict:
+        """hit/miss 카운터"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.is_available,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    async def close(self):
+        """리소스 정리"""
+        if self.redis_client:
+            await self.redis_client.close()
+            self.redis_client = None
+
+
+# 싱글톤 인스턴스
+shelter_cache = ShelterResultCache()
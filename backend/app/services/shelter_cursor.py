@@ -0,0 +1,59 @@
+"""
+거리순 대피소 목록 페이지네이션 커서
+
+마지막으로 반환한 대피소의 (거리, id)와 검색 조건(기준 좌표, 유형)을
+불투명한 문자열로 인코딩한다. 다음 페이지는 이 키 이후부터 이어서 조회하므로
+OFFSET처럼 앞 페이지 행을 다시 정렬하고 버리는 비용이 없다.
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True)
+class ShelterCursor:
+    """거리순 목록의 재개 위치"""
+    latitude: float
+    longitude: float
+    shelter_type: str
+    distance_km: float  # 마지막 항목의 거리 (반올림하지 않은 값)
+    shelter_id: str     # 마지막 항목의 id (동일 거리 정렬 기준)
+
+    @property
+    def key(self) -> Tuple[float, str]:
+        """keyset 비교 키 (distance_km, shelter_id)"""
+        return (self.distance_km, self.shelter_id)
+
+    def encode(self) -> str:
+        """URL-safe 문자열로 인코딩"""
+        payload = json.dumps(
+            [self.latitude, self.longitude, self.shelter_type, self.distance_km, self.shelter_id],
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ShelterCursor":
+        """
+        encode()로 만든 문자열 복원
+
+        Raises:
+            ValueError: 형식이 올바르지 않은 커서
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            latitude, longitude, shelter_type, distance_km, shelter_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+            )
+            return cls(
+                latitude=float(latitude),
+                longitude=float(longitude),
+                shelter_type=str(shelter_type),
+                distance_km=float(distance_km),
+                shelter_id=str(shelter_id)
+            )
+        except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+            raise ValueError(f"잘못된 커서: {token}") from e
@@ -1,32 +1,73 @@
 """
 대피소 검색 서비스 (latitude/longitude 기반)
 """
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
 import logging
+import numpy as np
 
 from ..api.v1.schemas.shelter import ShelterInfo
 from ..core.config import settings
+from ..db.session import execute_shelter_read
+from ..geo import bounding_box, haversine_km, longitude_span_deg
+from ..models.shelter import SHELTER_CATEGORIES
+from .shelter_index import IndexedShelter, ShelterSpatialIndex, shelter_index
+from .shelter_cache import GeohashCell, shelter_cache
+from .shelter_query import (
+    build_nearby_shelters_query,
+    build_shelters_in_box_query,
+    build_shelters_page_query,
+    bounding_box_params
+)
+from .shelter_cursor import ShelterCursor
+from .shelter_batch import batch_nearest
+from .shelter_assignment import assign_with_capacity
 
 logger = logging.getLogger(__name__)
 
 
+# 거리 검색 시 조회하는 대피소 컬럼
+SHELTER_COLUMNS = ("name", "address", "shelter_type", "latitude", "longitude", "capacity")
+
+# 거리순 페이지 조회: 이전 페이지 마지막 거리 + 이 반경부터 찾고, 모자라면 반경을 4배씩 넓힘
+PAGE_SEARCH_RADIUS_KM = 2.0
+# 이 반경을 넘으면 반경 제한 없이 조회 (마지막 페이지 근처)
+PAGE_SEARCH_MAX_RADIUS_KM = 1000.0
+
+
 class ShelterFinder:
     """대피소 검색 서비스"""
     
-    # 재난 유형과 대피소 유형 매핑
-    DISASTER_TO_SHELTER_TYPE = {
-        "민방위": "민방위대피소",
-        "지진": "지진대피소",
-        "해일": "해일대피소",
-        "기타": "기타대피소"
-    }
+    # 재난 유형과 대피소 유형 매핑 (재난 유형 = 정규화된 대피소 분류)
+    DISASTER_TO_SHELTER_TYPE = SHELTER_CATEGORIES
     
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, index: Optional[ShelterSpatialIndex] = None):
         self.db = db
+        self.index = index or shelter_index
         self.walking_speed_km_per_hour = settings.WALKING_SPEED_KM_PER_HOUR if hasattr(settings, 'WALKING_SPEED_KM_PER_HOUR') else 4.0
     
+    @property
+    def _use_index(self) -> bool:
+        """인메모리 공간 인덱스 사용 여부 (로드 전이거나 비활성화 시 SQL 경로 사용)"""
+        return settings.SHELTER_INDEX_ENABLED and self.index.is_ready
+    
+    def _from_index_matches(self, matches: List[Tuple[IndexedShelter, float]]) -> List[ShelterInfo]:
+        """공간 인덱스 검색 결과를 ShelterInfo 리스트로 변환"""
+        return [
+            ShelterInfo(
+                id=shelter.id,
+                name=shelter.name,
+                address=shelter.address,
+                shelter_type=shelter.shelter_type,
+                latitude=shelter.latitude,
+                longitude=shelter.longitude,
+                capacity=shelter.capacity,
+                distance_km=round(distance_km, 2),
+                walking_minutes=self._calculate_walking_time(distance_km)
+            )
+            for shelter, distance_km in matches
+        ]
+    
     async def get_shelters_within_radius(
         self,
         latitude: float,
@@ -49,68 +90,7 @@ class ShelterFinder:
         try:
             logger.info(f"Searching shelters: lat={latitude}, lng={longitude}, radius={radius_km}km, limit={limit}")
             
-            # 서브쿼리를 사용하여 거리 계산 후 필터링
-            query = text("""
-                SELECT 
-                    name,
-                    address,
-                    shelter_type,
-                    latitude,
-                    longitude,
-                    distance_km
-                FROM (
-                    SELECT 
-                        name,
-                        address,
-                        shelter_type,
-                        latitude,
-                        longitude,
-                        (
-                            6371 * acos(
-                                LEAST(1.0, 
-                                    cos(radians(:user_lat)) * cos(radians(latitude)) *
-                                    cos(radians(longitude) - radians(:user_lng)) +
-                                    sin(radians(:user_lat)) * sin(radians(latitude))
-                                )
-                            )
-                        ) AS distance_km
-                    FROM shelters
-                    WHERE latitude IS NOT NULL
-                      AND longitude IS NOT NULL
-                ) AS shelter_distances
-                WHERE distance_km <= :radius_km
-                ORDER BY distance_km ASC
-                LIMIT :limit
-            """)
-            
-            result = await self.db.execute(
-                query,
-                {
-                    "user_lat": latitude,
-                    "user_lng": longitude,
-                    "radius_km": radius_km,
-                    "limit": limit
-                }
-            )
-            
-            rows = result.fetchall()
-            logger.info(f"Query returned {len(rows)} rows")
-            
-            shelters = []
-            for row in rows:
-                distance_km = float(row.distance_km)
-                walking_minutes = self._calculate_walking_time(distance_km)
-                
-                shelter = ShelterInfo(
-                    name=row.name,
-                    address=row.address,
-                    shelter_type=row.shelter_type,
-                    latitude=float(row.latitude),
-                    longitude=float(row.longitude),
-                    distance_km=round(distance_km, 2),
-                    walking_minutes=walking_minutes
-                )
-                shelters.append(shelter)
+            shelters = await self._cached_search(latitude, longitude, radius_km, limit)
             
             logger.info(f"Found {len(shelters)} shelters within {radius_km}km")
             return shelters
@@ -143,79 +123,14 @@ class ShelterFinder:
             해당 재난 유형의 대피소 리스트 (거리 순 정렬)
         """
         try:
-            # 재난 유형을 대피소 유형으로 변환
-            shelter_type = self.DISASTER_TO_SHELTER_TYPE.get(disaster_type)
-            
-            if not shelter_type:
+            # 재난 유형이 곧 대피소 분류 (shelter_category)
+            if disaster_type not in self.DISASTER_TO_SHELTER_TYPE:
                 logger.warning(f"Unknown disaster type: {disaster_type}")
                 return []
             
             logger.info(f"Searching {disaster_type} shelters: lat={latitude}, lng={longitude}, radius={radius_km}km, limit={limit}")
             
-            # shelter_type에 공백이 포함될 수 있으므로 TRIM 및 LIKE 사용
-            query = text("""
-                SELECT 
-                    name,
-                    address,
-                    shelter_type,
-                    latitude,
-                    longitude,
-                    distance_km
-                FROM (
-                    SELECT 
-                        name,
-                        address,
-                        shelter_type,
-                        latitude,
-                        longitude,
-                        (
-                            6371 * acos(
-                                LEAST(1.0, 
-                                    cos(radians(:user_lat)) * cos(radians(latitude)) *
-                                    cos(radians(longitude) - radians(:user_lng)) +
-                                    sin(radians(:user_lat)) * sin(radians(latitude))
-                                )
-                            )
-                        ) AS distance_km
-                    FROM shelters
-                    WHERE latitude IS NOT NULL
-                      AND longitude IS NOT NULL
-                      AND TRIM(shelter_type) LIKE :shelter_type_pattern
-                ) AS shelter_distances
-                WHERE distance_km <= :radius_km
-                ORDER BY distance_km ASC
-                LIMIT :limit
-            """)
-            
-            result = await self.db.execute(
-                query,
-                {
-                    "user_lat": latitude,
-                    "user_lng": longitude,
-                    "shelter_type_pattern": f"%{shelter_type}%",
-                    "radius_km": radius_km,
-                    "limit": limit
-                }
-            )
-            
-            rows = result.fetchall()
-            logger.info(f"Query returned {len(rows)} rows for disaster type '{disaster_type}'")
-            
-            shelters = []
-            for row in rows:
-                distance_km = float(row.distance_km)
-                walking_minutes = self._calculate_walking_time(distance_km)
-                
-                shelter = ShelterInfo(
-                    name=row.name,
-                    address=row.address,
-                    shelter_type=row.shelter_type.strip(),
-                    latitude=float(row.latitude),
-                    longitude=float(row.longitude),
-                    distance_km=round(distance_km, 2),
-                    walking_minutes=walking_minutes
-                )
-                shelters.append(shelter)
+            shelters = await self._cached_search(latitude, longitude, radius_km, limit, disaster_type)
             
             logger.info(f"Found {len(shelters)} {disaster_type} shelters within {radius_km}km")
             return shelters
@@ -226,6 +141,357 @@ class ShelterFinder:
             traceback.print_exc()
             return []
     
+    async def get_nearest_shelters_batch(
+        self,
+        points: Sequence[Tuple[float, float]],
+        radius_km: float = 2.0,
+        limit: int = 3
+    ) -> List[List[ShelterInfo]]:
+        """
+        다수 좌표의 반경 내 최근접 대피소 일괄 검색
+        
+        후보 대피소를 한 번만 읽고(인덱스 또는 SQL 1회), 거리는
+        NumPy Haversine 행렬 연산으로 한꺼번에 계산한다.
+        
+        Args:
+            points: (위도, 경도) 목록
+            radius_km: 검색 반경 (km)
+            limit: 좌표당 최대 결과 수
+        
+        Returns:
+            좌표 순서와 동일한 대피소 리스트 목록 (각각 거리 순 정렬)
+        """
+        if not points:
+            return []
+        
+        try:
+            candidates = await self._load_batch_candidates(points, radius_km)
+            if not candidates:
+                return [[] for _ in points]
+            
+            user_coords = np.asarray(points, dtype=np.float64)
+            indices, distances = batch_nearest(
+                user_coords[:, 0],
+                user_coords[:, 1],
+                np.fromiter((s.latitude for s in candidates), dtype=np.float64, count=len(candidates)),
+                np.fromiter((s.longitude for s in candidates), dtype=np.float64, count=len(candidates)),
+                k=limit,
+                radius_km=radius_km
+            )
+            
+            results = []
+            for row_indices, row_distances in zip(indices.tolist(), distances.tolist()):
+                matches = [
+                    (candidates[i], distance_km)
+                    for i, distance_km in zip(row_indices, row_distances)
+                    if i >= 0
+                ]
+                results.append(self._from_index_matches(matches))
+            
+            logger.info(f"Batch shelter search: {len(points)} points, radius={radius_km}km, limit={limit}")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in batch shelter search: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return [[] for _ in points]
+    
+    async def get_assigned_shelters_batch(
+        self,
+        points: Sequence[Tuple[float, float]],
+        radius_km: float = 2.0,
+        limit: int = 3
+    ) -> List[List[ShelterInfo]]:
+        """
+        수용 인원을 고려한 다수 좌표 대피소 배정
+        
+        좌표마다 최근접 후보 SHELTER_ASSIGNMENT_CANDIDATES개 중에서 전체 도보 거리가
+        작아지도록 대피소를 배정한다. 수용 인원이 없는(미상) 대피소는 제한 없이 취급한다.
+        
+        Args:
+            points: (위도, 경도) 목록 (사용자 1명 = 1좌표)
+            radius_km: 검색 반경 (km)
+            limit: 좌표당 최대 결과 수
+        
+        Returns:
+            좌표 순서와 동일한 대피소 리스트 목록.
+            각 리스트의 첫 번째가 배정된 대피소이고, 나머지는 거리 순 대안.
+        """
+        if not points:
+            return []
+        
+        try:
+            candidates = await self._load_batch_candidates(points, radius_km)
+            if not candidates:
+                return [[] for _ in points]
+            
+            user_coords = np.asarray(points, dtype=np.float64)
+            indices, distances = batch_nearest(
+                user_coords[:, 0],
+                user_coords[:, 1],
+                np.fromiter((s.latitude for s in candidates), dtype=np.float64, count=len(candidates)),
+                np.fromiter((s.longitude for s in candidates), dtype=np.float64, count=len(candidates)),
+                k=max(limit, settings.SHELTER_ASSIGNMENT_CANDIDATES),
+                radius_km=radius_km
+            )
+            
+            capacities = np.array([
+                np.floor(s.capacity * settings.SHELTER_ASSIGNMENT_CAPACITY_SHARE) if s.capacity is not None else np.inf
+                for s in candidates
+            ], dtype=np.float64)
+            assigned, overflowed = assign_with_capacity(indices, distances, capacities)
+            
+            results = []
+            for row_indices, row_distances, assigned_index in zip(indices.tolist(), distances.tolist(), assigned.tolist()):
+                matches = [
+                    (candidates[i], distance_km)
+                    for i, distance_km in zip(row_indices, row_distances)
+                    if i >= 0
+                ]
+                if assigned_index >= 0:
+                    # 배정된 대피소를 맨 앞으로, 나머지는 거리 순 유지
+                    assigned_shelter = candidates[assigned_index]
+                    matches.sort(key=lambda match: match[0] is not assigned_shelter)
+                results.append(self._from_index_matches(matches[:limit]))
+            
+            moved = int(np.count_nonzero((assigned >= 0) & (assigned != indices[:, 0])))
+            logger.info(
+                f"Capacity-aware assignment: {len(points)} points, "
+                f"{moved} redirected from nearest, {int(overflowed.sum())} over capacity"
+            )
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in capacity-aware shelter assignment: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return await self.get_nearest_shelters_batch(points, radius_km, limit)
+    
+    async def _load_batch_candidates(
+        self,
+        points: Sequence[Tuple[float, float]],
+        radius_km: float
+    ) -> List[IndexedShelter]:
+        """일괄 검색 후보 대피소 로드 (인덱스 전체 또는 좌표 범위를 덮는 사각형 내 SQL 1회 조회)"""
+        if self._use_index:
+            return self.index.all_shelters()
+        
+        lats = [p[0] for p in points]
+        lngs = [p[1] for p in points]
+        min_lat = bounding_box(min(lats), 0.0, radius_km)[0]
+        max_lat = bounding_box(max(lats), 0.0, radius_km)[1]
+        
+        # 경도 여유폭은 사각형 전체에서 가장 극에 가까운 위도 기준 (경도 끝 사용자가 어느 위도에 있어도 포함)
+        d_lng = longitude_span_deg(max(abs(min_lat), abs(max_lat)), radius_km)
+        if d_lng >= 180.0:
+            min_lng, max_lng = -180.0, 180.0
+        else:
+            min_lng, max_lng = min(lngs) - d_lng, max(lngs) + d_lng
+        
+        result = await execute_shelter_read(
+            self.db,
+            build_shelters_in_box_query(("id",) + SHELTER_COLUMNS),
+            {
+                "min_lat": min_lat,
+                "max_lat": max_lat,
+                "min_lng": min_lng,
+                "max_lng": max_lng
+            }
+        )
+        
+        return [IndexedShelter.from_row(row) for row in result.fetchall()]
+    
+    async def _cached_search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int,
+        shelter_category: Optional[str] = None
+    ) -> List[ShelterInfo]:
+        """
+        geohash 셀 캐시를 거친 반경 검색
+        
+        캐시에는 셀 안의 어느 위치에서 검색해도 정답을 포함하는 후보 집합이
+        저장되며, 호출자마다 정확한 거리로 다시 정렬해 반환한다.
+        """
+        # 변경 시 무효화 범위가 SHELTER_CACHE_MAX_RADIUS_KM까지이므로 더 큰 반경은 캐시하지 않음
+        if not shelter_cache.is_available or radius_km > settings.SHELTER_CACHE_MAX_RADIUS_KM:
+            return await self._search_nearby(latitude, longitude, radius_km, limit, shelter_category)
+        
+        cell = shelter_cache.cell_of(latitude, longitude)
+        candidates = await shelter_cache.get_candidates(cell, shelter_category, radius_km, limit)
+        
+        if candidates is None:
+            candidates = await self._collect_cell_candidates(cell, radius_km, limit, shelter_category)
+            if candidates is None:
+                # 후보가 너무 많아 셀 단위로 캐시할 수 없는 경우
+                return await self._search_nearby(latitude, longitude, radius_km, limit, shelter_category)
+            await shelter_cache.set_candidates(cell, shelter_category, radius_km, limit, candidates)
+        
+        return self._rerank(candidates, latitude, longitude, radius_km, limit)
+    
+    async def _collect_cell_candidates(
+        self,
+        cell: GeohashCell,
+        radius_km: float,
+        limit: int,
+        shelter_category: Optional[str]
+    ) -> Optional[List[ShelterInfo]]:
+        """
+        셀 내부 어느 지점에서든 상위 limit개 결과를 보장하는 후보 집합 계산
+        
+        셀 중심 기준 k번째 거리를 D_k, 셀 대각선 길이를 d라 하면
+        셀 안 어느 지점의 상위 k개도 중심 거리 D_k + d 이내에 있다.
+        
+        Returns:
+            후보 목록 (최대 후보 수를 넘어 잘린 경우 None)
+        """
+        max_candidates = settings.SHELTER_CACHE_MAX_CANDIDATES
+        found = await self._search_nearby(
+            cell.center_latitude,
+            cell.center_longitude,
+            radius_km + cell.diagonal_km,
+            max_candidates,
+            shelter_category
+        )
+        
+        if len(found) < limit:
+            return found if len(found) < max_candidates else None
+        
+        # distance_km은 소수 둘째 자리로 반올림되어 있으므로 여유분 추가
+        threshold_km = found[limit - 1].distance_km + cell.diagonal_km + 0.01
+        candidates = [s for s in found if s.distance_km <= threshold_km]
+        
+        if len(found) >= max_candidates and len(candidates) == len(found):
+            return None
+        return candidates
+    
+    def _rerank(
+        self,
+        candidates: List[ShelterInfo],
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int
+    ) -> List[ShelterInfo]:
+        """후보를 호출자 위치 기준 정확한 거리로 다시 계산해 정렬"""
+        ranked = []
+        for shelter in candidates:
+            distance_km = haversine_km(latitude, longitude, shelter.latitude, shelter.longitude)
+            if distance_km <= radius_km:
+                ranked.append((distance_km, shelter))
+        
+        ranked.sort(key=lambda item: item[0])
+        return [
+            shelter.model_copy(update={
+                "distance_km": round(distance_km, 2),
+                "walking_minutes": self._calculate_walking_time(distance_km)
+            })
+            for distance_km, shelter in ranked[:limit]
+        ]
+    
+    async def _search_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: int,
+        shelter_category: Optional[str] = None
+    ) -> List[ShelterInfo]:
+        """
+        반경 내 대피소 검색 (캐시 미적용)
+        
+        공간 인덱스가 준비되어 있으면 인덱스를, 아니면 SQL을 사용한다.
+        shelter_category가 주어지면 해당 분류의 대피소만 검색한다.
+        """
+        if self._use_index:
+            predicate = (lambda s: s.shelter_category == shelter_category) if shelter_category else None
+            matches = self.index.query_radius(latitude, longitude, radius_km, limit=limit, predicate=predicate)
+            return self._from_index_matches(matches)
+        
+        # bounding box로 후보를 좁힌 뒤 거리 계산
+        # 분류 동등 조건은 (shelter_category, latitude, longitude) 인덱스 사용
+        extra_conditions = ["shelter_category = :shelter_category"] if shelter_category else []
+        query = build_nearby_shelters_query(("id",) + SHELTER_COLUMNS, extra_conditions=extra_conditions)
+        
+        params = {
+            **bounding_box_params(latitude, longitude, radius_km),
+            "limit": limit
+        }
+        if shelter_category:
+            params["shelter_category"] = shelter_category
+        
+        result = await execute_shelter_read(self.db, query, params)
+        
+        rows = result.fetchall()
+        logger.info(f"Query returned {len(rows)} rows")
+        
+        shelters = []
+        for row in rows:
+            distance_km = float(row.distance_km)
+            walking_minutes = self._calculate_walking_time(distance_km)
+            
+            shelter = ShelterInfo(
+                id=row.id,
+                name=row.name,
+                address=row.address,
+                shelter_type=row.shelter_type.strip(),
+                latitude=float(row.latitude),
+                longitude=float(row.longitude),
+                capacity=row.capacity,
+                distance_km=round(distance_km, 2),
+                walking_minutes=walking_minutes
+            )
+            shelters.append(shelter)
+        
+        return shelters
+    
+    async def _fetch_shelters_page(
+        self,
+        shelter_type: str,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        after: Optional[Tuple[float, str]]
+    ) -> list:
+        """
+        커서 이후 거리순 limit개 조회 (반경을 넓혀 가며)
+        
+        반경 안의 행은 모두 bounding box 안에 있으므로, 반경 안에서 limit개를 찾으면
+        그 뒤의 행은 모두 더 멀다. 그래서 거리 계산은 유형 전체가 아니라
+        커서 거리 + 반경 안의 행에만 한다.
+        """
+        after_distance = after[0] if after is not None else 0.0
+        step_km = PAGE_SEARCH_RADIUS_KM
+        
+        while True:
+            radius_km = after_distance + step_km
+            bounded = radius_km < PAGE_SEARCH_MAX_RADIUS_KM
+            query = build_shelters_page_query(
+                ("id",) + SHELTER_COLUMNS,
+                extra_conditions=["shelter_type = :shelter_type"],
+                after=after is not None,
+                bounded=bounded
+            )
+            params = {
+                "user_lat": latitude,
+                "user_lng": longitude,
+                "shelter_type": shelter_type,
+                "limit": limit
+            }
+            if bounded:
+                params.update(bounding_box_params(latitude, longitude, radius_km))
+            if after is not None:
+                params["after_distance"], params["after_id"] = after
+            
+            result = await execute_shelter_read(self.db, query, params)
+            fetched = result.fetchall()
+            if len(fetched) >= limit or not bounded:
+                return fetched
+            step_km *= 4
+    
     def _calculate_walking_time(self, distance_km: float) -> int:
         """
         도보 소요 시간 계산
@@ -245,77 +511,69 @@ class ShelterFinder:
         shelter_type: str,
         latitude: float,
         longitude: float,
-        offset: int = 0,
-        limit: int = 20
-    ) -> List[ShelterInfo]:
+        limit: int = 20,
+        cursor: Optional[ShelterCursor] = None
+    ) -> Tuple[List[ShelterInfo], Optional[ShelterCursor]]:
         """
-        대피소 유형 + 거리순 검색
+        대피소 유형 + 거리순 검색 (keyset 페이지네이션)
+        
+        (거리, id) 순으로 정렬하고 cursor 이후 항목부터 limit개를 반환한다.
         
         Args:
             shelter_type: 대피소 유형
             latitude: 위도
             longitude: 경도
-            offset: 오프셋
             limit: 최대 결과 수
+            cursor: 이전 페이지가 반환한 커서 (None이면 첫 페이지)
         
         Returns:
-            거리순으로 정렬된 대피소 목록
+            (거리순으로 정렬된 대피소 목록, 다음 페이지 커서 - 마지막 페이지면 None)
         """
         try:
-            query = text("""
-                SELECT 
-                    name,
-                    address,
-                    shelter_type,
+            after = cursor.key if cursor else None
+            
+            if self._use_index:
+                matches = self.index.nearest(
                     latitude,
                     longitude,
-                    (
-                        6371 * acos(
-                            LEAST(1.0,
-                                cos(radians(:lat)) * cos(radians(latitude)) *
-                                cos(radians(longitude) - radians(:lng)) +
-                                sin(radians(:lat)) * sin(radians(latitude))
-                            )
-                        )
-                    ) AS distance_km
-                FROM shelters
-                WHERE TRIM(shelter_type) = :shelter_type
-                  AND latitude IS NOT NULL
-                  AND longitude IS NOT NULL
-                ORDER BY distance_km
-                OFFSET :offset
-                LIMIT :limit
-            """)
-            
-            result = await self.db.execute(
-                query,
-                {
-                    "lat": latitude,
-                    "lng": longitude,
-                    "shelter_type": shelter_type,
-                    "offset": offset,
-                    "limit": limit
-                }
-            )
-            
-            shelters = []
-            for row in result.fetchall():
-                distance_km = float(row.distance_km)
-                walking_minutes = self._calculate_walking_time(distance_km)
+                    k=limit + 1,
+                    predicate=lambda s: s.shelter_type == shelter_type,
+                    after=after
+                )
+                rows = [(shelter.id, distance_km) for shelter, distance_km in matches]
+                shelters = self._from_index_matches(matches[:limit])
+            else:
+                fetched = await self._fetch_shelters_page(shelter_type, latitude, longitude, limit + 1, after)
                 
-                shelter = ShelterInfo(
-                    name=row.name,
-                    address=row.address,
-                    shelter_type=row.shelter_type.strip(),
-                    latitude=float(row.latitude),
-                    longitude=float(row.longitude),
-                    distance_km=round(distance_km, 2),
-                    walking_minutes=walking_minutes
+                rows = [(str(row.id), float(row.distance_km)) for row in fetched]
+                shelters = [
+                    ShelterInfo(
+                        id=row.id,
+                        name=row.name,
+                        address=row.address,
+                        shelter_type=row.shelter_type.strip(),
+                        latitude=float(row.latitude),
+                        longitude=float(row.longitude),
+                        capacity=row.capacity,
+                        distance_km=round(float(row.distance_km), 2),
+                        walking_minutes=self._calculate_walking_time(float(row.distance_km))
+                    )
+                    for row in fetched[:limit]
+                ]
+            
+            next_cursor = None
+            if len(rows) > limit:
+                last_id, last_distance_km = rows[limit - 1]
+                next_cursor = ShelterCursor(
+                    latitude=latitude,
+                    longitude=longitude,
+                    shelter_type=shelter_type,
+                    distance_km=last_distance_km,
+                    shelter_id=last_id
                 )
-                shelters.append(shelter)
             
-            return shelters
+            return shelters, next_cursor
             
         except Exception as e:
             logger.error(f"Error finding shelters by type and location: {e}")
-            return []
\ No newline at end of file
+            return [], None
@@ -9,9 +9,11 @@ from datetime import datetime
 import uuid
 import asyncio
 
-from ..models.shelter import Shelter
+from ..models.shelter import Shelter, shelter_category_of
 from ..external.public_data_client import public_data_client
 from ..external.google_maps import get_coordinates_from_address
+from .shelter_cache import shelter_cache
+from .shelter_snapshot import shelter_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +86,10 @@ class ShelterImportService:
             # 3. 최종 커밋
             await self.db.commit()
             
+            # 4. 주변 대피소 검색 캐시 무효화 및 오프라인 스냅샷 재생성
+            await shelter_cache.invalidate()
+            await self._rebuild_snapshots()
+            
             return {
                 "total": len(shelter_data),
                 "success": saved_count,
@@ -143,12 +149,15 @@ class ShelterImportService:
                 else:
                     return None
             
+            normalized_type = self._normalize_shelter_type(shelter_type)
+            
             # ✅ Shelter 모델 생성 (latitude/longitude 직접 저장)
             shelter = Shelter(
                 id=uuid.uuid4(),
                 name=name[:255],
                 address=address[:512],
-                shelter_type=self._normalize_shelter_type(shelter_type),
+                shelter_type=normalized_type,
+                shelter_category=shelter_category_of(normalized_type),
                 latitude=latitude,  # ✅ 변경
                 longitude=longitude,  # ✅ 변경
                 capacity=self._extract_capacity(description),
@@ -169,6 +178,7 @@ class ShelterImportService:
     
     def _normalize_shelter_type(self, shelter_type: Optional[str]) -> str:
         """대피소 유형 정규화"""
+        shelter_type = (shelter_type or "").strip()
         if not shelter_type:
             return "민방위대피소"
         
@@ -208,6 +218,13 @@ class ShelterImportService:
         
         return None
     
+    async def _rebuild_snapshots(self):
+        """오프라인 스냅샷 재생성 (실패해도 import 결과에는 영향 없음)"""
+        try:
+            await shelter_snapshots.rebuild(self.db)
+        except Exception as e:
+            logger.error(f"❌ 대피소 스냅샷 재생성 실패: {e}")
+    
     async def clear_all_shelters(self) -> int:
         """
         기존 대피소 데이터 전체 삭제
@@ -219,6 +236,8 @@ class ShelterImportService:
             result = await self.db.execute(delete(Shelter))
             count = result.rowcount
             await self.db.commit()
+            await shelter_cache.invalidate()
+            await self._rebuild_snapshots()
             
             logger.info(f"🗑️  기존 대피소 데이터 삭제 완료: {count}건")
             return count
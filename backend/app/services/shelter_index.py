@@ -0,0 +1,308 @@
+"""
+대피소 인메모리 공간 인덱스 (균등 위경도 격자)
+
+startup 시 대피소 DB를 한 번 읽어 격자 셀 단위로 좌표를 버킷팅하고,
+반경 검색/최근접 k개 검색을 DB 왕복 없이 처리한다.
+"""
+import math
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..geo import EARTH_RADIUS_KM, KM_PER_DEGREE_LAT, haversine_km, longitude_span_deg
+from ..models.shelter import shelter_category_of
+
+logger = logging.getLogger(__name__)
+
+CellKey = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class IndexedShelter:
+    """인덱스에 저장되는 대피소 레코드 (불변)"""
+    id: str
+    name: str
+    address: str
+    shelter_type: str
+    latitude: float
+    longitude: float
+    capacity: Optional[int] = None
+    shelter_category: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row) -> "IndexedShelter":
+        """shelters 조회 결과 행(id, name, address, shelter_type, latitude, longitude, capacity)에서 생성"""
+        shelter_type = (row.shelter_type or "").strip()
+        return cls(
+            id=str(row.id),
+            name=row.name,
+            address=row.address,
+            shelter_type=shelter_type,
+            latitude=float(row.latitude),
+            longitude=float(row.longitude),
+            capacity=row.capacity,
+            shelter_category=shelter_category_of(shelter_type)
+        )
+
+
+class _IndexState:
+    """
+    인덱스 스냅샷
+
+    한 번 만들어진 뒤에는 수정하지 않으며, 갱신은 새 스냅샷을 만들어
+    참조를 교체하는 방식으로만 이루어진다.
+    """
+
+    __slots__ = ("cells", "by_id", "cell_range", "version")
+
+    def __init__(
+        self,
+        cells: Dict[CellKey, Tuple[IndexedShelter, ...]],
+        by_id: Dict[str, IndexedShelter],
+        version: int
+    ):
+        self.cells = cells
+        self.by_id = by_id
+        self.version = version
+
+        if cells:
+            rows = [key[0] for key in cells]
+            cols = [key[1] for key in cells]
+            self.cell_range = (min(rows), max(rows), min(cols), max(cols))
+        else:
+            self.cell_range = None
+
+
+class ShelterSpatialIndex:
+    """
+    균등 위경도 격자 기반 대피소 공간 인덱스
+
+    - 셀 크기(도)는 SHELTER_INDEX_CELL_DEG 설정값 사용
+    - 반경 검색: 반경을 덮는 셀만 순회하며 정확한 Haversine 거리로 필터링
+    - 최근접 검색: 검색 반경을 두 배씩 늘려가며 k개를 채울 때까지 반복
+    """
+
+    def __init__(self, cell_size_deg: Optional[float] = None):
+        self.cell_size_deg = cell_size_deg or settings.SHELTER_INDEX_CELL_DEG
+        self._state: Optional[_IndexState] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """인덱스가 로드되어 검색 가능한지 여부"""
+        return self._state is not None
+
+    @property
+    def size(self) -> int:
+        """인덱싱된 대피소 수"""
+        return len(self._state.by_id) if self._state else 0
+
+    @property
+    def version(self) -> int:
+        """현재 스냅샷 버전 (로드/갱신마다 증가)"""
+        return self._state.version if self._state else 0
+
+    def _cell_of(self, latitude: float, longitude: float) -> CellKey:
+        return (
+            math.floor(latitude / self.cell_size_deg),
+            math.floor(longitude / self.cell_size_deg)
+        )
+
+    async def load(self, db: AsyncSession) -> int:
+        """
+        대피소 DB에서 좌표가 있는 대피소 전체를 읽어 인덱스 구축
+
+        Args:
+            db: 대피소 DB 세션
+
+        Returns:
+            인덱싱된 대피소 수
+        """
+        result = await db.execute(text("""
+            SELECT id, name, address, shelter_type, latitude, longitude, capacity
+            FROM shelters
+            WHERE latitude IS NOT NULL
+              AND longitude IS NOT NULL
+        """))
+
+        shelters = [IndexedShelter.from_row(row) for row in result.fetchall()]
+
+        self.build(shelters)
+        logger.info(f"🗺️  대피소 공간 인덱스 로드 완료: {len(shelters)}개 (셀 크기 {self.cell_size_deg}°)")
+        return len(shelters)
+
+    def build(self, shelters: List[IndexedShelter]) -> None:
+        """대피소 목록으로 새 스냅샷을 만들어 교체"""
+        buckets: Dict[CellKey, List[IndexedShelter]] = {}
+        by_id: Dict[str, IndexedShelter] = {}
+
+        for shelter in shelters:
+            by_id[shelter.id] = shelter
+            buckets.setdefault(self._cell_of(shelter.latitude, shelter.longitude), []).append(shelter)
+
+        cells = {key: tuple(items) for key, items in buckets.items()}
+        self._state = _IndexState(cells, by_id, self.version + 1)
+
+    def apply_changes(
+        self,
+        upserts: Iterable[IndexedShelter] = (),
+        deleted_ids: Iterable[str] = ()
+    ) -> int:
+        """
+        변경된 대피소만 반영한 새 스냅샷으로 교체 (전체 재로드 없음)
+
+        바뀐 셀의 버킷만 새로 만들고 나머지 셀은 이전 스냅샷과 공유한다.
+        검색 중인 코드는 교체 전 스냅샷을 계속 사용하므로 잠금이 필요 없다.
+
+        Args:
+            upserts: 추가/수정된 대피소
+            deleted_ids: 삭제된 대피소 id
+
+        Returns:
+            새 스냅샷 버전 (인덱스가 로드되지 않았으면 0)
+        """
+        state = self._state
+        if state is None:
+            return 0
+
+        upserts = list(upserts)
+        cells = dict(state.cells)
+        by_id = dict(state.by_id)
+        touched: Dict[CellKey, List[IndexedShelter]] = {}
+
+        def bucket(key: CellKey) -> List[IndexedShelter]:
+            if key not in touched:
+                touched[key] = list(cells.get(key, ()))
+            return touched[key]
+
+        for shelter_id in [*deleted_ids, *(s.id for s in upserts)]:
+            old = by_id.pop(shelter_id, None)
+            if old is not None:
+                items = bucket(self._cell_of(old.latitude, old.longitude))
+                items[:] = [item for item in items if item.id != shelter_id]
+
+        for shelter in upserts:
+            by_id[shelter.id] = shelter
+            bucket(self._cell_of(shelter.latitude, shelter.longitude)).append(shelter)
+
+        for key, items in touched.items():
+            if items:
+                cells[key] = tuple(items)
+            else:
+                cells.pop(key, None)
+
+        self._state = _IndexState(cells, by_id, state.version + 1)
+        return self._state.version
+
+    def all_shelters(self) -> List[IndexedShelter]:
+        """인덱싱된 대피소 전체 (현재 스냅샷 기준)"""
+        return list(self._state.by_id.values()) if self._state else []
+
+    def clear(self) -> None:
+        """인덱스 비활성화 (이후 검색은 SQL 경로 사용)"""
+        self._state = None
+
+    def query_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        limit: Optional[int] = None,
+        predicate: Optional[Callable[[IndexedShelter], bool]] = None
+    ) -> List[Tuple[IndexedShelter, float]]:
+        """
+        반경 내 대피소 검색
+
+        Args:
+            latitude: 기준 위도
+            longitude: 기준 경도
+            radius_km: 검색 반경 (km)
+            limit: 최대 결과 수 (None이면 전체)
+            predicate: 추가 필터 (예: 대피소 유형)
+
+        Returns:
+            (대피소, 거리 km) 리스트 (거리 순 정렬)
+        """
+        state = self._state
+        if state is None or state.cell_range is None:
+            return []
+
+        d_lat = radius_km / KM_PER_DEGREE_LAT
+        d_lng = longitude_span_deg(abs(latitude) + d_lat, radius_km)
+
+        min_row, max_row, min_col, max_col = state.cell_range
+        row_start = max(min_row, math.floor((latitude - d_lat) / self.cell_size_deg))
+        row_end = min(max_row, math.floor((latitude + d_lat) / self.cell_size_deg))
+        col_start = max(min_col, math.floor((longitude - d_lng) / self.cell_size_deg))
+        col_end = min(max_col, math.floor((longitude + d_lng) / self.cell_size_deg))
+
+        matches: List[Tuple[IndexedShelter, float]] = []
+        cells = state.cells
+
+        for row in range(row_start, row_end + 1):
+            for col in range(col_start, col_end + 1):
+                bucket = cells.get((row, col))
+                if not bucket:
+                    continue
+
+                for shelter in bucket:
+                    if predicate is not None and not predicate(shelter):
+                        continue
+                    distance_km = haversine_km(latitude, longitude, shelter.latitude, shelter.longitude)
+                    if distance_km <= radius_km:
+                        matches.append((shelter, distance_km))
+
+        matches.sort(key=lambda item: (item[1], item[0].id))
+        return matches[:limit] if limit is not None else matches
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int,
+        max_radius_km: Optional[float] = None,
+        predicate: Optional[Callable[[IndexedShelter], bool]] = None,
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[Tuple[IndexedShelter, float]]:
+        """
+        최근접 k개 대피소 검색
+
+        반경을 셀 크기에서 시작해 두 배씩 늘리며, k개 이상 찾으면 중단한다.
+        반경 내 결과는 정확한 거리로 정렬되므로 결과는 정확한 kNN이다.
+        after가 주어지면 (거리, id)가 그보다 큰 대피소만 대상으로 하며,
+        반경도 after 거리에서부터 늘려간다 (keyset 페이지네이션).
+
+        Args:
+            latitude: 기준 위도
+            longitude: 기준 경도
+            k: 결과 수
+            max_radius_km: 최대 검색 반경 (None이면 제한 없음)
+            predicate: 추가 필터
+            after: 이전 페이지 마지막 항목의 (거리 km, id)
+
+        Returns:
+            (대피소, 거리 km) 리스트 ((거리, id) 순 정렬)
+        """
+        if self._state is None or k <= 0:
+            return []
+
+        ceiling_km = max_radius_km if max_radius_km is not None else math.pi * EARTH_RADIUS_KM
+        start_km = after[0] if after is not None else 0.0
+        step_km = self.cell_size_deg * KM_PER_DEGREE_LAT
+        radius_km = min(ceiling_km, start_km + step_km)
+
+        while True:
+            matches = self.query_radius(latitude, longitude, radius_km, predicate=predicate)
+            if after is not None:
+                matches = [m for m in matches if (m[1], m[0].id) > after]
+            if len(matches) >= k or radius_km >= ceiling_km:
+                return matches[:k]
+            step_km *= 2
+            radius_km = min(ceiling_km, start_km + step_km)
+
+
+# 싱글톤 인스턴스
+shelter_index = ShelterSpatialIndex()
@@ -0,0 +1,221 @@
+"""
+대피소 변경 알림 수신 (Postgres LISTEN/NOTIFY)
+
+shelters 테이블 트리거(app/db/migrations/003_shelters_change_notify.sql)가 보내는
+알림을 shelter_engine의 asyncpg 연결로 받아, 바뀐 행만 다시 읽어 인메모리
+공간 인덱스에 반영한다. 짧은 시간 안에 몰린 알림은 한 번에 모아 처리한다.
+
+검색 캐시(Redis)는 모든 워커가 공유하므로, 변경 알림마다 한 워커만 바뀐 대피소
+주변 셀을 무효화한다.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from ..core.config import settings
+from ..db.session import shelter_engine, ShelterAsyncSessionLocal
+from .shelter_cache import shelter_cache
+from .shelter_index import IndexedShelter, ShelterSpatialIndex, shelter_index
+
+logger = logging.getLogger(__name__)
+
+SHELTER_CHANGE_CHANNEL = "shelter_changes"
+
+# 한 번에 이보다 많은 행이 바뀌면 개별 조회 대신 전체 재로드
+FULL_RELOAD_THRESHOLD = 5000
+
+# 변경 키 → 바뀐 대피소의 변경 전/후 좌표 (None이면 캐시 전체 무효화)
+Changes = Dict[str, Optional[List[Tuple[float, float]]]]
+
+
+class ShelterChangeListener:
+    """대피소 변경 알림을 받아 공간 인덱스를 증분 갱신"""
+
+    def __init__(self, index: Optional[ShelterSpatialIndex] = None):
+        self.index = index or shelter_index
+        self.debounce_seconds = settings.SHELTER_INDEX_RELOAD_DEBOUNCE_SECONDS
+        self.retry_seconds = 5.0  # 반영 실패 시 재시도 간격
+        self._pending_ids: Set[str] = set()
+        self._full_reload = False
+        self._pending_changes: Changes = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._connection_lost: Optional[asyncio.Event] = None
+
+    async def start(self):
+        """알림 수신 시작 (연결이 끊기면 자동 재연결)"""
+        if self._listen_task is None:
+            self._listen_task = asyncio.create_task(self._listen_loop())
+
+    async def stop(self):
+        """알림 수신 중단"""
+        for task in (self._listen_task, self._flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listen_task = None
+        self._flush_task = None
+
+    async def _listen_loop(self):
+        reconnect = False
+        while True:
+            try:
+                async with shelter_engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    driver_connection = raw.driver_connection
+
+                    self._connection_lost = asyncio.Event()
+                    driver_connection.add_termination_listener(lambda _: self._connection_lost.set())
+                    await driver_connection.add_listener(SHELTER_CHANGE_CHANNEL, self._on_notify)
+                    logger.info(f"📡 대피소 변경 알림 수신 시작 (채널: {SHELTER_CHANGE_CHANNEL})")
+
+                    # 끊겨 있던 동안 놓친 변경을 반영
+                    if reconnect:
+                        self._full_reload = True
+                        # 무엇이 바뀌었는지 모르므로 이 워커가 직접 캐시 전체 무효화
+                        self._merge_changes({f"reconnect:{uuid.uuid4().hex}": None})
+                        self._schedule_flush()
+
+                    try:
+                        await self._connection_lost.wait()
+                    finally:
+                        if not driver_connection.is_closed():
+                            await driver_connection.remove_listener(SHELTER_CHANGE_CHANNEL, self._on_notify)
+
+                logger.warning("대피소 변경 알림 연결이 끊어졌습니다. 재연결합니다.")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Shelter change listener error: {str(e)}")
+
+            reconnect = True
+            await asyncio.sleep(5)
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        """asyncpg 알림 콜백 (이벤트 루프에서 동기 호출)"""
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            logger.warning(f"잘못된 대피소 변경 알림: {payload}")
+            return
+
+        if change.get("op") == "TRUNCATE":
+            self._full_reload = True
+            self._merge_changes({self._change_key(change, "truncate"): None})
+        elif change.get("id"):
+            self._pending_ids.add(str(change["id"]))
+            if len(self._pending_ids) > FULL_RELOAD_THRESHOLD:
+                self._full_reload = True
+            points = change.get("points")
+            self._merge_changes({
+                self._change_key(change, str(change["id"])):
+                    [tuple(point) for point in points] if points is not None else None
+            })
+
+        self._schedule_flush()
+
+    def _change_key(self, change: dict, target: str) -> str:
+        """워커들이 같은 알림을 알아보는 키 (txid가 없는 예전 트리거면 이 워커만의 키)"""
+        txid = change.get("txid")
+        return f"{txid}:{target}" if txid is not None else f"local:{uuid.uuid4().hex}"
+
+    def _merge_changes(self, changes: Changes):
+        for key, points in changes.items():
+            if key in self._pending_changes:
+                current = self._pending_changes[key]
+                points = None if current is None or points is None else current + points
+            self._pending_changes[key] = points
+
+    def _schedule_flush(self):
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """디바운스 후 반영 (반영하는 동안 들어온 변경이 없어질 때까지 반복)"""
+        delay = self.debounce_seconds
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self.flush()
+                delay = self.debounce_seconds
+            except Exception as e:
+                logger.error(f"Shelter index incremental update error: {str(e)}")
+                delay = max(self.debounce_seconds, self.retry_seconds)
+
+            if not self._pending_ids and not self._full_reload:
+                return
+
+    async def flush(self):
+        """쌓인 변경을 인덱스에 반영하고 검색 캐시 무효화 (실패하면 변경을 되돌려 다음에 재시도)"""
+        ids, self._pending_ids = self._pending_ids, set()
+        full_reload, self._full_reload = self._full_reload, False
+        changes, self._pending_changes = self._pending_changes, {}
+
+        if not ids and not full_reload and not changes:
+            return
+
+        try:
+            await self._apply(ids, full_reload, changes)
+        except Exception:
+            self._pending_ids |= ids
+            self._full_reload = (
+                self._full_reload or full_reload or len(self._pending_ids) > FULL_RELOAD_THRESHOLD
+            )
+            self._merge_changes(changes)
+            raise
+
+    async def _apply(self, ids: Set[str], full_reload: bool, changes: Changes):
+        # 복제 지연이 없도록 primary에서 조회
+        async with ShelterAsyncSessionLocal() as db:
+            if full_reload:
+                await self.index.load(db)
+            elif self.index.is_ready:
+                result = await db.execute(
+                    text("""
+                        SELECT id, name, address, shelter_type, latitude, longitude, capacity
+                        FROM shelters
+                        WHERE id = ANY(CAST(:ids AS uuid[]))
+                          AND latitude IS NOT NULL
+                          AND longitude IS NOT NULL
+                    """),
+                    {"ids": list(ids)}
+                )
+                upserts = [IndexedShelter.from_row(row) for row in result.fetchall()]
+                # 다시 읽히지 않은 id는 삭제되었거나 좌표가 없어진 행
+                found = {shelter.id for shelter in upserts}
+                version = self.index.apply_changes(upserts, ids - found)
+                logger.info(
+                    f"🗺️  대피소 인덱스 증분 갱신: {len(upserts)}개 반영, "
+                    f"{len(ids - found)}개 제거 (버전 {version})"
+                )
+
+        await self._invalidate_cache(changes)
+
+    async def _invalidate_cache(self, changes: Changes):
+        """이 워커가 잡은 변경의 주변 셀만 검색 캐시에서 무효화"""
+        if not changes:
+            return
+
+        claimed = await shelter_cache.claim_changes(list(changes))
+        if any(changes[key] is None for key in claimed):
+            await shelter_cache.invalidate()
+            return
+
+        geohashes = shelter_cache.cells_affected_by(
+            point for key in claimed for point in changes[key]
+        )
+        if geohashes is None:
+            await shelter_cache.invalidate()
+        elif geohashes:
+            await shelter_cache.invalidate_cells(geohashes)
+
+
+# 싱글톤 인스턴스
+shelter_change_listener = ShelterChangeListener()
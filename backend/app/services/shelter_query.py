@@ -0,0 +1,157 @@
+"""
+대피소 거리 검색 SQL 빌더 (bounding box 선필터)
+
+검색 반경을 위경도 사각형으로 변환해 먼저 걸러내고(복합 인덱스 사용),
+살아남은 행에 대해서만 대원 거리를 계산한다.
+"""
+from typing import Dict, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from ..geo import EARTH_RADIUS_KM, bounding_box
+
+# 사용자 좌표(:user_lat, :user_lng)와 대피소 좌표 간 대원 거리 (km)
+# app.geo.haversine_km과 같은 공식을 사용해 인덱스/SQL 경로의 거리가 일치하도록 한다
+# (acos 공식은 수 m 거리에서 정밀도가 떨어짐)
+DISTANCE_KM_SQL = f"""(
+                        2 * {EARTH_RADIUS_KM} * asin(
+                            LEAST(1.0, sqrt(
+                                power(sin(radians(latitude - :user_lat) / 2), 2) +
+                                cos(radians(:user_lat)) * cos(radians(latitude)) *
+                                power(sin(radians(longitude - :user_lng) / 2), 2)
+                            ))
+                        )
+                    )"""
+
+
+def bounding_box_params(latitude: float, longitude: float, radius_km: float) -> Dict[str, float]:
+    """build_nearby_shelters_query()에 전달할 좌표/반경 바인딩 파라미터"""
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+    return {
+        "user_lat": latitude,
+        "user_lng": longitude,
+        "radius_km": radius_km,
+        "min_lat": min_lat,
+        "max_lat": max_lat,
+        "min_lng": min_lng,
+        "max_lng": max_lng
+    }
+
+
+def build_nearby_shelters_query(
+    columns: Sequence[str],
+    extra_conditions: Sequence[str] = ()
+) -> TextClause:
+    """
+    반경 내 대피소를 거리 순으로 조회하는 SQL 생성
+
+    바인딩 파라미터: bounding_box_params()의 결과 + :limit
+    (+ extra_conditions에서 사용하는 파라미터)
+
+    Args:
+        columns: 조회할 shelters 컬럼 목록 (distance_km는 자동 추가)
+        extra_conditions: 추가 WHERE 조건 (AND로 결합)
+
+    Returns:
+        실행 가능한 TextClause
+    """
+    column_list = ",\n                    ".join(columns)
+    conditions = "".join(f"\n                  AND {condition}" for condition in extra_conditions)
+
+    return text(f"""
+            SELECT
+                    {column_list},
+                    distance_km
+            FROM (
+                SELECT
+                    {column_list},
+                    {DISTANCE_KM_SQL} AS distance_km
+                FROM shelters
+                WHERE latitude BETWEEN :min_lat AND :max_lat
+                  AND longitude BETWEEN :min_lng AND :max_lng{conditions}
+            ) AS shelter_distances
+            WHERE distance_km <= :radius_km
+            ORDER BY distance_km ASC
+            LIMIT :limit
+        """)
+
+
+def build_shelters_in_box_query(columns: Sequence[str]) -> TextClause:
+    """
+    위경도 사각형 내 대피소 전체 조회 SQL 생성 (일괄 검색 후보 로드용)
+
+    바인딩 파라미터: :min_lat, :max_lat, :min_lng, :max_lng
+    """
+    column_list = ",\n                ".join(columns)
+
+    return text(f"""
+            SELECT
+                {column_list}
+            FROM shelters
+            WHERE latitude BETWEEN :min_lat AND :max_lat
+              AND longitude BETWEEN :min_lng AND :max_lng
+        """)
+
+
+def build_shelters_page_query(
+    columns: Sequence[str],
+    extra_conditions: Sequence[str] = (),
+    after: bool = False,
+    bounded: bool = False
+) -> TextClause:
+    """
+    거리순 대피소 목록의 한 페이지를 조회하는 keyset SQL 생성
+
+    (distance_km, id) 순으로 정렬하고, after가 True이면 이전 페이지 마지막
+    키보다 큰 행부터 조회한다. OFFSET과 달리 앞 페이지 행을 건너뛰기 위해
+    정렬 상위 N개를 유지할 필요는 없지만, 거리는 조회 범위의 모든 행에 대해
+    계산한다. bounded가 False면 유형의 전체 행을 훑으므로(O(테이블)) 호출하는
+    쪽에서 bounded=True로 반경을 넓혀 가며 조회한다.
+
+    바인딩 파라미터: :user_lat, :user_lng, :limit
+    (+ after면 :after_distance, :after_id,
+     + bounded면 bounding_box_params()의 결과, + extra_conditions 파라미터)
+
+    Args:
+        columns: 조회할 shelters 컬럼 목록 (id가 포함되어야 함, distance_km는 자동 추가)
+        extra_conditions: 추가 WHERE 조건 (AND로 결합)
+        after: 이전 페이지 커서 조건 포함 여부
+        bounded: :radius_km 안의 행만 조회 (bounding box 선필터)
+
+    Returns:
+        실행 가능한 TextClause
+    """
+    column_list = ",\n                    ".join(columns)
+    if bounded:
+        extra_conditions = [
+            "latitude BETWEEN :min_lat AND :max_lat",
+            "longitude BETWEEN :min_lng AND :max_lng",
+            *extra_conditions
+        ]
+    conditions = "".join(f"\n                  AND {condition}" for condition in extra_conditions)
+    outer_conditions = []
+    if after:
+        outer_conditions.append("(distance_km, id) > (:after_distance, CAST(:after_id AS uuid))")
+    if bounded:
+        outer_conditions.append("distance_km <= :radius_km")
+    keyset = (
+        "\n            WHERE " + "\n              AND ".join(outer_conditions)
+        if outer_conditions else ""
+    )
+
+    return text(f"""
+            SELECT
+                    {column_list},
+                    distance_km
+            FROM (
+                SELECT
+                    {column_list},
+                    {DISTANCE_KM_SQL} AS distance_km
+                FROM shelters
+                WHERE latitude IS NOT NULL
+                  AND longitude IS NOT NULL{conditions}
+            ) AS shelter_distances{keyset}
+            ORDER BY distance_km ASC, id ASC
+            LIMIT :limit
+        """)
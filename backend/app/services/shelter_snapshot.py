@@ -0,0 +1,289 @@
+"""
+오프라인 대피소 스냅샷 (모바일 기기 배포용)
+
+대피소 전체를 위경도 타일(지역) 단위 샤드로 나눠 압축된 컬럼형 바이너리로
+저장한다. 샤드마다 내용 해시(ETag)가 있어 기기는 바뀐 샤드만 다시 받는다.
+
+샤드 파일 형식 (zlib 압축 전, 리틀 엔디언):
+    헤더        : magic b"PESS" | 형식 버전 uint16 | 대피소 수 N uint32
+    id          : N x 16바이트 (UUID)
+    위도/경도   : N x int32 (마이크로도, 1e-6도 ≈ 0.11m) x 2
+    수용 인원   : N x int32 (없으면 -1)
+    분류 코드   : N x uint8 (0=없음, 1=민방위, 2=지진, 3=해일, 4=기타)
+    문자열 컬럼 : 이름, 주소, 유형 순으로 각각 N x uint16 바이트 길이 + UTF-8 연결 데이터
+
+파일은 SHELTER_SNAPSHOT_DIR에 {샤드}.bin과 manifest.json으로 저장되며,
+import 스크립트 등 다른 프로세스에서 재생성해도 서버가 바로 반영한다.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import struct
+import uuid
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..core.config import settings
+from ..models.shelter import SHELTER_CATEGORIES
+from .shelter_index import IndexedShelter
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"PESS"
+SNAPSHOT_FORMAT_VERSION = 1
+MANIFEST_FILENAME = "manifest.json"
+
+_HEADER = struct.Struct("<4sHI")
+_CATEGORY_CODES = {category: code for code, category in enumerate(SHELTER_CATEGORIES, start=1)}
+_CATEGORY_NAMES = {code: category for category, code in _CATEGORY_CODES.items()}
+
+
+def shard_of(latitude: float, longitude: float, tile_deg: float) -> str:
+    """좌표가 속한 샤드 ID ("{위도 타일}_{경도 타일}")"""
+    return f"{math.floor(latitude / tile_deg)}_{math.floor(longitude / tile_deg)}"
+
+
+def encode_shard(shelters: List[IndexedShelter]) -> bytes:
+    """
+    대피소 목록을 샤드 바이너리로 인코딩
+
+    같은 대피소 집합이면 입력 순서와 관계없이 같은 바이트열이 나오도록
+    id 순으로 정렬한다 (ETag 안정성).
+    """
+    shelters = sorted(shelters, key=lambda s: s.id)
+    count = len(shelters)
+
+    parts = [_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, count)]
+    parts.append(b"".join(uuid.UUID(s.id).bytes for s in shelters))
+    parts.append(np.array([round(s.latitude * 1e6) for s in shelters], dtype="<i4").tobytes())
+    parts.append(np.array([round(s.longitude * 1e6) for s in shelters], dtype="<i4").tobytes())
+    parts.append(np.array(
+        [s.capacity if s.capacity is not None else -1 for s in shelters], dtype="<i4"
+    ).tobytes())
+    parts.append(np.array(
+        [_CATEGORY_CODES.get(s.shelter_category, 0) for s in shelters], dtype="u1"
+    ).tobytes())
+
+    for field in ("name", "address", "shelter_type"):
+        encoded = [_encode_field(getattr(s, field)) for s in shelters]
+        parts.append(np.array([len(value) for value in encoded], dtype="<u2").tobytes())
+        parts.append(b"".join(encoded))
+
+    return zlib.compress(b"".join(parts), 9)
+
+
+def _encode_field(value: str) -> bytes:
+    """UTF-8 문자열 필드 (길이 필드 u2에 맞게 자르되, 한글 등 멀티바이트 문자 중간에서 끊지 않음)"""
+    return value.encode("utf-8")[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")
+
+
+def decode_shard(data: bytes) -> List[IndexedShelter]:
+    """
+    encode_shard()의 역변환 (모바일 클라이언트 구현 참고용)
+
+    Raises:
+        ValueError: 형식이 올바르지 않은 데이터
+    """
+    raw = zlib.decompress(data)
+    magic, version, count = _HEADER.unpack_from(raw, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 스냅샷 형식: {magic!r} v{version}")
+
+    offset = _HEADER.size
+
+    def take(dtype: str, size: int) -> np.ndarray:
+        nonlocal offset
+        array = np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
+        offset += size * count
+        return array
+
+    ids = [str(uuid.UUID(bytes=raw[offset + 16 * i: offset + 16 * (i + 1)])) for i in range(count)]
+    offset += 16 * count
+    latitudes = take("<i4", 4)
+    longitudes = take("<i4", 4)
+    capacities = take("<i4", 4)
+    categories = take("u1", 1)
+
+    strings = {}
+    for field in ("name", "address", "shelter_type"):
+        lengths = take("<u2", 2)
+        values = []
+        for length in lengths.tolist():
+            values.append(raw[offset:offset + length].decode("utf-8"))
+            offset += length
+        strings[field] = values
+
+    return [
+        IndexedShelter(
+            id=ids[i],
+            name=strings["name"][i],
+            address=strings["address"][i],
+            shelter_type=strings["shelter_type"][i],
+            latitude=int(latitudes[i]) / 1e6,
+            longitude=int(longitudes[i]) / 1e6,
+            capacity=int(capacities[i]) if capacities[i] >= 0 else None,
+            shelter_category=_CATEGORY_NAMES.get(int(categories[i]))
+        )
+        for i in range(count)
+    ]
+
+
+def build_snapshot(
+    shelters: List[IndexedShelter],
+    tile_deg: float
+) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    """
+    대피소 목록을 샤드로 나눠 인코딩
+
+    Returns:
+        (manifest, {샤드 ID: 샤드 바이너리})
+    """
+    groups: Dict[str, List[IndexedShelter]] = {}
+    for shelter in shelters:
+        groups.setdefault(shard_of(shelter.latitude, shelter.longitude, tile_deg), []).append(shelter)
+
+    payloads: Dict[str, bytes] = {}
+    shards: Dict[str, Dict[str, Any]] = {}
+    for shard_id in sorted(groups):
+        members = groups[shard_id]
+        payload = encode_shard(members)
+        payloads[shard_id] = payload
+
+        row, col = (int(part) for part in shard_id.split("_"))
+        shards[shard_id] = {
+            "etag": hashlib.sha256(payload).hexdigest()[:32],
+            "count": len(members),
+            "bytes": len(payload),
+            "bounds": [row * tile_deg, (row + 1) * tile_deg, col * tile_deg, (col + 1) * tile_deg]
+        }
+
+    version = hashlib.sha256(
+        "".join(f"{shard_id}:{meta['etag']};" for shard_id, meta in shards.items()).encode("utf-8")
+    ).hexdigest()[:32]
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "version": version,
+        "tile_deg": tile_deg,
+        "total_count": len(shelters),
+        "generated_at": datetime.utcnow().isoformat(),
+        "shards": shards
+    }
+    return manifest, payloads
+
+
+class ShelterSnapshotStore:
+    """
+    샤드 파일 저장소
+
+    manifest.json의 수정 시각이 바뀌면 메모리 캐시를 비우고 다시 읽으므로,
+    다른 프로세스가 재생성한 스냅샷도 재시작 없이 제공된다.
+    """
+
+    def __init__(self, directory: Optional[str] = None, tile_deg: Optional[float] = None):
+        self.directory = Path(directory or settings.SHELTER_SNAPSHOT_DIR)
+        self.tile_deg = tile_deg or settings.SHELTER_SNAPSHOT_TILE_DEG
+        self._manifest: Optional[Dict[str, Any]] = None
+        self._manifest_mtime: Optional[float] = None
+        self._shards: Dict[str, bytes] = {}
+
+    async def rebuild(self, db: AsyncSession) -> Dict[str, Any]:
+        """
+        대피소 DB 전체로 스냅샷 재생성
+
+        Args:
+            db: 대피소 DB 세션
+
+        Returns:
+            새 manifest
+        """
+        result = await db.execute(text("""
+            SELECT id, name, address, shelter_type, latitude, longitude, capacity
+            FROM shelters
+            WHERE latitude IS NOT NULL
+              AND longitude IS NOT NULL
+        """))
+        shelters = [IndexedShelter.from_row(row) for row in result.fetchall()]
+
+        manifest = await asyncio.to_thread(self._write, shelters)
+        logger.info(
+            f"📦 대피소 스냅샷 생성 완료: {manifest['total_count']}개, "
+            f"샤드 {len(manifest['shards'])}개 (버전 {manifest['version'][:8]})"
+        )
+        return manifest
+
+    def _write(self, shelters: List[IndexedShelter]) -> Dict[str, Any]:
+        """샤드 파일과 manifest 기록 (manifest를 마지막에 교체해 읽는 쪽이 항상 완전한 버전을 보도록 함)"""
+        manifest, payloads = build_snapshot(shelters, self.tile_deg)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        for shard_id, payload in payloads.items():
+            path = self.directory / f"{shard_id}.bin"
+            if path.exists() and path.read_bytes() == payload:
+                continue
+            self._atomic_write(path, payload)
+
+        self._atomic_write(
+            self.directory / MANIFEST_FILENAME,
+            json.dumps(manifest, ensure_ascii=False).encode("utf-8")
+        )
+
+        # 더 이상 manifest에 없는 샤드 정리
+        for path in self.directory.glob("*.bin"):
+            if path.stem not in payloads:
+                path.unlink(missing_ok=True)
+
+        return manifest
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def manifest(self) -> Optional[Dict[str, Any]]:
+        """현재 manifest (스냅샷이 아직 없으면 None)"""
+        path = self.directory / MANIFEST_FILENAME
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if mtime != self._manifest_mtime:
+            self._manifest = json.loads(path.read_text(encoding="utf-8"))
+            self._manifest_mtime = mtime
+            self._shards = {}
+        return self._manifest
+
+    def read_shard(self, shard_id: str) -> Optional[Tuple[bytes, str]]:
+        """
+        샤드 바이너리와 ETag 조회
+
+        manifest에 없는 샤드 ID는 파일 경로로 쓰지 않고 None을 반환한다.
+        """
+        manifest = self.manifest()
+        if not manifest or shard_id not in manifest["shards"]:
+            return None
+
+        payload = self._shards.get(shard_id)
+        if payload is None:
+            try:
+                payload = (self.directory / f"{shard_id}.bin").read_bytes()
+            except FileNotFoundError:
+                return None
+            self._shards[shard_id] = payload
+
+        return payload, manifest["shards"][shard_id]["etag"]
+
+
+# 싱글톤 인스턴스
+shelter_snapshots = ShelterSnapshotStore()
@@ -8,8 +8,14 @@ import logging
 
 from app.core.config import settings
 from app.core.logging import setup_logging
-from app.api.v1.endpoints import shelters, disasters, health, admin, action_cards, fcm, users, training, rewards
-from app.db.session import log_shelter_db_info
+from app.api.v1.endpoints import shelters, disasters, health, admin, action_cards, fcm, users, training, rewards, metrics
+from app.db.session import log_shelter_db_info, ShelterAsyncSessionLocal, shelter_replicas
+from app.services.shelter_index import shelter_index
+from app.services.shelter_listener import shelter_change_listener
+from app.services.shelter_cache import shelter_cache
+from app.services.disaster_events import disaster_events
+from app.external.ollama_client import ollama_client
+from app.services.shelter_snapshot import shelter_snapshots
 # Phase 2: DB 연동 시 활성화 예정
 # from app.api.v1.endpoints import user, shelters
 # from app.background.tasks import disaster_polling_task
@@ -27,6 +33,35 @@ async def lifespan(app: FastAPI):
     # 대피소 DB 연결 정보 로깅 (추가)
     log_shelter_db_info()
     
+    # 대피소 공간 인덱스 로드 (실패 시 SQL 검색 경로로 동작)
+    if settings.SHELTER_INDEX_ENABLED:
+        try:
+            async with ShelterAsyncSessionLocal() as db:
+                await shelter_index.load(db)
+        except Exception as e:
+            logger.warning(f"Shelter spatial index load failed, using SQL fallback: {e}")
+        
+        # 대피소 테이블 변경 시 인덱스 증분 갱신 (재시작/주기적 재로드 불필요)
+        if settings.SHELTER_INDEX_LIVE_RELOAD:
+            await shelter_change_listener.start()
+    
+    # 오프라인 대피소 스냅샷 (아직 생성된 적 없으면 생성)
+    if shelter_snapshots.manifest() is None:
+        try:
+            async with ShelterAsyncSessionLocal() as db:
+                await shelter_snapshots.rebuild(db)
+        except Exception as e:
+            logger.warning(f"Shelter snapshot build failed: {e}")
+    
+    # 대피소 DB 읽기 복제본 헬스 체크 시작 (설정 없으면 무시)
+    await shelter_replicas.start()
+    
+    # 주변 대피소 검색 캐시 (Redis 연결 실패 시 캐시 없이 동작)
+    await shelter_cache.initialize_redis()
+    
+    # 새 재난 실시간 스트림 (Redis 연결 실패 시 이 프로세스 구독자에게만 전달)
+    await disaster_events.initialize_redis()
+    
     # Phase 2: 백그라운드 재난 폴링 (DB 연동 시 활성화)
     # await disaster_polling_task.start()
     # logger.info("Disaster polling task started")
@@ -35,6 +70,11 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     logger.info("Shutting down PES Backend...")
+    await shelter_change_listener.stop()
+    await shelter_cache.close()
+    await disaster_events.close()
+    await ollama_client.close()
+    await shelter_replicas.stop()
     # Phase 2: 백그라운드 태스크 종료
     # await disaster_polling_task.stop()
     # logger.info("Disaster polling task stopped")
@@ -64,6 +104,12 @@ app.include_router(
     tags=["Health"]
 )
 
+app.include_router(
+    metrics.router,
+    prefix="/api/v1/metrics",
+    tags=["Metrics"]
+)
+
 # Phase 2: 사용자 프로필 및 대피소 API (DB 연동 시 활성화)
 # app.include_router(
 #     user.router,
@@ -147,6 +147,7 @@ async def main():
                     name=station['name'],
                     address=station['address'],
                     shelter_type='민방위대피소',
+                    shelter_category='민방위',
                     latitude=latitude,
                     longitude=longitude,
                     capacity=5000,  # 지하철역은 수용 인원 5000명으로 설정
@@ -0,0 +1,52 @@
+"""
+사용자 행정구역 경로(users.region_path) 재정규화 스크립트
+
+admin_region을 재난 수신 지역과 같은 파서(region_parser)로 다시 정규화한다.
+004 마이그레이션의 SQL 백필은 광역시도 약칭만 바꾸므로 "경기 안산 단원구"처럼
+시군구 약칭이 들어간 값이 수신 지역 경로와 어긋날 수 있다. 위치를 업데이트하는
+활성 사용자는 앱이 알아서 고치므로 마이그레이션 직후 한 번 실행하면 된다.
+
+실행: python scripts/backfill_region_path.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+
+from app.db.session import AsyncSessionLocal
+from app.models.user import User
+from app.services.region_targeting import normalize_region
+
+BATCH_SIZE = 1000
+
+
+async def main():
+    """admin_region이 있는 사용자의 region_path 재계산"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(User.id, User.admin_region, User.region_path)
+            .where(User.admin_region.isnot(None))
+        )
+        rows = result.all()
+
+        updated = 0
+        for row in rows:
+            region_path = normalize_region(row.admin_region)
+            if region_path == row.region_path:
+                continue
+            user = await db.get(User, row.id)
+            user.region_path = region_path
+            updated += 1
+            if updated % BATCH_SIZE == 0:
+                await db.commit()
+                print(f"💾 중간 저장: {updated}건")
+
+        await db.commit()
+        print(f"✅ region_path 재정규화 완료: {updated}/{len(rows)}건 변경")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+지리 계산 마이크로 벤치마크 (app.geo)
+
+/training/check(1초마다 호출)처럼 좌표 한 쌍의 거리를 반복 계산하는 경로와
+다수 좌표를 한 번에 계산하는 벡터화 경로의 호출당 비용을 비교한다.
+
+실행: python scripts/benchmark_geo.py [반복 횟수]
+"""
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from app.geo import (
+    haversine_km,
+    haversine_km_np,
+    haversine_matrix,
+    equirectangular_km,
+    equirectangular_km_np,
+    bearing_deg,
+    bearing_deg_np
+)
+
+
+def _random_points(count: int, seed: int = 42):
+    """안산시 주변 10km 이내 무작위 좌표"""
+    rng = random.Random(seed)
+    return [
+        (37.30 + rng.uniform(-0.09, 0.09), 126.84 + rng.uniform(-0.11, 0.11))
+        for _ in range(count)
+    ]
+
+
+def _report(label: str, seconds: float, calls: int):
+    print(f"  {label:40s}: {seconds / calls * 1e9:10.1f} ns/호출")
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    print("=" * 70)
+    print("📐 app.geo 마이크로 벤치마크")
+    print("=" * 70)
+
+    # 1. 스칼라 (훈련 완료 확인 경로)
+    print(f"\n[스칼라] 좌표 한 쌍, {number:,}회 반복")
+    user, shelter = (37.295692, 126.841425), (37.296100, 126.841900)
+    for label, func in [
+        ("haversine_km", haversine_km),
+        ("equirectangular_km", equirectangular_km),
+        ("bearing_deg", bearing_deg)
+    ]:
+        seconds = min(timeit.repeat(lambda: func(*user, *shelter), number=number, repeat=3))
+        _report(label, seconds, number)
+
+    # 2. 벡터화 (일괄 검색 경로)
+    size = 100_000
+    points = np.asarray(_random_points(size))
+    targets = np.asarray(_random_points(size, seed=7))
+    print(f"\n[벡터화] 좌표 쌍 {size:,}개")
+    for label, func in [
+        ("haversine_km_np", haversine_km_np),
+        ("equirectangular_km_np", equirectangular_km_np),
+        ("bearing_deg_np", bearing_deg_np)
+    ]:
+        seconds = min(timeit.repeat(
+            lambda: func(points[:, 0], points[:, 1], targets[:, 0], targets[:, 1]),
+            number=10,
+            repeat=3
+        ))
+        _report(label, seconds, size * 10)
+
+    rows, cols = 1_000, 1_000
+    seconds = min(timeit.repeat(
+        lambda: haversine_matrix(points[:rows, 0], points[:rows, 1], targets[:cols, 0], targets[:cols, 1]),
+        number=10,
+        repeat=3
+    ))
+    _report(f"haversine_matrix ({rows}x{cols})", seconds, rows * cols * 10)
+
+    # 3. 근사 오차
+    exact = haversine_km_np(points[:, 0], points[:, 1], targets[:, 0], targets[:, 1])
+    approx = equirectangular_km_np(points[:, 0], points[:, 1], targets[:, 0], targets[:, 1])
+    relative = np.abs(approx - exact) / np.maximum(exact, 1e-12)
+    print(f"\n[오차] equirectangular vs haversine (최대 {exact.max():.1f}km)")
+    print(f"  최대 상대 오차: {relative.max():.2e}")
+    print(f"  최대 절대 오차: {np.abs(approx - exact).max() * 1e6:.3f} mm")
+
+    print("\n" + "=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+행정구역 이름 트라이 빌드 스크립트
+
+app/data/admin_regions.tsv(행정구역 목록)를 읽어 재난 수신 지역 파서
+(app/services/region_parser.py)가 그대로 불러 쓰는 글자 단위 트라이를
+app/data/admin_region_trie.json으로 저장한다. 행정구역이 바뀌면 TSV를 고친 뒤
+다시 실행해 두 파일을 함께 커밋한다.
+
+트라이에 넣는 이름:
+    - 각 행정구역의 마지막 이름 (서울특별시, 안산시, 단원구)
+    - TSV에 적힌 약칭 (서울, 서울시, 경기)
+    - 시/군의 접미사를 뗀 이름 (안산, 양평). 두 글자 이상일 때만
+
+실행: python scripts/build_region_trie.py
+"""
+import json
+from pathlib import Path
+from typing import Dict, List
+
+DATA_DIR = Path(__file__).parent.parent / "app" / "data"
+SOURCE_PATH = DATA_DIR / "admin_regions.tsv"
+OUTPUT_PATH = DATA_DIR / "admin_region_trie.json"
+
+TRIE_FORMAT_VERSION = 1
+
+# 트라이 노드에서 그 위치에서 끝나는 이름의 행정구역 id 목록을 담는 키
+TERMINAL_KEY = "$"
+
+
+def load_regions(path: Path) -> List[Dict]:
+    """TSV를 [{path, aliases}] 목록으로 읽기 (주석/빈 줄 제외)"""
+    regions = []
+    seen = set()
+    for line_no, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip() or line.startswith("#"):
+            continue
+        columns = line.split("\t")
+        region_path = " ".join(columns[0].split())
+        if region_path in seen:
+            raise ValueError(f"{path.name}:{line_no}: 중복된 행정구역 {region_path}")
+        parent = region_path.rsplit(" ", 1)[0] if " " in region_path else None
+        if parent and parent not in seen:
+            raise ValueError(f"{path.name}:{line_no}: 상위 행정구역 {parent}이(가) 먼저 나와야 합니다")
+        seen.add(region_path)
+
+        aliases = [alias.strip() for alias in columns[1].split(",")] if len(columns) > 1 else []
+        regions.append({"path": region_path, "aliases": [alias for alias in aliases if alias]})
+    return regions
+
+
+def names_of(region: Dict) -> List[str]:
+    """행정구역 하나를 가리키는 이름 목록"""
+    name = region["path"].split()[-1]
+    names = [name] + region["aliases"]
+    if name[-1] in ("시", "군") and len(name) >= 3 and " " in region["path"]:
+        names.append(name[:-1])
+    return list(dict.fromkeys(names))
+
+
+def build_trie(regions: List[Dict]) -> Dict:
+    trie: Dict = {}
+    for region_id, region in enumerate(regions):
+        for name in names_of(region):
+            node = trie
+            for char in name:
+                node = node.setdefault(char, {})
+            node.setdefault(TERMINAL_KEY, []).append(region_id)
+    return trie
+
+
+def main():
+    regions = load_regions(SOURCE_PATH)
+    compiled = {
+        "format_version": TRIE_FORMAT_VERSION,
+        "regions": [region["path"] for region in regions],
+        "trie": build_trie(regions)
+    }
+
+    OUTPUT_PATH.write_text(
+        json.dumps(compiled, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n",
+        encoding="utf-8"
+    )
+    print(f"✅ 행정구역 {len(regions)}개 → {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
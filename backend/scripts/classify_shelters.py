@@ -10,7 +10,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.db.session import ShelterAsyncSessionLocal
 from sqlalchemy import select
-from app.models.shelter import Shelter
+from app.models.shelter import Shelter, shelter_category_of
+from app.services.shelter_cache import shelter_cache
+from app.services.shelter_snapshot import shelter_snapshots
 
 # 분류 규칙 (우선순위 순서)
 CLASSIFICATION_RULES = {
@@ -166,6 +168,7 @@ async def main():
                 
                 # 유형 업데이트
                 shelter.shelter_type = new_type
+                shelter.shelter_category = shelter_category_of(new_type)
                 classification_stats[new_type] += 1
                 updated_count += 1
                 
@@ -189,6 +192,11 @@ async def main():
             # 3. 최종 커밋
             await db.commit()
             
+            # 유형이 바뀌었으므로 주변 대피소 검색 캐시 무효화 및 오프라인 스냅샷 재생성
+            await shelter_cache.invalidate()
+            await shelter_cache.close()
+            await shelter_snapshots.rebuild(db)
+            
             # 4. 결과 출력
             print("\n" + "=" * 70)
             print("✅ 분류 완료")
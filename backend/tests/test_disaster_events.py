@@ -0,0 +1,49 @@
+"""
+새 재난 실시간 스트림 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+
+from app.services.disaster_events import DisasterEventBroker, region_matches
+
+
+def _event(msg_id, region_codes):
+    return {"msg_id": msg_id, "region_codes": region_codes}
+
+
+def test_region_matches_ancestors_and_nationwide():
+    ansan = frozenset({"경기도 안산시"})
+    assert region_matches(ansan, ["경기도 안산시 단원구"])
+    assert region_matches(ansan, ["경기도"])
+    assert region_matches(ansan, ["전국"])
+    assert region_matches(ansan, None)
+    assert not region_matches(ansan, ["경기도 안양시"])
+    assert region_matches(None, ["부산광역시"])
+
+
+def test_broker_delivers_to_matching_subscribers_without_redis():
+    async def run():
+        broker = DisasterEventBroker()
+        broker.queue_size = 2
+        async with broker.subscribe(frozenset({"경기도 안산시"})) as ansan, broker.subscribe() as everyone:
+            await broker.publish(_event("1", ["경기도 안산시 상록구"]))
+            await broker.publish(_event("2", ["부산광역시"]))
+            await broker.publish(_event("3", ["전국"]))
+            await broker.publish(_event("4", ["경기도"]))
+
+            ansan_ids = [ansan.get_nowait()["msg_id"] for _ in range(ansan.qsize())]
+            everyone_ids = [everyone.get_nowait()["msg_id"] for _ in range(everyone.qsize())]
+            assert broker.stats()["subscribers"] == 2
+        return ansan_ids, everyone_ids, broker.stats()
+
+    ansan_ids, everyone_ids, stats = asyncio.run(run())
+    # 큐가 차면 오래된 이벤트부터 버림
+    assert ansan_ids == ["3", "4"]
+    assert everyone_ids == ["3", "4"]
+    assert stats["subscribers"] == 0
+    assert stats["published"] == 4
@@ -0,0 +1,131 @@
+"""
+재난문자 폴링 (워터마크 / 폭주 시 페이지 이동) 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+
+import httpx
+
+from app.services.disaster_poller import DisasterPoller
+
+
+def _api(latest: int, oldest: int, requests: list):
+    """일련번호 latest..oldest 재난문자를 최신순으로 페이지 단위 응답"""
+    rows = [
+        {"MD101_SN": str(sn), "CRT_DT": "2025-07-01T10:00:00", "MSG": f"재난문자 {sn}"}
+        for sn in range(latest, oldest - 1, -1)
+    ]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        page_no = int(request.url.params["pageNo"])
+        num_rows = int(request.url.params["numOfRows"])
+        requests.append((page_no, num_rows))
+        page = rows[(page_no - 1) * num_rows:page_no * num_rows]
+        return httpx.Response(200, json={"DisasterMsg": {"row": page}})
+
+    return handler
+
+
+def _poller(handler, watermark=None, max_pages=10) -> DisasterPoller:
+    poller = DisasterPoller()
+    poller.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    poller.probe_rows = 3
+    poller.page_size = 4
+    poller.max_pages = max_pages
+    poller._watermark = watermark
+    return poller
+
+
+def _sequences(disasters):
+    return [int(disaster["MD101_SN"]) for disaster in disasters]
+
+
+async def _poll_and_commit(poller):
+    """폴링 후 저장에 성공한 것처럼 결과 반영"""
+    disasters = await poller.poll_disasters()
+    await poller.commit()
+    return disasters
+
+
+def test_burst_pages_until_watermark_and_times_the_whole_poll():
+    requests = []
+    poller = _poller(_api(110, 90, requests), watermark=100)
+
+    disasters = asyncio.run(_poll_and_commit(poller))
+
+    assert _sequences(disasters) == list(range(110, 100, -1))
+    # 작은 첫 페이지 확인 → 모두 새 메시지라 워터마크에 닿을 때까지 페이지 이동
+    assert requests == [(1, 3), (1, 4), (2, 4), (3, 4)]
+    assert poller._watermark == 110
+    stats = poller.stats()
+    assert stats["polls"] == 1
+    assert stats["requests"] == 4
+
+
+def test_quiet_poll_only_probes_first_page():
+    requests = []
+    poller = _poller(_api(102, 90, requests), watermark=100)
+
+    disasters = asyncio.run(_poll_and_commit(poller))
+
+    assert _sequences(disasters) == [102, 101]
+    assert requests == [(1, 3)]
+    assert poller._watermark == 102
+
+
+def test_page_cap_keeps_watermark_and_resumes_the_gap_on_later_polls():
+    requests = []
+    poller = _poller(_api(120, 80, requests), watermark=100, max_pages=2)
+    seen = []
+
+    async def poll(latest=None):
+        if latest is not None:
+            poller.http_client = httpx.AsyncClient(transport=httpx.MockTransport(_api(latest, 80, requests)))
+        seen.extend(_sequences(await _poll_and_commit(poller)))
+
+    # 1차: 상한(2페이지)에 걸림 → 워터마크는 그대로, 읽다 만 위치 기록
+    asyncio.run(poll())
+    assert seen == list(range(120, 112, -1))
+    assert poller._watermark == 100
+    assert poller._resume is not None
+
+    # 2차: 새 메시지 2건 + 이어서 2페이지, 3차/4차: 이어서 워터마크까지
+    asyncio.run(poll(latest=122))
+    asyncio.run(poll())
+    asyncio.run(poll())
+
+    assert sorted(seen) == list(range(101, 123))
+    assert len(seen) == len(set(seen))
+    assert poller._resume is None
+    assert poller._watermark == 122
+
+
+def test_uncommitted_poll_is_read_again():
+    requests = []
+    rows = [{"MD101_SN": "102", "CRT_DT": "2025-07-01T10:00:00"}, {"MD101_SN": "101"}, {"MD101_SN": "100"}]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == "v2":
+            return httpx.Response(304)
+        return httpx.Response(200, json={"DisasterMsg": {"row": rows}}, headers={"ETag": "v2"})
+
+    poller = _poller(handler, watermark=100)
+
+    async def run():
+        # 저장 실패 (commit 없음) → 워터마크와 ETag를 올리지 않아 다음 폴링이 다시 받음
+        first = await poller.poll_disasters()
+        second = await _poll_and_commit(poller)
+        third = await poller.poll_disasters()
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert _sequences(first) == _sequences(second) == [102, 101]
+    assert third == []
+    assert requests == [None, None, "v2"]
+    assert poller._watermark == 102
@@ -0,0 +1,85 @@
+"""
+재난 알림 팬아웃 파이프라인 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import time
+
+from app.background.fanout import Stage, run_pipeline
+
+
+def test_pipeline_runs_stages_concurrently():
+    async def lookup(chunk):
+        await asyncio.sleep(0.01)
+        return [(user, f"shelter-{user % 3}") for user in chunk]
+
+    async def card(job):
+        await asyncio.sleep(0.05)
+        return [job]
+
+    async def push(job):
+        if job[0] == 7:
+            raise RuntimeError("push failed")
+        return [job[0]]
+
+    chunks = [list(range(i, i + 10)) for i in range(0, 100, 10)]
+
+    started = time.perf_counter()
+    results, stats = asyncio.run(run_pipeline(chunks, [
+        Stage("shelter_lookup", lookup, workers=2, queue_size=2),
+        Stage("action_card", card, workers=50, queue_size=5),
+        Stage("push", push, workers=4, queue_size=5)
+    ]))
+    elapsed = time.perf_counter() - started
+
+    # 순차 처리라면 100 x 0.05초 = 5초
+    assert elapsed < 1.0
+    assert sorted(results) == [user for user in range(100) if user != 7]
+    assert stats["shelter_lookup"]["processed"] == 10
+    assert stats["action_card"]["processed"] == 100
+    assert stats["push"] == {"processed": 99, "failed": 1, "busy_seconds": stats["push"]["busy_seconds"]}
+
+
+def test_pipeline_with_no_items():
+    async def echo(item):
+        return [item]
+
+    results, stats = asyncio.run(run_pipeline([], [Stage("only", echo, workers=3)]))
+    assert results == []
+    assert stats["only"]["processed"] == 0
+
+
+def test_action_card_generated_once_per_cohort():
+    from app.api.v1.schemas.shelter import ShelterInfo
+    from app.services.action_card_cohorts import ActionCardCohorts
+    from app.services.llm_service import LLMService
+
+    calls = []
+
+    class FakeLLMService(LLMService):
+        async def generate_action_card(self, disaster_type, location, user_profile, shelters, max_retries=3):
+            calls.append((shelters[0].name, shelters[0].distance_km))
+            await asyncio.sleep(0.01)
+            return f"{shelters[0].name}로 {shelters[0].distance_km}km 이동하십시오.", "llm"
+
+    def shelter(name, distance_km):
+        return ShelterInfo(
+            name=name, address="경기도 안산시", shelter_type="민방위대피소",
+            latitude=37.3, longitude=126.8, distance_km=distance_km, walking_minutes=5
+        )
+
+    async def run():
+        cohorts = ActionCardCohorts(FakeLLMService(), "지진", "경기도 안산시")
+        jobs = [[shelter("A", 0.52)], [shelter("A", 0.54)], [shelter("A", 0.61)], [shelter("B", 0.52)]] * 50
+        cards = await asyncio.gather(*[cohorts.card_for({"age_group": "성인"}, job) for job in jobs])
+        return cohorts.stats(), cards
+
+    stats, cards = asyncio.run(run())
+    assert stats == {"requests": 200, "cohorts": 3}
+    assert sorted(calls) == [("A", 0.5), ("A", 0.6), ("B", 0.5)]
+    assert cards[0] == cards[1] == ("A로 0.5km 이동하십시오.", "llm")
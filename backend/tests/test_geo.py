@@ -0,0 +1,69 @@
+"""
+공용 지리 계산 모듈 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from app.geo import (
+    bearing_deg,
+    bearing_deg_np,
+    bounding_box,
+    equirectangular_km,
+    equirectangular_km_np,
+    haversine_km,
+    haversine_km_np,
+    haversine_matrix
+)
+
+
+def test_haversine_known_distance():
+    # 서울시청 - 부산시청 약 325km
+    assert haversine_km(37.5665, 126.9780, 35.1796, 129.0756) == pytest.approx(325.0, abs=1.0)
+    assert haversine_km(37.5, 127.0, 37.5, 127.0) == 0.0
+
+
+def test_equirectangular_within_documented_bound():
+    rng = np.random.default_rng(3)
+    lat1 = rng.uniform(33.0, 38.5, 5000)
+    lng1 = rng.uniform(124.5, 131.0, 5000)
+    lat2 = lat1 + rng.uniform(-0.09, 0.09, 5000)
+    lng2 = lng1 + rng.uniform(-0.11, 0.11, 5000)
+
+    exact = haversine_km_np(lat1, lng1, lat2, lng2)
+    approx = equirectangular_km_np(lat1, lng1, lat2, lng2)
+    assert exact.max() < 15.0
+    assert np.max(np.abs(approx - exact) / exact) < 1e-6
+    assert equirectangular_km(lat1[0], lng1[0], lat2[0], lng2[0]) == pytest.approx(approx[0])
+
+
+def test_vectorized_matches_scalar():
+    lat1, lng1 = np.array([37.30, 37.31]), np.array([126.84, 126.80])
+    lat2, lng2 = np.array([37.35, 37.20, 37.30]), np.array([126.90, 126.85, 126.84])
+
+    matrix = haversine_matrix(lat1, lng1, lat2, lng2)
+    for i in range(2):
+        for j in range(3):
+            assert matrix[i, j] == pytest.approx(haversine_km(lat1[i], lng1[i], lat2[j], lng2[j]))
+            assert bearing_deg_np(lat1[i], lng1[i], lat2[j], lng2[j]) == pytest.approx(
+                bearing_deg(lat1[i], lng1[i], lat2[j], lng2[j])
+            )
+
+
+def test_bearing_cardinal_directions():
+    assert bearing_deg(37.0, 127.0, 38.0, 127.0) == pytest.approx(0.0)
+    assert bearing_deg(37.0, 127.0, 37.0, 128.0) == pytest.approx(90.0, abs=0.5)
+    assert bearing_deg(37.0, 127.0, 36.0, 127.0) == pytest.approx(180.0)
+    assert bearing_deg(37.0, 127.0, 37.0, 126.0) == pytest.approx(270.0, abs=0.5)
+
+
+def test_bounding_box_contains_radius():
+    min_lat, max_lat, min_lng, max_lng = bounding_box(37.3, 126.84, 5.0)
+    assert haversine_km(37.3, 126.84, min_lat, 126.84) == pytest.approx(5.0, rel=1e-3)
+    assert haversine_km(37.3, 126.84, 37.3, max_lng) >= 5.0
+    assert bounding_box(89.99, 0.0, 50.0)[2:] == (-180.0, 180.0)
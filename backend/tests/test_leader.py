@@ -0,0 +1,72 @@
+"""
+Redis 임대 리더 선출 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+
+from app.background import leader as leader_module
+from app.background.leader import LeaderLease
+
+
+class FlakyRedis:
+    """SET NX는 성공하고, down이면 모든 명령이 연결 오류"""
+
+    def __init__(self):
+        self.down = False
+
+    async def set(self, key, value, nx=False, px=None):
+        if self.down:
+            raise ConnectionError("redis down")
+        return True
+
+    async def eval(self, script, numkeys, *args):
+        if self.down:
+            raise ConnectionError("redis down")
+        return 1
+
+
+def test_leader_steps_down_when_renewal_keeps_failing(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(leader_module.time, "monotonic", lambda: clock[0])
+    redis_client = FlakyRedis()
+    lease = LeaderLease(redis_client, "disaster:leader", lease_seconds=30)
+
+    async def run():
+        await lease._step()
+        assert lease.is_leader
+
+        redis_client.down = True
+        clock[0] += 20
+        await lease._step()
+        # 임대가 아직 남아 있으면 리더 유지
+        assert lease.is_leader
+
+        clock[0] += 10
+        await lease._step()
+        assert not lease.is_leader
+
+    asyncio.run(run())
+
+
+def test_successful_renewal_extends_the_lease(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(leader_module.time, "monotonic", lambda: clock[0])
+    redis_client = FlakyRedis()
+    lease = LeaderLease(redis_client, "disaster:leader", lease_seconds=30)
+
+    async def run():
+        await lease._step()
+        clock[0] += 25
+        await lease._step()
+
+        redis_client.down = True
+        clock[0] += 25
+        await lease._step()
+        assert lease.is_leader
+
+    asyncio.run(run())
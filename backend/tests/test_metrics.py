@@ -0,0 +1,69 @@
+"""
+재난 알림 지연 지표 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+from datetime import datetime, timedelta
+
+from app.core.metrics import AlertLatencyMetrics, LatencyHistogram, kst_now
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram(buckets=(1, 2, 5, 10))
+    for seconds in [0.5] * 50 + [1.5] * 45 + [8.0] * 5:
+        histogram.observe(seconds)
+
+    summary = histogram.summary()
+    assert summary["count"] == 100
+    assert summary["p50"] == 1.0
+    assert 1.5 <= summary["p95"] <= 2.0
+    assert 5.0 <= summary["p99"] <= 8.0
+    assert summary["max"] == 8.0
+    assert histogram.cumulative_buckets()[-1] == (float("inf"), 100)
+
+
+def test_alert_latency_measured_from_issue_time():
+    metrics = AlertLatencyMetrics()
+    issued_at = datetime(2025, 1, 10, 9, 0, 0)
+
+    metrics.observe("saved", issued_at, at=issued_at + timedelta(seconds=4))
+    metrics.observe("push_sent", issued_at, at=issued_at + timedelta(seconds=12), count=3)
+    metrics.observe("push_sent", None)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["saved"]["count"] == 1
+    assert snapshot["push_sent"]["count"] == 3
+    assert snapshot["push_sent"]["max"] == 12.0
+    assert snapshot["targeted"]["p99"] is None
+    assert 'pes_alert_latency_seconds_count{stage="push_sent"} 3' in metrics.prometheus()
+
+
+def test_latency_uses_korean_time_regardless_of_server_timezone(monkeypatch):
+    # 서버가 UTC로 돌아도 발령 시각(한국 시각 기준)과 같은 기준으로 비교
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    try:
+        metrics = AlertLatencyMetrics()
+        metrics.observe("saved", kst_now() - timedelta(seconds=3))
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+    assert 3.0 <= metrics.snapshot()["saved"]["max"] < 10.0
+
+
+def test_disaster_poller_stats_are_exposed():
+    import asyncio
+    from app.api.v1.endpoints.metrics import get_disaster_poller_metrics, get_prometheus_metrics
+
+    body = asyncio.run(get_disaster_poller_metrics())
+    assert {"polls", "requests", "avg_latency_ms", "leader"} <= set(body)
+
+    text = asyncio.run(get_prometheus_metrics()).body.decode()
+    assert "pes_disaster_poller_polls " in text
+    assert "pes_disaster_poller_http_version" not in text
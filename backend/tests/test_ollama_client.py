@@ -0,0 +1,75 @@
+"""
+Ollama 클라이언트 동시 요청 제한 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.external.ollama_client import OllamaClient, OllamaOverloadedError
+
+
+def _slow_ollama(seconds: float, seen: list):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(client.in_flight)
+        await asyncio.sleep(seconds)
+        return httpx.Response(200, json={"response": "행동카드"})
+
+    client = OllamaClient(
+        endpoint="http://ollama",
+        max_concurrency=2,
+        max_queue=1,
+        timeout=5,
+        transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+def test_concurrency_limit_and_bounded_queue():
+    seen = []
+    client = _slow_ollama(0.05, seen)
+
+    async def run():
+        tasks = [asyncio.create_task(client.generate({"prompt": str(i)})) for i in range(4)]
+        await asyncio.sleep(0.01)
+        depth = (client.in_flight, client.queue_depth)
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        await client.close()
+        return depth, results
+
+    depth, results = asyncio.run(run())
+    assert depth == (2, 1)
+    assert max(seen) <= 2
+    # 슬롯 2개 + 대기 1개를 넘긴 요청은 바로 거절
+    assert sum(isinstance(r, OllamaOverloadedError) for r in results) == 1
+    assert sum(isinstance(r, httpx.Response) for r in results) == 3
+    assert client.stats()["rejected"] == 1
+    assert client.stats()["in_flight"] == 0
+
+
+def test_waiting_past_deadline_fails_fast():
+    seen = []
+    client = _slow_ollama(0.3, seen)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        busy = [asyncio.create_task(client.generate({"prompt": str(i)})) for i in range(2)]
+        await asyncio.sleep(0.01)
+        started = loop.time()
+        with pytest.raises(OllamaOverloadedError):
+            await client.generate({"prompt": "late"}, deadline=loop.time() + 0.05)
+        waited = loop.time() - started
+        await asyncio.gather(*busy)
+        await client.close()
+        return waited
+
+    waited = asyncio.run(run())
+    assert waited < 0.2
+    assert client.stats()["deadline_exceeded"] == 1
+    assert len(seen) == 2
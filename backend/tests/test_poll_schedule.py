@@ -0,0 +1,62 @@
+"""
+재난문자 폴링 주기 조절 / 서킷 브레이커 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.background.scheduler import AdaptivePollSchedule, CircuitBreaker
+
+
+def _schedule(reset_seconds: float = 60.0) -> AdaptivePollSchedule:
+    return AdaptivePollSchedule(
+        base_seconds=10.0,
+        min_seconds=2.0,
+        max_seconds=300.0,
+        breaker=CircuitBreaker(failure_threshold=3, reset_seconds=reset_seconds)
+    )
+
+
+def test_interval_tightens_on_bursts_and_relaxes_when_quiet():
+    schedule = _schedule()
+    for expected in (5.0, 2.5, 2.0, 2.0):
+        schedule.record_success(new_messages=3)
+        assert schedule.next_delay() == expected
+
+    for expected in (4.0, 8.0, 10.0, 10.0):
+        schedule.record_success(new_messages=0)
+        assert schedule.next_delay() == expected
+
+
+def test_backoff_with_jitter_then_breaker_opens():
+    schedule = _schedule()
+
+    schedule.record_failure()
+    assert 10.0 <= schedule.next_delay() <= 20.0
+    schedule.record_failure()
+    assert 20.0 <= schedule.next_delay() <= 40.0
+    assert schedule.breaker.state == CircuitBreaker.CLOSED
+
+    schedule.record_failure()
+    assert schedule.breaker.state == CircuitBreaker.OPEN
+    assert not schedule.breaker.allow_request()
+    assert schedule.next_delay() >= 59.0
+
+    schedule.record_success(new_messages=0)
+    assert schedule.breaker.state == CircuitBreaker.CLOSED
+    assert schedule.next_delay() == 10.0
+
+
+def test_half_open_failure_reopens_breaker():
+    schedule = _schedule(reset_seconds=0.0)
+    for _ in range(3):
+        schedule.record_failure()
+
+    assert schedule.breaker.state == CircuitBreaker.HALF_OPEN
+    assert schedule.breaker.allow_request()
+
+    schedule.breaker.reset_seconds = 60.0
+    schedule.record_failure()
+    assert schedule.breaker.state == CircuitBreaker.OPEN
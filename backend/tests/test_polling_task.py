@@ -0,0 +1,417 @@
+"""
+재난문자 폴링 작업 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import uuid
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
+
+from app.background import tasks as tasks_module
+from app.background.leader import LeaderLease
+from app.background.scheduler import disaster_poll_schedule
+from app.background.streams import StreamQueue
+from app.background.tasks import DisasterPollingTask
+from app.core.config import settings
+
+
+def _message(msg_id, area="서울특별시 강남구"):
+    return {
+        "MD101_SN": msg_id,
+        "DSSTR_SE_NM": "호우",
+        "RCV_AREA_NM": area,
+        "MSG": "호우경보 발령",
+        "EMRG_STEP_NM": "안전안내",
+        "CRT_DT": "2025-07-01T10:00:00"
+    }
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _Savepoint:
+    def __init__(self, session):
+        self.session = session
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, *exc):
+        self.session.savepoints.append("rollback" if exc_type else "release")
+        return False
+
+
+class BadRowSession:
+    """msg_id가 'bad'인 행이 들어간 INSERT는 DB 오류"""
+
+    def __init__(self):
+        self.inserts = []
+        self.savepoints = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement):
+        params = statement.compile(dialect=postgresql.dialect()).params
+        msg_ids = [value for key, value in params.items() if key.startswith("msg_id")]
+        self.inserts.append(msg_ids)
+        if "bad" in msg_ids:
+            raise RuntimeError("value too long for type character varying")
+        return _Result([SimpleNamespace(msg_id=msg_id, disaster_type="호우", location="") for msg_id in msg_ids])
+
+    def begin_nested(self):
+        return _Savepoint(self)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class OutageSession:
+    """down이면 DB에 연결할 수 없는 세션 (아니면 모든 행이 이미 저장된 것처럼 응답)"""
+
+    def __init__(self, down):
+        self.down = down
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        if self.down:
+            raise OperationalError("INSERT INTO disasters", {}, ConnectionRefusedError("connection refused"))
+        return _Result([])
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def test_db_outage_keeps_the_watermark_so_the_next_poll_retries(monkeypatch):
+    rows = [_message(102), _message(101), _message(100)]
+
+    async def handler(request):
+        return httpx.Response(200, json={"DisasterMsg": {"row": rows}})
+
+    task = DisasterPollingTask()
+    task.leader = LeaderLease(None, "disaster_poller:leader", 6.0)
+    task.leader.is_leader = True
+    task.disaster_poller.http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    task.disaster_poller.probe_rows = 3
+    task.disaster_poller._watermark = 100
+
+    async def poll(down):
+        monkeypatch.setattr(tasks_module, "AsyncSessionLocal", lambda: OutageSession(down))
+        await task._poll_once()
+        return task.disaster_poller._watermark
+
+    assert asyncio.run(poll(down=True)) == 100
+    assert asyncio.run(poll(down=False)) == 102
+
+
+def test_late_poll_still_runs_and_keeps_polling():
+    task = DisasterPollingTask()
+    ran = []
+
+    async def poll():
+        ran.append(True)
+
+    task._poll_and_process = poll
+
+    async def run():
+        task.scheduler.start()
+        # 이벤트 루프가 막혀 예약 시각을 몇 초 넘긴 경우
+        task._schedule_next_poll(-5)
+        await asyncio.sleep(0.2)
+        task.scheduler.shutdown(wait=False)
+
+    asyncio.run(run())
+    assert ran == [True]
+
+
+def test_disaster_row_fits_column_lengths():
+    task = DisasterPollingTask()
+    row = task._disaster_row({**_message(1, area="서울특별시 강남구, " * 30), "EMRG_STEP_NM": "긴급" * 40})
+    assert len(row["location"]) == 255
+    assert len(row["severity"]) == 50
+    assert row["msg_id"] == "1"
+
+    # msg_id는 자르면 다른 문자와 겹칠 수 있으므로 저장하지 않음
+    assert task._disaster_row(_message("9" * 300)) is None
+
+
+def test_bad_row_does_not_lose_the_batch():
+    task = DisasterPollingTask()
+    db = BadRowSession()
+
+    saved = asyncio.run(task._save_disasters(db, [_message(1), _message("bad"), _message(2)]))
+
+    assert [disaster.msg_id for disaster in saved] == ["1", "2"]
+    assert db.inserts == [["1", "bad", "2"], ["1"], ["bad"], ["2"]]
+    assert db.savepoints == ["release", "rollback", "release"]
+    assert db.rollbacks == 1
+    assert db.commits == 1
+
+
+class FakeRedis:
+    """알림 스트림 처리에 쓰는 명령만 흉내 낸 Redis"""
+
+    def __init__(self):
+        self.strings = {}
+        self.sets = {}
+        self.streams = {}
+
+    async def smismember(self, key, members):
+        members_set = self.sets.get(key, set())
+        return [member in members_set for member in members]
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = value
+        return True
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def watch(self, *keys):
+        pass
+
+    async def exists(self, key):
+        return int(key in self.redis_client.strings)
+
+    def multi(self):
+        pass
+
+    def set(self, key, value, ex=None):
+        self.commands.append(lambda: self.redis_client.strings.__setitem__(key, value) or True)
+
+    def sadd(self, key, *members):
+        self.commands.append(lambda: self.redis_client.sets.setdefault(key, set()).update(members))
+
+    def expire(self, key, seconds):
+        self.commands.append(lambda: True)
+
+    def xadd(self, stream, fields, maxlen=None, approximate=True):
+        def add():
+            entries = self.redis_client.streams.setdefault(stream, [])
+            entries.append(fields)
+            return f"{len(entries)}-0"
+        self.commands.append(add)
+
+    async def execute(self):
+        results = [command() for command in self.commands]
+        self.commands = []
+        return results
+
+
+class UserSession:
+    def __init__(self, disaster, users):
+        self.disaster = disaster
+        self.users = users
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def get(self, model, disaster_id):
+        return self.disaster if disaster_id == self.disaster.id else None
+
+    async def execute(self, statement):
+        ids = set(statement.compile().params.get("id_1", []))
+        return _Result([user for user in self.users if user.id in ids])
+
+
+def _stream_task(monkeypatch, users, push_fails=()):
+    redis_client = FakeRedis()
+    disaster = SimpleNamespace(id=uuid.uuid4(), disaster_type="호우", location="서울특별시", issued_at=None)
+    pushed = []
+
+    async def lookup(chunk):
+        return [(user, []) for user in chunk if user.fcm_token]
+
+    async def card(cohorts, job):
+        return [(job[0], job[1], "행동카드")]
+
+    async def send(fcm_token, **kwargs):
+        pushed.append(fcm_token)
+        return fcm_token not in push_fails
+
+    task = DisasterPollingTask()
+    task.notification_queue = StreamQueue(redis_client, tasks_module.NOTIFICATION_STREAM, "notifier", 1000)
+    task._lookup_shelters = lookup
+    task._prepare_action_card = card
+    monkeypatch.setattr(tasks_module.fcm_client, "send_action_card_to_user", send)
+    monkeypatch.setattr(tasks_module, "AsyncSessionLocal", lambda: UserSession(disaster, users))
+    return task, disaster, redis_client, pushed
+
+
+def _user(token, latitude=37.5):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        fcm_token=token,
+        location=SimpleNamespace(latitude=latitude, longitude=127.0)
+    )
+
+
+def test_unsent_users_keep_the_entry_pending_and_are_retried_alone(monkeypatch):
+    users = [_user("a"), _user("b"), _user(None), _user("c")]
+    task, disaster, redis_client, pushed = _stream_task(monkeypatch, users, push_fails={"b"})
+    fields = {"disaster_id": str(disaster.id), "user_ids": json.dumps([str(user.id) for user in users])}
+    notified_key = tasks_module.NOTIFIED_KEY.format(disaster_id=disaster.id)
+
+    # 한 명이라도 발송하지 못하면 ack하지 않도록 예외
+    with pytest.raises(RuntimeError):
+        asyncio.run(task._handle_notification_entry(fields))
+    assert sorted(pushed) == ["a", "b", "c"]
+    assert redis_client.sets[notified_key] == {str(users[0].id), str(users[3].id)}
+
+    # 다시 처리할 때는 받지 못한 사용자에게만 발송
+    pushed.clear()
+
+    async def send(fcm_token, **kwargs):
+        pushed.append(fcm_token)
+        return True
+
+    monkeypatch.setattr(tasks_module.fcm_client, "send_action_card_to_user", send)
+    asyncio.run(task._handle_notification_entry(fields))
+    assert pushed == ["b"]
+    assert len(redis_client.sets[notified_key]) == 3
+
+
+def test_disaster_entry_queues_notification_chunks_once(monkeypatch):
+    users = [_user(str(n), latitude=37.0 + (n % 7) / 10) for n in range(5)]
+    task, disaster, redis_client, _ = _stream_task(monkeypatch, users)
+    monkeypatch.setattr(settings, "SHELTER_ASSIGNMENT_ENABLED", True)
+    monkeypatch.setattr(settings, "NOTIFICATION_STREAM_CHUNK_SIZE", 2)
+
+    async def targets(db, target_disaster):
+        return users
+
+    task._get_target_users = targets
+    fields = {"disaster_id": str(disaster.id)}
+
+    async def run():
+        await task._handle_disaster_entry(fields)
+        # ack 전에 중단되어 같은 작업이 다시 처리된 경우
+        await task._handle_disaster_entry(fields)
+
+    asyncio.run(run())
+    entries = redis_client.streams[tasks_module.NOTIFICATION_STREAM]
+    # 배정을 켜도 작업은 NOTIFICATION_STREAM_CHUNK_SIZE 단위, 가까운 사용자끼리
+    assert [len(json.loads(entry["user_ids"])) for entry in entries] == [2, 2, 1]
+    latitudes = [
+        next(user.location.latitude for user in users if str(user.id) == user_id)
+        for entry in entries for user_id in json.loads(entry["user_ids"])
+    ]
+    assert latitudes == sorted(latitudes)
+
+
+def test_followers_report_the_polling_status_published_by_the_leader():
+    redis_client = FakeRedis()
+
+    def task_with_role(is_leader):
+        task = DisasterPollingTask()
+        task.disaster_poller.redis_client = redis_client
+        task.leader = LeaderLease(redis_client, "disaster_poller:leader", 6.0)
+        task.leader.is_leader = is_leader
+        return task
+
+    leader, follower = task_with_role(True), task_with_role(False)
+
+    async def run():
+        before = await follower.polling_status()
+        await follower._publish_poll_status()
+        await leader._publish_poll_status()
+        return before, await follower.polling_status()
+
+    before, after = asyncio.run(run())
+    assert before == {"instance": follower.leader.status(), "leader": None}
+    assert after["instance"] == {"instance_id": follower.leader.instance_id, "is_leader": False}
+    assert after["leader"]["leader"] == leader.leader.instance_id
+    assert after["leader"]["interval_seconds"] == disaster_poll_schedule.status()["interval_seconds"]
+    assert "published_at" in after["leader"]
+
+
+class SlotRedis:
+    """임대 키 SET NX / 반납 스크립트만 흉내 낸 Redis"""
+
+    def __init__(self):
+        self.strings = {}
+
+    async def set(self, key, value, nx=False, px=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+    async def eval(self, script, numkeys, key, owner, *args):
+        if self.strings.get(key) != owner:
+            return 0
+        if "DEL" in script:
+            del self.strings[key]
+        return 1
+
+
+def test_stream_consumer_names_survive_restarts(monkeypatch):
+    redis_client = SlotRedis()
+    monkeypatch.setattr(tasks_module.socket, "gethostname", lambda: "host-a")
+
+    def worker():
+        task = DisasterPollingTask()
+        task.leader = LeaderLease(None, "disaster_poller:leader", 6.0)
+        return task
+
+    async def run():
+        first, second = worker(), worker()
+        names = [
+            await first._acquire_consumer_name(redis_client),
+            await second._acquire_consumer_name(redis_client)
+        ]
+        # 첫 워커가 재시작 → 반납한 슬롯을 새 프로세스가 그대로 이어받음
+        await first.consumer_slot.stop()
+        restarted = worker()
+        names.append(await restarted._acquire_consumer_name(redis_client))
+        for task in (second, restarted):
+            await task.consumer_slot.stop()
+        return names
+
+    assert asyncio.run(run()) == ["host-a:0", "host-a:1", "host-a:0"]
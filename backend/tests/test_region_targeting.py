@@ -0,0 +1,231 @@
+"""
+재난 수신 지역 기반 알림 대상 선별 테스트
+"""
+import sys
+import os
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.external.google_maps import admin_region_from_geocode
+from app.models.user import User
+from app.services import region_targeting
+from app.services.region_parser import RegionParser
+from app.services.region_targeting import (
+    find_target_users,
+    lookup_admin_region,
+    normalize_region,
+    parse_receiving_area,
+    region_ancestors
+)
+
+# PostGIS가 설치된 테스트 DB (없으면 DB 테스트 생략)
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def test_normalize_region_aliases():
+    assert normalize_region("서울시 영등포구") == "서울특별시 영등포구"
+    assert normalize_region("경기 안산시 단원구") == "경기도 안산시 단원구"
+    assert normalize_region("제주도 (전체)") == "제주특별자치도"
+    # 수신 지역과 같은 파서를 쓰므로 시군구 약칭도 같은 경로가 됨
+    assert normalize_region("경기 안산 단원구") == "경기도 안산시 단원구"
+    assert normalize_region("경기도 안산시 단원구 원곡동") == "경기도 안산시 단원구"
+    assert normalize_region("영등포구") == "서울특별시 영등포구"
+    assert normalize_region("중구") is None
+    assert normalize_region(None) is None
+
+
+def test_parse_receiving_area_carries_parent_regions():
+    assert parse_receiving_area("경기도 안산시 단원구, 상록구") == {
+        "경기도 안산시 단원구",
+        "경기도 안산시 상록구"
+    }
+    assert parse_receiving_area("서울특별시 영등포구, 구로구, 부산 해운대구") == {
+        "서울특별시 영등포구",
+        "서울특별시 구로구",
+        "부산광역시 해운대구"
+    }
+    assert parse_receiving_area("경기도 안산시, 시흥시") == {"경기도 안산시", "경기도 시흥시"}
+    assert parse_receiving_area("경상북도 전체") == {"경상북도"}
+    assert parse_receiving_area("전국") is None
+    assert parse_receiving_area("알 수 없음") == set()
+
+
+def test_region_ancestors():
+    assert region_ancestors("경기도 안산시 단원구") == ["경기도", "경기도 안산시", "경기도 안산시 단원구"]
+
+
+def test_admin_region_keeps_region_path_in_sync():
+    user = User(admin_region="서울시 영등포구")
+    assert user.region_path == "서울특별시 영등포구"
+    user.admin_region = None
+    assert user.region_path is None
+
+
+def test_region_parser_handles_abbreviations_and_ambiguous_names():
+    parse = RegionParser().parse
+    assert parse("서울 영등포구·구로구") == {"서울특별시 영등포구", "서울특별시 구로구"}
+    assert parse("경기안산시 단원구 원곡동") == {"경기도 안산시 단원구"}
+    assert parse("경기도 광주시, 광주 북구") == {"경기도 광주시", "광주광역시 북구"}
+    assert parse("강원도 고성군, 경남 고성군") == {"강원특별자치도 고성군", "경상남도 고성군"}
+    assert parse("안산, 시흥시") == {"경기도 안산시", "경기도 시흥시"}
+    # 광역시도 없이 여러 곳에 있는 이름은 버림
+    assert parse("중구") == set()
+    assert parse("[전국] 전체") is None
+
+
+def test_region_parser_handles_province_glued_to_city():
+    parse = RegionParser().parse
+    assert parse("경기안산시, 시흥시") == {"경기도 안산시", "경기도 시흥시"}
+    assert parse("서울중구, 종로구") == {"서울특별시 중구", "서울특별시 종로구"}
+    assert parse("충남당진시") == {"충청남도 당진시"}
+    assert parse("경북포항시 북구") == {"경상북도 포항시 북구"}
+
+
+def test_region_parser_rejects_area_with_unparsed_segment():
+    parse = RegionParser().parse
+    # 일부 항목만 알림 대상으로 삼지 않도록 전체를 해석 불가로 처리 (호출자는 전체 발송)
+    assert parse("경기도 안산시, 없는시") == set()
+    assert parse("서울특별시 영등포구, 중구") == {"서울특별시 영등포구", "서울특별시 중구"}
+    assert parse("부산 해운대구, 중구, 고성군") == set()
+    assert parse("경기도 안산시, ") == {"경기도 안산시"}
+
+
+def test_admin_region_from_geocode():
+    data = {
+        "status": "OK",
+        "results": [{
+            "address_components": [
+                {"long_name": "고잔동", "types": ["sublocality_level_2", "sublocality", "political"]},
+                {"long_name": "단원구", "types": ["sublocality_level_1", "sublocality", "political"]},
+                {"long_name": "안산시", "types": ["locality", "political"]},
+                {"long_name": "경기도", "types": ["administrative_area_level_1", "political"]},
+                {"long_name": "대한민국", "types": ["country", "political"]}
+            ]
+        }]
+    }
+    assert admin_region_from_geocode(data) == "경기도 안산시 단원구"
+    assert admin_region_from_geocode({"status": "ZERO_RESULTS", "results": []}) is None
+
+
+def test_lookup_admin_region_reuses_cell_and_skips_failures(monkeypatch):
+    calls = []
+
+    async def geocode(latitude, longitude):
+        calls.append((latitude, longitude))
+        return None if latitude < 0 else "경기도 안산시 단원구"
+
+    monkeypatch.setattr(region_targeting, "get_admin_region_from_coordinates", geocode)
+    monkeypatch.setattr(region_targeting, "_admin_region_cache", type(region_targeting._admin_region_cache)())
+
+    async def run():
+        return [
+            await lookup_admin_region(37.3180, 126.8300),
+            await lookup_admin_region(37.3181, 126.8301),  # 같은 셀
+            await lookup_admin_region(-1.0, 126.8300),
+            await lookup_admin_region(-1.0, 126.8300)  # 실패는 캐시하지 않음
+        ]
+
+    assert asyncio.run(run()) == ["경기도 안산시 단원구", "경기도 안산시 단원구", None, None]
+    assert len(calls) == 3
+
+
+class StatementSession:
+    """실행된 쿼리만 기록하는 세션"""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return []
+
+
+def _where_sql(regions, disaster_area=None) -> str:
+    session = StatementSession()
+    asyncio.run(find_target_users(session, regions, disaster_area=disaster_area))
+    return str(session.statements[0].compile(dialect=postgresql.dialect())).split("WHERE", 1)[1]
+
+
+def test_find_target_users_keeps_users_without_region():
+    sql = _where_sql({"경기도 안산시 단원구"})
+    assert "users.region_path IN" in sql
+    assert "users.region_path IS NULL" in sql
+
+    sql = _where_sql({"경기도 안산시 단원구"}, disaster_area=func.ST_GeogFromText("POLYGON EMPTY"))
+    assert "users.region_path IS NULL AND ST_Covers(" in sql
+
+    assert "region_path" not in _where_sql(None)
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL(PostGIS) 필요")
+def test_find_target_users_against_postgis():
+    now = datetime.utcnow()
+    ansan = "SRID=4326;POINT(126.83 37.318)"
+    seoul = "SRID=4326;POINT(126.9 37.52)"
+    ansan_area = func.ST_GeogFromText(
+        "SRID=4326;POLYGON((126.7 37.2, 126.95 37.2, 126.95 37.4, 126.7 37.4, 126.7 37.2))"
+    )
+
+    def user(device_id, admin_region=None, location=ansan, last_update=now, is_active=True):
+        return User(
+            device_id=device_id,
+            admin_region=admin_region,
+            location=location,
+            last_location_update=last_update,
+            is_active=is_active
+        )
+
+    async def run():
+        engine = create_async_engine(TEST_DATABASE_URL)
+        try:
+            async with engine.connect() as conn:
+                transaction = await conn.begin()
+                try:
+                    await conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+                    await conn.execute(text("CREATE SCHEMA region_targeting_test"))
+                    await conn.execute(text("SET LOCAL search_path TO region_targeting_test, public"))
+                    await conn.run_sync(lambda sync_conn: User.__table__.create(sync_conn))
+
+                    session = AsyncSession(bind=conn)
+                    session.add_all([
+                        user("danwon", "경기 안산시 단원구"),
+                        user("gyeonggi", "경기도"),
+                        user("wongok", "경기도 안산시 단원구 원곡동"),
+                        user("seoul", "서울시 영등포구", location=seoul),
+                        user("unknown_ansan"),
+                        user("unknown_seoul", location=seoul),
+                        user("stale", "경기도 안산시 단원구", last_update=now - timedelta(hours=2)),
+                        user("inactive", "경기도 안산시 단원구", is_active=False),
+                        user("no_location", "경기도 안산시 단원구", location=None)
+                    ])
+                    await session.flush()
+
+                    regions = {"경기도 안산시 단원구"}
+                    by_region = await find_target_users(session, regions)
+                    by_area = await find_target_users(session, regions, disaster_area=ansan_area)
+                    return (
+                        {target.device_id for target in by_region},
+                        {target.device_id for target in by_area}
+                    )
+                finally:
+                    await transaction.rollback()
+        finally:
+            await engine.dispose()
+
+    by_region, by_area = asyncio.run(run())
+    assert by_region == {"danwon", "gyeonggi", "wongok", "unknown_ansan", "unknown_seoul"}
+    assert by_area == {"danwon", "gyeonggi", "wongok", "unknown_ansan"}
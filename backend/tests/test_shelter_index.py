@@ -0,0 +1,354 @@
+"""
+대피소 공간 인덱스 테스트
+"""
+import random
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pytest
+
+from app.geo import haversine_km
+from app.services.shelter_index import IndexedShelter, ShelterSpatialIndex
+from app.services.shelter_batch import batch_nearest
+from app.services.shelter_assignment import assign_with_capacity
+from app.services.shelter_cursor import ShelterCursor
+from app.models.shelter import shelter_category_of
+
+
+def _make_shelters(count: int = 500, seed: int = 7):
+    """안산시 주변에 무작위 대피소 생성"""
+    rng = random.Random(seed)
+    types = ["민방위대피소", "지진대피소", "해일대피소", "기타대피소"]
+    return [
+        IndexedShelter(
+            id=f"shelter-{i}",
+            name=f"대피소 {i}",
+            address="경기도 안산시",
+            shelter_type=types[i % len(types)],
+            latitude=37.30 + rng.uniform(-0.2, 0.2),
+            longitude=126.84 + rng.uniform(-0.2, 0.2)
+        )
+        for i in range(count)
+    ]
+
+
+def _brute_force(shelters, lat, lng, radius_km, predicate=None):
+    matches = [
+        (s, haversine_km(lat, lng, s.latitude, s.longitude))
+        for s in shelters
+        if predicate is None or predicate(s)
+    ]
+    matches = [m for m in matches if m[1] <= radius_km]
+    matches.sort(key=lambda m: (m[1], m[0].id))
+    return matches
+
+
+def test_query_radius_matches_brute_force():
+    shelters = _make_shelters()
+    index = ShelterSpatialIndex(cell_size_deg=0.02)
+    index.build(shelters)
+
+    for lat, lng, radius in [(37.30, 126.84, 2.0), (37.35, 126.80, 5.0), (37.25, 126.90, 0.5)]:
+        expected = _brute_force(shelters, lat, lng, radius)
+        actual = index.query_radius(lat, lng, radius)
+        assert [s.id for s, _ in actual] == [s.id for s, _ in expected]
+
+
+def test_nearest_returns_exact_knn_with_predicate():
+    shelters = _make_shelters()
+    index = ShelterSpatialIndex(cell_size_deg=0.01)
+    index.build(shelters)
+
+    def is_tsunami(shelter):
+        return shelter.shelter_type == "해일대피소"
+
+    expected = _brute_force(shelters, 37.31, 126.83, 1000.0, predicate=is_tsunami)[:7]
+    actual = index.nearest(37.31, 126.83, k=7, predicate=is_tsunami)
+    assert [s.id for s, _ in actual] == [s.id for s, _ in expected]
+
+
+def test_nearest_returns_all_when_fewer_than_k():
+    shelters = _make_shelters(count=5)
+    index = ShelterSpatialIndex()
+    index.build(shelters)
+
+    assert len(index.nearest(37.30, 126.84, k=50)) == 5
+    assert index.nearest(37.30, 126.84, k=3, max_radius_km=0.0001) == []
+
+
+def test_batch_nearest_matches_index():
+    shelters = _make_shelters()
+    index = ShelterSpatialIndex()
+    index.build(shelters)
+
+    rng = random.Random(11)
+    points = [(37.30 + rng.uniform(-0.2, 0.2), 126.84 + rng.uniform(-0.2, 0.2)) for _ in range(200)]
+    indices, distances = batch_nearest(
+        np.array([p[0] for p in points]),
+        np.array([p[1] for p in points]),
+        np.array([s.latitude for s in shelters]),
+        np.array([s.longitude for s in shelters]),
+        k=3,
+        radius_km=2.0,
+        chunk_size=16
+    )
+
+    for row, (lat, lng) in enumerate(points):
+        expected = [s.id for s, _ in index.query_radius(lat, lng, 2.0, limit=3)]
+        actual = [shelters[i].id for i in indices[row] if i >= 0]
+        assert actual == expected
+
+
+def test_nearest_keyset_pages_cover_full_ordering():
+    shelters = _make_shelters()
+    index = ShelterSpatialIndex(cell_size_deg=0.01)
+    index.build(shelters)
+
+    def is_civil_defense(shelter):
+        return shelter.shelter_type == "민방위대피소"
+
+    expected = _brute_force(shelters, 37.28, 126.86, 1000.0, predicate=is_civil_defense)
+
+    paged, after = [], None
+    while True:
+        page = index.nearest(37.28, 126.86, k=9, predicate=is_civil_defense, after=after)
+        if not page:
+            break
+        paged.extend(page)
+        after = (page[-1][1], page[-1][0].id)
+
+    assert [s.id for s, _ in paged] == [s.id for s, _ in expected]
+
+
+def test_shelter_cursor_round_trip():
+    cursor = ShelterCursor(
+        latitude=37.295692,
+        longitude=126.841425,
+        shelter_type="민방위대피소",
+        distance_km=1.2345678901234567,
+        shelter_id="1f0e3c1a-7d1b-4c55-9a0e-3f1c2b4d5e6f"
+    )
+    assert ShelterCursor.decode(cursor.encode()) == cursor
+
+    with pytest.raises(ValueError):
+        ShelterCursor.decode("not-a-cursor")
+
+
+def test_shelter_category_of():
+    assert shelter_category_of(" 민방위대피소 ") == "민방위"
+    assert shelter_category_of("지진대피소") == "지진"
+    assert shelter_category_of("해일대피소") == "해일"
+    assert shelter_category_of("기타대피소") == "기타"
+    assert shelter_category_of("지진옥외대피소") is None
+    assert shelter_category_of(None) is None
+
+
+def test_assign_with_capacity_respects_capacity():
+    # 사용자 4명 모두 대피소 0이 가장 가깝지만 수용 인원은 2명
+    indices = np.array([[0, 1], [0, 1], [0, 1], [0, 1]])
+    distances = np.array([[0.1, 0.5], [0.2, 0.3], [0.3, 0.9], [0.4, 0.6]])
+    assigned, overflowed = assign_with_capacity(indices, distances, np.array([2.0, 1.0]))
+
+    # 거리 순 탐욕 배정: (u0,s0) (u1,s0) → s0 가득, (u1,s1)은 이미 배정, (u3,s1)
+    assert assigned.tolist() == [0, 0, 0, 1]
+    assert overflowed.tolist() == [False, False, True, False]
+
+    unlimited, _ = assign_with_capacity(indices, distances, np.array([np.inf, np.inf]))
+    assert unlimited.tolist() == [0, 0, 0, 0]
+
+
+def test_apply_changes_matches_rebuild():
+    shelters = _make_shelters()
+    index = ShelterSpatialIndex(cell_size_deg=0.02)
+    index.build(shelters)
+    before = index.version
+
+    moved = IndexedShelter(**{**shelters[0].__dict__, "latitude": 37.45, "longitude": 126.95})
+    added = IndexedShelter(
+        id="shelter-new", name="신규", address="경기도 안산시", shelter_type="지진대피소",
+        latitude=37.31, longitude=126.85
+    )
+    deleted = {shelters[1].id, shelters[2].id}
+
+    assert index.apply_changes([moved, added], deleted) == before + 1
+
+    expected = [moved, added] + [s for s in shelters[3:]]
+    rebuilt = ShelterSpatialIndex(cell_size_deg=0.02)
+    rebuilt.build(expected)
+
+    assert index.size == len(expected)
+    for lat, lng in [(37.30, 126.84), (37.45, 126.95), (37.31, 126.85)]:
+        assert [s.id for s, _ in index.query_radius(lat, lng, 3.0)] == \
+            [s.id for s, _ in rebuilt.query_radius(lat, lng, 3.0)]
+
+
+def test_batch_candidate_box_covers_extreme_longitude_at_other_latitude():
+    import asyncio
+    from app.services.shelter_finder import ShelterFinder
+
+    class CapturingSession:
+        info = {}
+
+        async def execute(self, statement, params):
+            self.params = params
+
+            class Result:
+                def fetchall(self):
+                    return []
+            return Result()
+
+    db = CapturingSession()
+    finder = ShelterFinder(db, index=ShelterSpatialIndex())
+    # 북쪽 사용자가 가장 서쪽, 남쪽 사용자가 가장 동쪽
+    points = [(38.0, 126.5), (34.0, 129.0)]
+    asyncio.run(finder._load_batch_candidates(points, radius_km=2.0))
+
+    # 북쪽 사용자 정서쪽 1.99km 지점이 사각형 안에 있어야 함
+    lng = 126.5 - 0.0001
+    while haversine_km(38.0, 126.5, 38.0, lng) < 1.99:
+        lng -= 0.0001
+    assert db.params["min_lng"] <= lng
+    assert db.params["min_lat"] < 34.0 < 38.0 < db.params["max_lat"]
+
+
+def test_listener_applies_changes_arriving_mid_flush_and_retries_failures():
+    import asyncio
+    from app.services.shelter_listener import ShelterChangeListener
+
+    listener = ShelterChangeListener(index=ShelterSpatialIndex())
+    listener.debounce_seconds = 0
+    listener.retry_seconds = 0
+    applied = []
+
+    async def apply(ids, full_reload, changes):
+        # 첫 반영 중 새 알림 도착 + DB 오류
+        if not applied:
+            applied.append(None)
+            listener._on_notify(None, 0, "shelter_changes", '{"op": "UPDATE", "id": "b"}')
+            raise RuntimeError("db down")
+        applied.append(set(ids))
+
+    listener._apply = apply
+
+    async def run():
+        listener._on_notify(None, 0, "shelter_changes", '{"op": "INSERT", "id": "a"}')
+        await asyncio.wait_for(listener._flush_task, timeout=30)
+
+    asyncio.run(run())
+    assert applied[1:] == [{"a", "b"}]
+    assert not listener._pending_ids and not listener._full_reload
+
+
+def test_shelter_page_query_grows_radius_instead_of_scanning_type():
+    import asyncio
+    import dataclasses
+    import uuid
+    from types import SimpleNamespace
+    from app.services.shelter_finder import ShelterFinder
+
+    # 사용자로부터 0.5km, 1km, ... 10km 떨어진 대피소 20곳
+    shelters = [
+        SimpleNamespace(
+            id=uuid.UUID(int=n), name=f"대피소{n}", address="주소", shelter_type="민방위대피소",
+            latitude=37.3, longitude=126.8, capacity=100, distance_km=0.5 * n
+        )
+        for n in range(1, 21)
+    ]
+
+    class RadiusSession:
+        info = {}
+
+        def __init__(self):
+            self.radii = []
+
+        async def execute(self, statement, params):
+            self.radii.append(params.get("radius_km"))
+            after = (params["after_distance"], uuid.UUID(params["after_id"])) if "after_distance" in params else None
+            rows = [
+                s for s in shelters
+                if ("radius_km" not in params or s.distance_km <= params["radius_km"])
+                and (after is None or (s.distance_km, s.id) > after)
+            ][:params["limit"]]
+
+            class Result:
+                def fetchall(self):
+                    return rows
+            return Result()
+
+    db = RadiusSession()
+    finder = ShelterFinder(db, index=ShelterSpatialIndex())
+
+    page, cursor = asyncio.run(finder.get_shelters_by_type_and_location("민방위대피소", 37.3, 126.8, limit=3))
+    assert [s.distance_km for s in page] == [0.5, 1.0, 1.5]
+    assert db.radii == [2.0]
+
+    # 깊은 페이지도 커서 거리 근처만 조회하고, 모자라면 반경을 넓힘
+    db.radii.clear()
+    cursor = dataclasses.replace(cursor, distance_km=8.0, shelter_id=str(uuid.UUID(int=16)))
+    page, _ = asyncio.run(finder.get_shelters_by_type_and_location("민방위대피소", 37.3, 126.8, limit=3, cursor=cursor))
+    assert [s.distance_km for s in page] == [8.5, 9.0, 9.5]
+    assert db.radii == [10.0]
+
+    db.radii.clear()
+    cursor = dataclasses.replace(cursor, distance_km=9.0, shelter_id=str(uuid.UUID(int=18)))
+    page, next_cursor = asyncio.run(finder.get_shelters_by_type_and_location("민방위대피소", 37.3, 126.8, limit=3, cursor=cursor))
+    assert [s.distance_km for s in page] == [9.5, 10.0]
+    assert next_cursor is None
+    assert db.radii == [11.0, 17.0, 41.0, 137.0, 521.0, None]
+
+
+def test_cache_cells_affected_by_a_shelter_change():
+    from app.services.shelter_cache import shelter_cache
+
+    geohashes = shelter_cache.cells_affected_by([(37.3, 126.8)])
+    rng = random.Random(3)
+    for _ in range(200):
+        # 변경 지점에서 50km 안의 셀은 모두 무효화 대상
+        lat = 37.3 + rng.uniform(-0.44, 0.44)
+        lng = 126.8 + rng.uniform(-0.55, 0.55)
+        if haversine_km(37.3, 126.8, lat, lng) <= 50.0:
+            assert shelter_cache.cell_of(lat, lng).geohash in geohashes
+    # 멀리 떨어진 셀은 그대로
+    assert shelter_cache.cell_of(35.1, 129.0).geohash not in geohashes
+
+
+def test_listener_invalidates_each_change_from_one_worker_only(monkeypatch):
+    import asyncio
+    from app.services import shelter_listener
+    from app.services.shelter_listener import ShelterChangeListener
+
+    claims = set()
+    invalidated = []
+
+    async def claim_changes(keys):
+        won = [key for key in keys if key not in claims]
+        claims.update(keys)
+        return won
+
+    async def invalidate_cells(geohashes):
+        invalidated.append(len(geohashes))
+
+    async def invalidate():
+        invalidated.append("all")
+
+    monkeypatch.setattr(shelter_listener.shelter_cache, "claim_changes", claim_changes)
+    monkeypatch.setattr(shelter_listener.shelter_cache, "invalidate_cells", invalidate_cells)
+    monkeypatch.setattr(shelter_listener.shelter_cache, "invalidate", invalidate)
+
+    payload = '{"op": "UPDATE", "id": "a", "txid": 42, "points": [[37.3, 126.8], [37.31, 126.81]]}'
+    workers = [ShelterChangeListener(index=ShelterSpatialIndex()) for _ in range(3)]
+
+    async def run():
+        for worker in workers:
+            worker._on_notify(None, 0, "shelter_changes", payload)
+            worker._flush_task.cancel()
+            await worker._invalidate_cache(worker._pending_changes)
+
+    asyncio.run(run())
+    # 워커 3개가 모두 알림을 받아도 주변 셀 무효화는 한 번
+    assert len(invalidated) == 1
+    assert isinstance(invalidated[0], int) and invalidated[0] > 0
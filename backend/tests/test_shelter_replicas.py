@@ -0,0 +1,81 @@
+"""
+대피소 DB 읽기 복제본 장애 전환 테스트
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.db import session as db_session
+from app.db.session import ShelterReplicaPool, execute_shelter_read
+
+
+class FakeSession:
+    def __init__(self, name, calls, fail=False):
+        self.name = name
+        self.calls = calls
+        self.fail = fail
+        self.info = {}
+
+    async def execute(self, statement, params=None):
+        self.calls.append(self.name)
+        if self.fail:
+            raise OperationalError("SELECT", {}, ConnectionRefusedError("replica down"))
+        return self.name
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _pool(calls, monkeypatch, second_fails=False):
+    pool = ShelterReplicaPool([])
+    pool.replicas = [
+        SimpleNamespace(name="replica-1", healthy=True, last_error=None,
+                        session_factory=lambda: FakeSession("replica-1", calls, fail=True)),
+        SimpleNamespace(name="replica-2", healthy=True, last_error=None,
+                        session_factory=lambda: FakeSession("replica-2", calls, fail=second_fails)),
+    ]
+    monkeypatch.setattr(db_session, "shelter_replicas", pool)
+    return pool
+
+
+def test_connection_error_marks_replica_and_retries_on_another(monkeypatch):
+    calls = []
+    pool = _pool(calls, monkeypatch)
+    replica, factory = pool.acquire()
+    session = factory()
+    session.info["shelter_replica"] = replica
+
+    async def run():
+        first = await execute_shelter_read(session, "SELECT 1")
+        # 같은 요청의 다음 쿼리는 죽은 복제본을 건너뜀
+        second = await execute_shelter_read(session, "SELECT 1")
+        return first, second
+
+    assert asyncio.run(run()) == ("replica-2", "replica-2")
+    assert calls == ["replica-1", "replica-2", "replica-2"]
+    assert not pool.replicas[0].healthy
+    assert pool.replicas[1].healthy
+
+
+def test_retry_failure_propagates_and_marks_both(monkeypatch):
+    calls = []
+    pool = _pool(calls, monkeypatch, second_fails=True)
+    replica, factory = pool.acquire()
+    session = factory()
+    session.info["shelter_replica"] = replica
+
+    with pytest.raises(OperationalError):
+        asyncio.run(execute_shelter_read(session, "SELECT 1"))
+    assert calls == ["replica-1", "replica-2"]
+    assert not any(r.healthy for r in pool.replicas)
@@ -0,0 +1,86 @@
+"""
+오프라인 대피소 스냅샷 테스트
+"""
+import random
+import sys
+import os
+import uuid
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from app.services.shelter_index import IndexedShelter
+from app.services.shelter_snapshot import ShelterSnapshotStore, build_snapshot, decode_shard, encode_shard
+
+
+def _make_shelters(count: int = 300, seed: int = 5):
+    rng = random.Random(seed)
+    categories = ["민방위", "지진", "해일", "기타", None]
+    return [
+        IndexedShelter(
+            id=str(uuid.UUID(int=rng.getrandbits(128))),
+            name=f"대피소 {i}",
+            address=f"경기도 안산시 단원구 {i}번길",
+            shelter_type=f"{categories[i % 5] or '공공시설'}대피소",
+            latitude=round(37.0 + rng.uniform(-0.8, 0.8), 6),
+            longitude=round(126.8 + rng.uniform(-0.8, 0.8), 6),
+            capacity=rng.choice([None, 100, 5000]),
+            shelter_category=categories[i % 5]
+        )
+        for i in range(count)
+    ]
+
+
+def test_shard_round_trip_is_order_independent():
+    shelters = _make_shelters()
+    payload = encode_shard(shelters)
+
+    assert encode_shard(list(reversed(shelters))) == payload
+    assert sorted(decode_shard(payload), key=lambda s: s.id) == sorted(shelters, key=lambda s: s.id)
+
+
+def test_oversized_hangul_field_truncated_on_character_boundary():
+    import dataclasses
+    # 1 + 한글 3바이트 x 21846 = 65539바이트 → 65535에서 자르면 마지막 한글 중간
+    shelter = dataclasses.replace(_make_shelters(1)[0], address="A" + "가" * 21846)
+    decoded = decode_shard(encode_shard([shelter]))[0]
+    assert decoded.address == "A" + "가" * 21844
+    assert decoded.name == shelter.name
+
+
+def test_build_snapshot_partitions_all_shelters():
+    shelters = _make_shelters()
+    manifest, payloads = build_snapshot(shelters, tile_deg=0.5)
+
+    assert set(payloads) == set(manifest["shards"])
+    assert sum(meta["count"] for meta in manifest["shards"].values()) == len(shelters)
+
+    for shard_id, meta in manifest["shards"].items():
+        min_lat, max_lat, min_lng, max_lng = meta["bounds"]
+        for shelter in decode_shard(payloads[shard_id]):
+            assert min_lat <= shelter.latitude < max_lat
+            assert min_lng <= shelter.longitude < max_lng
+
+
+def test_store_only_changes_etag_of_modified_shard(tmp_path):
+    shelters = _make_shelters()
+    store = ShelterSnapshotStore(directory=str(tmp_path), tile_deg=0.5)
+
+    before = store._write(shelters)
+    moved = shelters[0]
+    changed = [IndexedShelter(**{**moved.__dict__, "name": "이름 변경"})] + shelters[1:]
+    after = store._write(changed)
+
+    assert after["version"] != before["version"]
+    changed_shards = [
+        shard_id for shard_id in before["shards"]
+        if before["shards"][shard_id]["etag"] != after["shards"][shard_id]["etag"]
+    ]
+    assert len(changed_shards) == 1
+
+    payload, etag = store.read_shard(changed_shards[0])
+    assert etag == after["shards"][changed_shards[0]]["etag"]
+    assert any(s.name == "이름 변경" for s in decode_shard(payload))
+    assert store.read_shard("../manifest") is None
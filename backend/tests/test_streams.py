@@ -0,0 +1,127 @@
+"""
+Redis Streams 컨슈머 테스트 (ack / 재처리 / dead letter)
+"""
+import sys
+import os
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+
+from app.background.streams import StreamConsumer, StreamConsumerOptions
+
+
+class InMemoryStreamQueue:
+    """컨슈머 그룹 하나의 PEL 동작만 흉내 낸 큐"""
+
+    stream = "test:stream"
+
+    def __init__(self, entries):
+        self.new = list(entries)
+        self.pending = {}  # entry_id -> (fields, 전달 횟수)
+        self.acked = []
+        self.dead = []
+
+    async def read_pending(self, consumer, after_id, count):
+        after = int(after_id.split("-")[0])
+        batch = [
+            (entry_id, fields) for entry_id, (fields, _) in self.pending.items()
+            if int(entry_id.split("-")[0]) > after
+        ][:count]
+        for entry_id, _ in batch:
+            fields, deliveries = self.pending[entry_id]
+            self.pending[entry_id] = (fields, deliveries + 1)
+        return batch
+
+    async def claim_stale(self, consumer, min_idle_ms, count):
+        claimed = list(self.pending.items())[:count]
+        for entry_id, (fields, deliveries) in claimed:
+            self.pending[entry_id] = (fields, deliveries + 1)
+        return [(entry_id, fields) for entry_id, (fields, _) in claimed]
+
+    async def read_new(self, consumer, count, block_ms):
+        batch, self.new = self.new[:count], self.new[count:]
+        for entry_id, fields in batch:
+            self.pending[entry_id] = (fields, 1)
+        return batch
+
+    async def delivery_count(self, entry_id):
+        return self.pending[entry_id][1]
+
+    async def ack(self, entry_ids):
+        for entry_id in entry_ids:
+            self.pending.pop(entry_id, None)
+            self.acked.append(entry_id)
+
+    async def dead_letter(self, entry):
+        self.dead.append(entry[0])
+        await self.ack([entry[0]])
+
+
+def test_consumer_acks_only_finished_entries_and_retries_failures():
+    queue = InMemoryStreamQueue([("1-0", {"n": "1"}), ("2-0", {"n": "2"}), ("3-0", {"n": "3"})])
+    attempts = {}
+
+    async def handler(fields):
+        attempts[fields["n"]] = attempts.get(fields["n"], 0) + 1
+        # 2번 작업은 첫 시도에서 실패 (처리 중 중단된 상황)
+        if fields["n"] == "2" and attempts["2"] == 1:
+            raise RuntimeError("crashed mid fan-out")
+
+    consumer = StreamConsumer(queue, "worker-1", handler, StreamConsumerOptions(claim_idle_seconds=0))
+
+    async def run():
+        await consumer.step()
+        assert queue.acked == ["1-0", "3-0"]
+        assert list(queue.pending) == ["2-0"]
+
+        # 다른 컨슈머(또는 재시작 후)가 넘겨받아 이어서 처리
+        await consumer.step()
+
+    asyncio.run(run())
+    assert queue.acked == ["1-0", "3-0", "2-0"]
+    assert queue.pending == {}
+    assert consumer.status() == {
+        "consumer": "worker-1", "processed": 3, "failed": 1, "reclaimed": 1, "recovered": 0
+    }
+
+
+def test_consumer_dead_letters_poison_entries():
+    queue = InMemoryStreamQueue([("1-0", {"n": "1"})])
+
+    async def handler(fields):
+        raise ValueError("malformed entry")
+
+    consumer = StreamConsumer(queue, "worker-1", handler, StreamConsumerOptions(max_deliveries=3))
+
+    async def run():
+        for _ in range(4):
+            await consumer.step()
+
+    asyncio.run(run())
+    assert consumer.failed == 3
+    assert queue.dead == ["1-0"]
+    assert queue.pending == {}
+
+
+def test_restarted_consumer_finishes_its_own_pending_entries_first():
+    queue = InMemoryStreamQueue([("3-0", {"n": "3"})])
+    # 이전 실행이 같은 이름으로 받아 두고 ack하지 못한 작업 (1-0은 스트림에서 잘림)
+    queue.pending = {"1-0": ({}, 1), "2-0": ({"n": "2"}, 1)}
+    handled = []
+
+    async def handler(fields):
+        handled.append(fields["n"])
+
+    # 넘겨받기 대기 시간이 길어도 자기 pending 작업은 바로 다시 처리
+    consumer = StreamConsumer(queue, "host-a:0:notifier-0", handler, StreamConsumerOptions(batch_size=1))
+
+    async def run():
+        for _ in range(3):
+            await consumer.step()
+
+    asyncio.run(run())
+    assert handled == ["2", "3"]
+    assert queue.acked == ["1-0", "2-0", "3-0"]
+    assert consumer.recovered == 2